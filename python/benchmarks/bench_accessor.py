@@ -0,0 +1,181 @@
+"""
+Benchmarks for working with labeled frames: ``meta_search``, decoding and
+display through ``df.lab``, filtering and aggregating on labels, and the label bookkeeping
+added to ``DataFrame.__setitem__`` and ``DataFrame.rename``.
+
+Run with asv, or directly with ``python -m benchmarks.bench_accessor`` from the
+``python`` directory for a quick report.
+"""
+import warnings
+
+import pandas as pd
+
+from registream.autolabel import _original_rename, _original_setitem, meta_search
+
+from .common import COLS, ROWS, make_labeled_frame
+
+# meta_search scans labels, not rows: use many columns and few rows
+SEARCH_COLS = 20_000
+
+
+class MetaSearch:
+    """Searching the labels of a frame with SEARCH_COLS labeled columns."""
+
+    def setup(self):
+        self.df = make_labeled_frame(10, SEARCH_COLS)
+
+    def time_names_and_labels(self):
+        meta_search(self.df, r'var0001\d\d', return_df=True)
+
+    def time_include_values(self):
+        meta_search(self.df, 'Category 1[0-9]', include_values=True, return_df=True)
+
+
+class AccessorDecode:
+    """Displaying and decoding a ROWS x 20 frame through the accessor."""
+    timeout = 600
+
+    def setup(self):
+        self.df = make_labeled_frame(ROWS, 20)
+
+    def time_repr(self):
+        repr(self.df.lab)
+
+    def time_repr_html(self):
+        self.df.lab._repr_html_()
+
+    def time_head_show_values(self):
+        self.df.lab.show_values().head(100)
+
+    def time_decode_column(self):
+        self.df.lab.var000000
+
+    def peakmem_decode_column(self):
+        self.df.lab.var000000
+
+    def time_decode_columns(self):
+        self.df.lab[['var000000', 'var000001']]
+
+
+class LabelFilter:
+    """
+    Filtering a ROWS x 20 frame on value labels with ``df.lab.query`` and
+    ``df.lab.isin``, compared with the same filter on the codes and with
+    filtering the decoded column.
+    """
+    timeout = 600
+
+    def setup(self):
+        self.df = make_labeled_frame(ROWS, 20)
+
+    def time_query_labels(self):
+        self.df.lab.query('var000000 == "Category 3" and var000001 in ["Category 1", "Category 2"]')
+
+    def time_query_codes(self):
+        self.df.query('var000000 == 3 and var000001 in [1, 2]')
+
+    def time_isin_labels(self):
+        self.df.lab.isin('var000000', ['Category 1', 'Category 2'])
+
+    def time_isin_codes(self):
+        self.df['var000000'].isin([1, 2])
+
+    def time_filter_decoded(self):
+        self.df[self.df.lab.var000000.isin(['Category 1', 'Category 2'])]
+
+
+class LabelAggregation:
+    """
+    Labeled frequency tables, crosstabs and group aggregates of a ROWS x 20
+    frame, compared with aggregating the decoded columns.
+    """
+    timeout = 600
+
+    def setup(self):
+        self.df = make_labeled_frame(ROWS, 20)
+
+    def time_value_counts(self):
+        self.df.lab.value_counts('var000000')
+
+    def time_value_counts_decoded(self):
+        self.df.lab.var000000.value_counts()
+
+    def time_crosstab(self):
+        self.df.lab.crosstab('var000000', 'var000001')
+
+    def time_crosstab_decoded(self):
+        pd.crosstab(self.df.lab.var000000, self.df.lab.var000001)
+
+    def time_groupby_agg(self):
+        self.df.lab.groupby('var000000').agg({'var000002': 'mean'})
+
+    def time_groupby_agg_decoded(self):
+        self.df.groupby(self.df.lab.var000000).agg({'var000002': 'mean'})
+
+
+class LabelPropagation:
+    """
+    Overhead of the patched ``__setitem__`` and ``rename`` on a frame with COLS
+    labeled columns, compared with the original pandas methods.
+    """
+    params = [True, False]
+    param_names = ['labeled']
+
+    def setup(self, labeled):
+        # Calling the unpatched method directly trips pandas' chained assignment check
+        warnings.filterwarnings('ignore', message='A value is being set on a copy')
+        self.df = make_labeled_frame(100_000, COLS)
+        if not labeled:
+            self.df.attrs.clear()
+        self.source = self.df['var000000']
+        self.mapping = {col: f"{col}_renamed" for col in self.df.columns[:COLS // 2]}
+
+    def time_setitem(self, labeled):
+        self.df['copy'] = self.source
+
+    def time_setitem_unpatched(self, labeled):
+        _original_setitem(self.df, 'copy', self.source)
+
+    def time_rename(self, labeled):
+        self.df.rename(columns=self.mapping)
+
+    def time_rename_unpatched(self, labeled):
+        _original_rename(self.df, columns=self.mapping)
+
+
+if __name__ == '__main__':
+    import time
+
+    def report(name, func, *args):
+        start = time.perf_counter()
+        func(*args)
+        print(f"{name:<45} {time.perf_counter() - start:8.3f}s")
+
+    bench = MetaSearch()
+    bench.setup()
+    report("meta_search", bench.time_names_and_labels)
+    report("meta_search[include_values]", bench.time_include_values)
+
+    bench = AccessorDecode()
+    bench.setup()
+    for name in ('time_repr', 'time_repr_html', 'time_head_show_values', 'time_decode_column',
+                 'time_decode_columns'):
+        report(f"accessor {name[5:]} ({ROWS:,} rows)", getattr(bench, name))
+
+    bench = LabelFilter()
+    bench.setup()
+    for name in ('time_query_labels', 'time_query_codes', 'time_isin_labels', 'time_isin_codes',
+                 'time_filter_decoded'):
+        report(f"filter {name[5:]} ({ROWS:,} rows)", getattr(bench, name))
+
+    bench = LabelAggregation()
+    bench.setup()
+    for name in ('time_value_counts', 'time_value_counts_decoded', 'time_crosstab', 'time_crosstab_decoded',
+                 'time_groupby_agg', 'time_groupby_agg_decoded'):
+        report(f"aggregate {name[5:]} ({ROWS:,} rows)", getattr(bench, name))
+
+    bench = LabelPropagation()
+    for labeled in LabelPropagation.params:
+        bench.setup(labeled)
+        for name in ('time_setitem', 'time_setitem_unpatched', 'time_rename', 'time_rename_unpatched'):
+            report(f"{name[5:]}[labeled={labeled}]", getattr(bench, name), labeled)
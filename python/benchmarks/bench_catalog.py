@@ -0,0 +1,198 @@
+"""
+Benchmarks for reading the label catalogs: combining downloaded chunks,
+checking installed catalogs against ``datasets.csv``, ``autolabel`` for both
+label types, value label parsing and ``lookup``.
+
+Run with asv, or directly with ``python -m benchmarks.bench_catalog`` from the
+``python`` directory for a quick report.
+"""
+import contextlib
+import io
+import os
+import shutil
+
+import registream  # noqa: F401  (registers the DataFrame methods)
+from registream.autolabel import autolabel, safe_json_parse
+from registream.label_fetcher import LabelFetcher
+from registream.lookup import lookup, lookup_table
+
+from .common import (CATALOG_VARS, DOMAIN, LANG, make_labeled_frame, use_registream_dir,
+                     value_label_string, variable_names, write_catalog)
+
+
+def _combined_catalog():
+    """setup_cache helper: write combined catalog CSVs into the benchmark's temp dir."""
+    root = os.path.abspath('catalog')
+    write_catalog(root)
+    return root
+
+
+def _combined_catalogs():
+    """setup_cache helper: combined catalogs in the legacy and schema 1.0 layouts."""
+    roots = {}
+    for schema in ('0.5', '1.0'):
+        roots[schema] = os.path.abspath(f"catalog_{schema}")
+        write_catalog(roots[schema], schema=schema)
+    return roots
+
+
+class CombineCsvFiles:
+    """Merging the constituent CSV files of a freshly extracted download."""
+    number = 1
+    repeat = 5
+    timeout = 600
+    params = ['variables', 'values']
+    param_names = ['label_type']
+
+    def setup_cache(self):
+        root = os.path.abspath('chunks')
+        write_catalog(root, chunks=True)
+        return root
+
+    def setup(self, source, label_type):
+        # combine_csv_files removes the constituent folder, so work on a fresh copy
+        self.root = os.path.abspath('combine_run')
+        shutil.rmtree(self.root, ignore_errors=True)
+        shutil.copytree(source, self.root)
+        use_registream_dir(self.root)
+        self.fetcher = LabelFetcher(domain=DOMAIN, lang=LANG, label_type=label_type)
+
+    def teardown(self, source, label_type):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def time_combine_csv_files(self, source, label_type):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.fetcher.combine_csv_files()
+
+
+class StartupCheck:
+    """Checking an installed catalog against its datasets.csv entry, by fingerprint and by rehashing."""
+    params = ['variables', 'values']
+    param_names = ['label_type']
+
+    def setup_cache(self):
+        root = _combined_catalog()
+        use_registream_dir(root)
+        for label_type in self.params:
+            fetcher = LabelFetcher(domain=DOMAIN, lang=LANG, label_type=label_type)
+            fetcher.registry.record(fetcher.dataset_key, fetcher.csv_path, DOMAIN, label_type, LANG)
+        return root
+
+    def setup(self, root, label_type):
+        use_registream_dir(root)
+        self.fetcher = LabelFetcher(domain=DOMAIN, lang=LANG, label_type=label_type)
+
+    def time_ensure_labels(self, root, label_type):
+        self.fetcher.ensure_labels()
+
+    def time_verify_rehash(self, root, label_type):
+        # A new modification time forces the full check
+        os.utime(self.fetcher.csv_path)
+        self.fetcher.registry.verify(self.fetcher.dataset_key, self.fetcher.csv_path)
+
+
+class Autolabel:
+    """Labeling a frame against a catalog of CATALOG_VARS variables, in both catalog schemas."""
+    timeout = 600
+    params = (['variables', 'values'], [50, 2000], ['0.5', '1.0'])
+    param_names = ['label_type', 'columns', 'schema']
+
+    def setup_cache(self):
+        return _combined_catalogs()
+
+    def setup(self, roots, label_type, columns, schema):
+        use_registream_dir(roots[schema])
+        self.df = make_labeled_frame(100, min(columns, CATALOG_VARS))
+        self.df.attrs.clear()
+
+    def time_autolabel(self, roots, label_type, columns, schema):
+        autolabel(self.df, label_type=label_type, domain=DOMAIN, lang=LANG, verbose=False)
+
+    def peakmem_autolabel(self, roots, label_type, columns, schema):
+        autolabel(self.df, label_type=label_type, domain=DOMAIN, lang=LANG, verbose=False)
+
+
+class SafeJsonParse:
+    """Parsing one value label set, in the catalog's Python-dict and JSON styles."""
+    params = (['python', 'json'], [5, 200, 5000])
+    param_names = ['style', 'labels']
+
+    def setup(self, style, labels):
+        self.text = value_label_string(labels, style=style)
+
+    def time_safe_json_parse(self, style, labels):
+        safe_json_parse(self.text)
+
+
+class Lookup:
+    """Looking up variables in the catalog, as a table and as printed output."""
+    timeout = 600
+    params = [10, 1000, 10000]
+    param_names = ['variables']
+
+    def setup_cache(self):
+        return _combined_catalog()
+
+    def setup(self, root, variables):
+        use_registream_dir(root)
+        names = variable_names(CATALOG_VARS)
+        step = max(len(names) // variables, 1)
+        self.variables = names[::step][:variables] + ['not_in_catalog']
+        # Load the catalog once so the timings measure the lookup itself
+        lookup_table(self.variables[:1], domain=DOMAIN, lang=LANG)
+
+    def time_lookup_table(self, root, variables):
+        lookup_table(self.variables, domain=DOMAIN, lang=LANG)
+
+    def time_lookup(self, root, variables):
+        with contextlib.redirect_stdout(io.StringIO()):
+            lookup(self.variables, domain=DOMAIN, lang=LANG)
+
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+
+    def report(name, func, *args):
+        start = time.perf_counter()
+        func(*args)
+        print(f"{name:<45} {time.perf_counter() - start:8.3f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        bench = CombineCsvFiles()
+        source = bench.setup_cache()
+        for label_type in CombineCsvFiles.params:
+            bench.setup(source, label_type)
+            report(f"combine_csv_files[{label_type}]", bench.time_combine_csv_files, source, label_type)
+            bench.teardown(source, label_type)
+
+        root = _combined_catalog()
+        bench = StartupCheck()
+        bench.setup_cache()
+        for label_type in StartupCheck.params:
+            bench.setup(root, label_type)
+            report(f"ensure_labels[{label_type}]", bench.time_ensure_labels, root, label_type)
+            report(f"verify_rehash[{label_type}]", bench.time_verify_rehash, root, label_type)
+
+        roots = _combined_catalogs()
+        root = roots['0.5']
+        bench = Autolabel()
+        for label_type in Autolabel.params[0]:
+            for columns in Autolabel.params[1]:
+                for schema in Autolabel.params[2]:
+                    bench.setup(roots, label_type, columns, schema)
+                    report(f"autolabel[{label_type}, {columns} cols, schema {schema}]", bench.time_autolabel,
+                           roots, label_type, columns, schema)
+
+        bench = SafeJsonParse()
+        for style in SafeJsonParse.params[0]:
+            for labels in SafeJsonParse.params[1]:
+                bench.setup(style, labels)
+                report(f"safe_json_parse[{style}, {labels} labels]", bench.time_safe_json_parse, style, labels)
+
+        bench = Lookup()
+        for variables in Lookup.params:
+            bench.setup(root, variables)
+            report(f"lookup_table[{variables} vars]", bench.time_lookup_table, root, variables)
+            report(f"lookup[{variables} vars]", bench.time_lookup, root, variables)
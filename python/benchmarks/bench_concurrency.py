@@ -0,0 +1,261 @@
+"""
+Concurrency stress benchmarks: many threads labeling small frames at once, the
+way requests are handled by a threaded web service. Every request labels a
+frame of REQUEST_COLS catalog variables with ``autolabel`` (variables and
+values), on 1, 2, 4 and 8 threads.
+
+``ThreadedAutolabel`` measures throughput with the catalogs in memory, for
+requests that only label and for requests that also wait IO_WAIT seconds for
+I/O (reading the request, a database), which is where threads pay off while
+Python code holds the GIL.
+
+``ColdStart`` starts all threads at once on an empty cache and counts how
+often the catalogs are read: one read per catalog however many threads ask.
+Set REGISTREAM_BENCH_REQUESTS to change the number of requests (default 2,000).
+
+``check_threads`` checks the results instead of timing them: it raises
+AssertionError if threads starting together on an empty cache get other labels
+than one thread does, read a catalog more than once, or raise, including while
+another thread adds columns to a labeled frame they read.
+
+Run with asv, or directly with ``python -m benchmarks.bench_concurrency`` from
+the ``python`` directory for the check and a quick report.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import registream
+from registream.autolabel import autolabel
+
+from .common import CATALOG_VARS, use_registream_dir, variable_names, write_catalog
+
+REQUESTS = int(os.environ.get('REGISTREAM_BENCH_REQUESTS', 2_000))
+REQUEST_COLS = 20
+THREADS = [1, 2, 4, 8]
+IO_WAIT = 0.005
+CATALOGS = 2  # the English variables and values catalogs
+
+
+def _requests(n, seed=0):
+    """Column lists of n requests, drawn from the catalog variables."""
+    rng = np.random.default_rng(seed)
+    names = np.array(variable_names(CATALOG_VARS))
+    return [list(rng.choice(names, REQUEST_COLS, replace=False)) for _ in range(n)]
+
+
+def _labeled_frame(columns):
+    """A small frame of codes labeled with ``autolabel`` (variables and values)."""
+    df = pd.DataFrame({col: [1, 2, 3] for col in columns})
+    autolabel(df, 'variables', verbose=False)
+    autolabel(df, 'values', verbose=False)
+    return df
+
+
+def _label_request(columns, io_wait=0):
+    """Handle one request: label a small frame of codes and return its number of value-labeled columns."""
+    if io_wait:
+        time.sleep(io_wait)
+    return len(_labeled_frame(columns).get_value_labels())
+
+
+def _read_copied_labels(df):
+    """Read every label of a frame whose columns are copies of 'source' and check them."""
+    labels = df.attrs['registream_labels']
+    for col, label in labels['variable_labels'].items():
+        assert label == 'Source', f"{col}: variable label {label!r}"
+    for col, val_dict in labels['value_labels'].items():
+        assert val_dict == {1: 'One'}, f"{col}: value labels {val_dict!r}"
+
+
+def check_threads(root, threads=8, reads=200):
+    """
+    Label frames on several threads at once from an empty cache and check the results.
+
+    Until the requests are done, another thread keeps adding copies of a
+    column to a labeled frame, whose labels each request reads after it is
+    labeled.
+
+    Parameters:
+    -----------
+    root : str
+        Directory of the benchmark catalog
+    threads : int, default 8
+        Number of requests started together
+    reads : int, default 200
+        Number of times each request reads the labels of the shared frame
+
+    Returns:
+    --------
+    int
+        Number of catalog reads
+
+    Raises:
+    -------
+    AssertionError
+        If a thread raised, a request got other labels than the same request
+        run alone, or a catalog was read more than once
+    """
+    use_registream_dir(root)
+    registream.set_usage_logging(False)
+    requests = _requests(threads, seed=2)
+    shared = pd.DataFrame({'source': [1, 2, 3]})
+    shared.set_variable_labels({'source': 'Source'})
+    shared.set_value_labels('source', {1: 'One'})
+    barrier = threading.Barrier(threads + 1)
+    pending = threading.Semaphore(0)
+
+    def request(columns):
+        barrier.wait(timeout=60)
+        try:
+            df = _labeled_frame(columns)
+            for _ in range(reads):
+                _read_copied_labels(shared)
+            return df.get_variable_labels(), df.get_value_labels()
+        finally:
+            pending.release()
+
+    def copy_columns():
+        barrier.wait(timeout=60)
+        copies = done = 0
+        while done < threads:
+            shared[f'copy{copies}'] = shared['source']
+            copies += 1
+            done += pending.acquire(blocking=False)
+        return copies
+
+    registream.enable_stats()
+    registream.reset_stats()
+    try:
+        with ThreadPoolExecutor(threads + 1) as pool:
+            futures = [pool.submit(request, columns) for columns in requests]
+            futures.append(pool.submit(copy_columns))
+            errors = [f.exception() for f in futures if f.exception() is not None]
+        reads = registream.stats()['counters'].get('catalog.cache_misses', 0)
+    finally:
+        registream.enable_stats(False)
+
+    assert not errors, f"{len(errors)} of {threads + 1} threads raised, first: {errors[0]!r}"
+    assert reads == CATALOGS, f"{CATALOGS} catalogs read {reads} times"
+    _read_copied_labels(shared)
+    assert len(shared.get_variable_labels()) == futures[-1].result() + 1, "labels of copied columns lost"
+
+    use_registream_dir(root)
+    for columns, future in zip(requests, futures[:-1]):
+        df = _labeled_frame(columns)
+        assert future.result() == (df.get_variable_labels(), df.get_value_labels()), \
+            f"labels of {columns} differ from one thread's"
+    return reads
+
+
+class ThreadedAutolabel:
+    """Requests per second with warm catalogs, by number of threads and I/O wait per request."""
+    number = 1
+    repeat = 5
+    timeout = 600
+    params = (THREADS, [0, IO_WAIT])
+    param_names = ['threads', 'io_wait']
+
+    def setup_cache(self):
+        root = os.path.abspath('catalog')
+        write_catalog(root)
+        return root
+
+    def setup(self, root, threads, io_wait):
+        use_registream_dir(root)
+        registream.set_usage_logging(False)
+        self.requests = _requests(REQUESTS)
+        for columns in self.requests:
+            _label_request(columns)  # loads the catalogs and parses the value labels
+        self.pool = ThreadPoolExecutor(threads)
+        list(self.pool.map(_label_request, self.requests[:threads]))  # starts the threads
+
+    def teardown(self, root, threads, io_wait):
+        self.pool.shutdown()
+
+    def time_requests(self, root, threads, io_wait):
+        list(self.pool.map(_label_request, self.requests, [io_wait] * len(self.requests)))
+
+
+class ColdStart:
+    """All threads asking for the catalogs at once, before they are loaded."""
+    number = 1
+    repeat = 3
+    timeout = 600
+    params = THREADS
+    param_names = ['threads']
+
+    def setup_cache(self):
+        root = os.path.abspath('catalog')
+        write_catalog(root)
+        return root
+
+    def setup(self, root, threads):
+        use_registream_dir(root)
+        registream.set_usage_logging(False)
+        self.requests = _requests(threads, seed=1)
+        self.pool = ThreadPoolExecutor(threads)
+        list(self.pool.map(lambda _: None, range(threads)))  # starts the threads
+
+    def teardown(self, root, threads):
+        self.pool.shutdown()
+
+    def _start_together(self):
+        barrier = threading.Barrier(len(self.requests))
+
+        def request(columns):
+            barrier.wait()
+            return _label_request(columns)
+        return list(self.pool.map(request, self.requests))
+
+    def time_cold_start(self, root, threads):
+        self._start_together()
+
+    def track_catalog_reads(self, root, threads):
+        registream.enable_stats()
+        registream.reset_stats()
+        try:
+            self._start_together()
+            return registream.stats()['counters'].get('catalog.cache_misses', 0)
+        finally:
+            registream.enable_stats(False)
+    track_catalog_reads.unit = 'reads'
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        bench = ThreadedAutolabel()
+        root = bench.setup_cache()
+        for threads in THREADS:
+            reads = check_threads(root, threads)
+            name = f"check[{threads} threads]"
+            print(f"{name:<35} ok  catalog reads: {reads}")
+
+        for io_wait in ThreadedAutolabel.params[1]:
+            baseline = None
+            for threads in THREADS:
+                bench.setup(root, threads, io_wait)
+                start = time.perf_counter()
+                bench.time_requests(root, threads, io_wait)
+                elapsed = time.perf_counter() - start
+                bench.teardown(root, threads, io_wait)
+                baseline = baseline or elapsed
+                name = f"requests[{threads} threads, {io_wait * 1000:.0f} ms I/O]"
+                print(f"{name:<35} {elapsed:8.3f}s  {REQUESTS / elapsed:8.0f} requests/s  x{baseline / elapsed:.2f}")
+
+        bench = ColdStart()
+        for threads in THREADS:
+            bench.setup(root, threads)
+            start = time.perf_counter()
+            reads = bench.track_catalog_reads(root, threads)
+            elapsed = time.perf_counter() - start
+            bench.teardown(root, threads)
+            name = f"cold_start[{threads} threads]"
+            print(f"{name:<35} {elapsed:8.3f}s  catalog reads: {reads}")
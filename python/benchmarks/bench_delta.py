@@ -0,0 +1,97 @@
+"""
+Benchmarks for catalog updates from a local stand-in server: the first
+update (every constituent file), a delta update after one file changed, and
+an update when nothing changed. ``track_`` benchmarks report the bytes
+downloaded.
+
+Run with asv, or directly with ``python -m benchmarks.bench_delta`` from the
+``python`` directory for a quick report.
+"""
+import contextlib
+import io
+import os
+import shutil
+
+from registream.label_fetcher import LabelFetcher
+
+from .common import (CHUNK_FILES, DOMAIN, LANG, serve_directory, use_registream_dir, write_catalog,
+                     write_release)
+
+
+def _changed_release(source, target):
+    """Copy a release folder and change the last rows of one constituent file."""
+    shutil.copytree(source, target)
+    name = sorted(os.listdir(target))[CHUNK_FILES // 2]
+    path = os.path.join(target, name)
+    with open(path, encoding='utf-8') as f:
+        lines = f.readlines()
+    lines[-10:] = [line.replace('Label of', 'Revised label of') for line in lines[-10:]]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+
+class CatalogUpdate:
+    """Updating the variables catalog from version 1 to version 2 (one of CHUNK_FILES files changed)."""
+    number = 1
+    repeat = 3
+    timeout = 600
+    params = ['first', 'delta', 'unchanged']
+    param_names = ['update']
+
+    def setup_cache(self):
+        source = os.path.abspath('source')
+        write_catalog(source, chunks=True)
+        folder = os.path.join(source, 'autolabel_keys', f"{DOMAIN}_variables_{LANG}")
+        v2 = os.path.abspath('v2')
+        _changed_release(folder, v2)
+        return folder, v2
+
+    def setup(self, releases, update):
+        v1, v2 = releases
+        self.site = os.path.abspath('site')
+        self.root = os.path.abspath('local')
+        shutil.rmtree(self.site, ignore_errors=True)
+        shutil.rmtree(self.root, ignore_errors=True)
+        write_release(self.site, v1, '20250101')
+        self.server, url = serve_directory(self.site)
+        os.environ['REGISTREAM_API_HOST'] = url
+        use_registream_dir(self.root)
+        self.fetcher = LabelFetcher(domain=DOMAIN, lang=LANG, label_type='variables')
+        if update != 'first':
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.fetcher.update(verbose=False)
+        if update == 'delta':
+            write_release(self.site, v2, '20250201')
+
+    def teardown(self, releases, update):
+        self.server.shutdown()
+        self.server.server_close()
+        os.environ.pop('REGISTREAM_API_HOST', None)
+        shutil.rmtree(self.site, ignore_errors=True)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def time_update(self, releases, update):
+        self.fetcher.update(verbose=False)
+
+    def track_downloaded_bytes(self, releases, update):
+        return self.fetcher.update(verbose=False)['bytes']
+    track_downloaded_bytes.unit = 'bytes'
+
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        bench = CatalogUpdate()
+        releases = bench.setup_cache()
+        for update in CatalogUpdate.params:
+            bench.setup(releases, update)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = bench.fetcher.update(verbose=False)
+            elapsed = time.perf_counter() - start
+            print(f"update[{update:<9}] {elapsed:8.3f}s  {result['bytes'] / 1e6:8.2f} MB  "
+                  f"{len(result['downloaded'])} of {len(result['downloaded']) + len(result['unchanged'])} files")
+            bench.teardown(releases, update)
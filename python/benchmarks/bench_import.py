@@ -0,0 +1,83 @@
+"""
+Import-time benchmark for ``import registream``.
+
+Measures, with ``python -X importtime``, how long importing registream takes on
+top of pandas (which the package cannot avoid), and checks that the optional
+heavy dependencies are not imported eagerly.
+
+Run directly to enforce the budget (exit code 1 when it is exceeded):
+
+    python benchmarks/bench_import.py
+"""
+import re
+import statistics
+import subprocess
+import sys
+
+# Budget for registream's own import cost, excluding pandas/numpy
+IMPORT_OVERHEAD_BUDGET_MS = 100.0
+
+# Modules that must only be imported on first use
+LAZY_MODULES = ('seaborn', 'matplotlib', 'tqdm', 'requests')
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure_import(runs=5):
+    """
+    Return the median (total_ms, overhead_ms) of importing registream in fresh interpreters.
+
+    numpy and pandas are imported first so that registream's own cumulative
+    time is its overhead on top of them.
+    """
+    totals, overheads = [], []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import numpy, pandas, registream'],
+            capture_output=True, text=True, check=True,
+        )
+        cumulative = {}
+        for line in proc.stderr.splitlines():
+            match = _LINE.match(line)
+            if match and len(match.group(3)) == 1:
+                # Top-level imports only
+                cumulative[match.group(4)] = int(match.group(2)) / 1000.0
+        overhead = cumulative.get('registream', 0.0)
+        overheads.append(overhead)
+        totals.append(cumulative.get('numpy', 0.0) + cumulative.get('pandas', 0.0) + overhead)
+    return statistics.median(totals), statistics.median(overheads)
+
+
+def eagerly_imported_modules():
+    """Return the lazy modules that are nevertheless loaded by `import registream`."""
+    code = (
+        "import sys, registream; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return [m for m in proc.stdout.strip().split(',') if m]
+
+
+class ImportTime:
+    """asv tracking benchmarks for the package import cost."""
+
+    unit = 'ms'
+    number = 1
+    repeat = 1
+
+    def track_import_total(self):
+        return measure_import()[0]
+
+    def track_import_overhead(self):
+        return measure_import()[1]
+
+
+if __name__ == '__main__':
+    total, overhead = measure_import()
+    eager = eagerly_imported_modules()
+    print(f"import registream: {total:.1f} ms total, {overhead:.1f} ms on top of "
+          f"numpy/pandas (budget {IMPORT_OVERHEAD_BUDGET_MS:.0f} ms)")
+    if eager:
+        print(f"eagerly imported: {', '.join(eager)}")
+    if overhead > IMPORT_OVERHEAD_BUDGET_MS or eager:
+        sys.exit(1)
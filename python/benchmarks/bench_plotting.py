@@ -0,0 +1,61 @@
+"""
+Benchmarks for the seaborn wrapper installed by the ``df.lab`` accessor.
+
+The default frame is 10M rows x 500 value-labeled columns (int8 codes, ~5 GB).
+Set REGISTREAM_BENCH_ROWS / REGISTREAM_BENCH_COLS to run on smaller machines.
+
+Run with asv, or directly with ``python -m benchmarks.bench_plotting`` from the
+``python`` directory for a quick report.
+"""
+import registream  # noqa: F401  (registers the accessor)
+from registream.autolabel import _prepare_plot_data
+
+from .common import COLS, ROWS, make_labeled_frame
+
+
+def legacy_prepare_plot_data(accessor, x, y, hue):
+    """The pre-pruning behaviour: copy the whole frame and stringify every labeled column."""
+    df_with_values = accessor._df.copy()
+    for col, val_dict in accessor.value_labels.items():
+        if col == hue or (col != x and col != y):
+            if col in df_with_values.columns:
+                df_with_values[col] = df_with_values[col].astype(str).replace(val_dict)
+    return df_with_values
+
+
+class _WideFrame:
+    timeout = 1800
+
+    def setup(self):
+        self.df = make_labeled_frame(ROWS, COLS)
+        self.kwargs = {'x': 'var000000', 'y': 'var000001', 'hue': 'var000002'}
+
+
+class PlotDataPreparation(_WideFrame):
+    """Cost of preparing `data` for a two-column plot of a wide, long frame."""
+
+    def time_pruned(self):
+        _prepare_plot_data(self.df.lab, 'histplot', self.kwargs)
+
+    def peakmem_pruned(self):
+        _prepare_plot_data(self.df.lab, 'histplot', self.kwargs)
+
+
+class LegacyPlotDataPreparation(_WideFrame):
+    """Reference timing for the full copy + astype(str) path (very slow at full size)."""
+
+    def time_legacy(self):
+        legacy_prepare_plot_data(self.df.lab, **self.kwargs)
+
+    def peakmem_legacy(self):
+        legacy_prepare_plot_data(self.df.lab, **self.kwargs)
+
+
+if __name__ == '__main__':
+    import time
+
+    bench = PlotDataPreparation()
+    bench.setup()
+    start = time.perf_counter()
+    bench.time_pruned()
+    print(f"pruned plot data ({ROWS:,} x {COLS}): {time.perf_counter() - start:.3f}s")
@@ -0,0 +1,75 @@
+"""
+Benchmarks for ``registream.read_csv``: reading a labeled extract of CSV_ROWS
+rows x 20 columns whole and in chunks, with value-labeled columns decoded to
+categoricals as they are read, compared with reading it whole and decoding
+afterwards. Set REGISTREAM_BENCH_CSV_ROWS to change CSV_ROWS (default 2,000,000).
+
+Run with asv, or directly with ``python -m benchmarks.bench_read_csv`` from the
+``python`` directory for a quick report.
+"""
+import os
+
+import registream
+from registream.autolabel import _decode_categorical
+
+from .common import make_labeled_frame, use_registream_dir, write_catalog
+
+CSV_ROWS = int(os.environ.get('REGISTREAM_BENCH_CSV_ROWS', 2_000_000))
+CHUNKSIZE = 250_000
+
+
+class ReadCsv:
+    """Reading and decoding a labeled CSV extract."""
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    def setup_cache(self):
+        root = os.path.abspath('catalog')
+        write_catalog(root)
+        path = os.path.abspath('extract.csv')
+        make_labeled_frame(CSV_ROWS, 20, n_codes=2).to_csv(path, index=False)
+        return root, path
+
+    def setup(self, cache):
+        use_registream_dir(cache[0])
+
+    def _consume(self, chunks):
+        rows = 0
+        for chunk in chunks:
+            rows += len(chunk)
+        return rows
+
+    def time_read_labeled(self, cache):
+        registream.read_csv(cache[1])
+
+    def time_read_chunks_decoded(self, cache):
+        self._consume(registream.read_csv(cache[1], decode=True, chunksize=CHUNKSIZE))
+
+    def peakmem_read_chunks_decoded(self, cache):
+        self._consume(registream.read_csv(cache[1], decode=True, chunksize=CHUNKSIZE))
+
+    def peakmem_read_then_decode(self, cache):
+        df = registream.read_csv(cache[1])
+        for col, val_dict in df.get_value_labels().items():
+            df[col] = _decode_categorical(df[col], val_dict)
+
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+    import tracemalloc
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        bench = ReadCsv()
+        cache = bench.setup_cache()
+        bench.setup(cache)
+        for name in ('time_read_labeled', 'time_read_chunks_decoded', 'peakmem_read_then_decode'):
+            tracemalloc.start()
+            start = time.perf_counter()
+            getattr(bench, name)(cache)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            print(f"{name[name.index('_') + 1:]:<25} {elapsed:8.3f}s  peak allocated {peak:8.1f} MB")
@@ -0,0 +1,97 @@
+"""
+Benchmarks for labeling in process pools, with each worker reading the
+catalog CSVs versus attaching to the catalog shared by ``share_catalog``.
+
+The ``track_`` benchmarks report the largest private memory (MB) of a worker,
+which should stay flat with the shared catalog as the pool grows. They read
+/proc and are skipped on systems without it.
+
+Run with asv, or directly with ``python -m benchmarks.bench_shared`` from the
+``python`` directory for a quick report.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import registream
+from registream.autolabel import autolabel
+
+from .common import DOMAIN, LANG, make_labeled_frame, use_registream_dir, write_catalog
+
+COLUMNS = 500
+
+
+def _private_mb():
+    """Private (unshared) memory of the calling process in MB."""
+    private = 0
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                private += int(line.split()[1])
+    return private / 1024
+
+
+def _label_in_worker(root):
+    use_registream_dir(root)
+    df = make_labeled_frame(100, COLUMNS)
+    df.attrs.clear()
+    autolabel(df, label_type='variables', domain=DOMAIN, lang=LANG, verbose=False)
+    autolabel(df, label_type='values', domain=DOMAIN, lang=LANG, verbose=False)
+    return _private_mb()
+
+
+class PoolAutolabel:
+    """Every worker of a spawned pool labels a frame of COLUMNS columns."""
+    number = 1
+    repeat = 3
+    timeout = 1200
+    params = (['files', 'shared'], [2, 8])
+    param_names = ['catalog', 'workers']
+
+    def setup_cache(self):
+        root = os.path.abspath('catalog')
+        write_catalog(root)
+        return root
+
+    def setup(self, root, catalog, workers):
+        if not os.path.exists('/proc/self/smaps_rollup'):
+            raise NotImplementedError("needs /proc/self/smaps_rollup")
+        use_registream_dir(root)
+        if catalog == 'shared':
+            registream.share_catalog(domain=DOMAIN, lang=LANG)
+        else:
+            registream.unshare_catalog()
+
+    def teardown(self, root, catalog, workers):
+        registream.unshare_catalog()
+
+    def _run(self, root, workers):
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(workers, mp_context=context) as pool:
+            return list(pool.map(_label_in_worker, [root] * workers))
+
+    def time_pool_autolabel(self, root, catalog, workers):
+        self._run(root, workers)
+
+    def track_worker_private_mb(self, root, catalog, workers):
+        return max(self._run(root, workers))
+    track_worker_private_mb.unit = 'MB'
+
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        bench = PoolAutolabel()
+        root = bench.setup_cache()
+        for catalog in PoolAutolabel.params[0]:
+            for workers in PoolAutolabel.params[1]:
+                bench.setup(root, catalog, workers)
+                start = time.perf_counter()
+                private = max(bench._run(root, workers))
+                elapsed = time.perf_counter() - start
+                print(f"pool autolabel[{catalog}, {workers} workers]  {elapsed:8.3f}s  "
+                      f"max worker private memory {private:7.1f} MB")
+                bench.teardown(root, catalog, workers)
@@ -0,0 +1,67 @@
+"""
+Benchmarks for local usage logging: the cost to the calling thread of
+queueing an event, the background batch write, and for reference a naive
+per-call append with fsync.
+
+Run with asv, or directly with ``python -m benchmarks.bench_usage`` from the
+``python`` directory for a quick report.
+"""
+import os
+import shutil
+import tempfile
+
+from registream import usage
+
+from .common import use_registream_dir
+
+EVENTS = 1000
+
+
+class UsageLogging:
+    """Logging EVENTS usage events."""
+
+    def setup(self):
+        self.root = tempfile.mkdtemp()
+        use_registream_dir(self.root)
+        usage._enabled = None
+        usage._user_id = None
+        usage._queue.clear()
+        # Warm up: salt, user id and config are read once per process
+        usage.log_usage('warmup')
+        usage.flush()
+
+    def teardown(self):
+        usage._queue.clear()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def time_log_usage(self):
+        # What autolabel/lookup pay: queueing only, the writer thread does the I/O
+        for i in range(EVENTS):
+            usage.log_usage("autolabel(label_type='values', domain='scb', lang='eng', variables='*')")
+
+    def time_log_usage_and_flush(self):
+        for i in range(EVENTS):
+            usage.log_usage("autolabel(label_type='values', domain='scb', lang='eng', variables='*')")
+        usage.flush()
+
+    def time_append_fsync_per_call(self):
+        # Reference: a synchronous append + fsync per event, as a naive logger would do
+        path = os.path.join(self.root, 'naive_usage.csv')
+        for i in range(EVENTS):
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write("2025-01-01T00:00:00Z;0123456789abcdef;python;1.0.0;autolabel();Unix;3.11\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+
+if __name__ == '__main__':
+    import time
+
+    bench = UsageLogging()
+    for name in ('time_log_usage', 'time_log_usage_and_flush', 'time_append_fsync_per_call'):
+        bench.setup()
+        start = time.perf_counter()
+        getattr(bench, name)()
+        elapsed = time.perf_counter() - start
+        bench.teardown()
+        print(f"{name[5:]:<30} {elapsed / EVENTS * 1e6:10.2f} us per event")
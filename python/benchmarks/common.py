@@ -0,0 +1,200 @@
+"""
+Synthetic SCB-scale catalogs and data frames shared by the benchmarks.
+
+Sizes can be reduced with environment variables on smaller machines:
+
+- REGISTREAM_BENCH_CATALOG_VARS: variables in the synthetic catalog (default 120,000)
+- REGISTREAM_BENCH_ROWS: rows of the large data frames (default 10,000,000)
+- REGISTREAM_BENCH_COLS: labeled columns of the data frames (default 500)
+"""
+import json
+import os
+import numpy as np
+import pandas as pd
+
+CATALOG_VARS = int(os.environ.get('REGISTREAM_BENCH_CATALOG_VARS', 120_000))
+ROWS = int(os.environ.get('REGISTREAM_BENCH_ROWS', 10_000_000))
+COLS = int(os.environ.get('REGISTREAM_BENCH_COLS', 500))
+
+# Constituent files per catalog, like the chunks of the downloaded zip files
+CHUNK_FILES = 12
+
+# Share of catalog variables with value labels, and how many labels they have.
+# Most SCB value label sets are small (sex, yes/no, region), a few are large
+# classifications (occupation, industry, municipality).
+LABELED_SHARE = 0.4
+LABEL_SET_SIZES = [(2, 10, 0.60), (10, 100, 0.30), (100, 1000, 0.09), (1000, 5000, 0.01)]
+# Schema 1.0: average number of variables sharing one value label set
+SET_SHARING = 20
+
+DOMAIN = 'scb'
+LANG = 'eng'
+
+
+def variable_names(n=CATALOG_VARS):
+    return [f"var{i:06d}" for i in range(n)]
+
+
+def label_set_size(rng):
+    """Draw the number of labels of one value label set."""
+    r, total = rng.random(), 0.0
+    for low, high, share in LABEL_SET_SIZES:
+        total += share
+        if r < total:
+            return int(rng.integers(low, high))
+    return LABEL_SET_SIZES[-1][1]
+
+
+def value_label_string(n_labels, style='python'):
+    """A value label set as stored in the catalog ('python' dict repr or 'json')."""
+    labels = {str(code): f"Category {code} of a classification" for code in range(1, n_labels + 1)}
+    if style == 'json':
+        return json.dumps(labels)
+    return repr(labels)
+
+
+def make_catalog(n_vars=CATALOG_VARS, seed=0):
+    """Return the (variables, value_labels) catalog DataFrames in the legacy 0.5 layout."""
+    rng = np.random.default_rng(seed)
+    names = variable_names(n_vars)
+    variables = pd.DataFrame({
+        'variable': names,
+        'variable_desc': [f"Label of {name}" for name in names],
+        'definition': [f"Definition of {name}, measured yearly for all registered persons." for name in names],
+        'unit': '',
+        'value_type': 'categorical',
+    })
+    labeled = [name for name in names if rng.random() < LABELED_SHARE]
+    value_labels = pd.DataFrame({
+        'variable': labeled,
+        'value_labels': [value_label_string(label_set_size(rng)) for _ in labeled],
+    })
+    return variables, value_labels
+
+
+def make_catalog_v1(n_vars=CATALOG_VARS, seed=0, sharing=SET_SHARING):
+    """
+    Return the (variables, value_labels) catalog DataFrames in the schema 1.0 layout.
+
+    Labeled variables use value label sets in groups of about ``sharing``, like
+    the year variants of one code list.
+    """
+    variables, value_labels = make_catalog(n_vars, seed)
+    n_sets = max(len(value_labels) // sharing, 1)
+    rng = np.random.default_rng(seed)
+    set_ids = pd.Series(rng.integers(1, n_sets + 1, size=len(value_labels)), index=value_labels['variable'])
+    variables = pd.DataFrame({
+        'variable_name': variables['variable'],
+        'variable_label': variables['variable_desc'],
+        'variable_definition': variables['definition'],
+        'variable_unit': variables['unit'],
+        'variable_type': variables['value_type'],
+        'value_label_id': variables['variable'].map(set_ids).astype('Int64'),
+    })
+    first_variable = set_ids.reset_index().drop_duplicates(0).set_index(0)['variable']
+    ids = np.arange(1, n_sets + 1)
+    value_labels = pd.DataFrame({
+        'value_label_id': ids,
+        'variable_name': [first_variable.get(i, '') for i in ids],
+        'value_labels_json': [value_label_string(label_set_size(rng), style='json') for _ in ids],
+        'value_labels_stata': '',
+        'conflict': 0,
+        'harmonized_automatically': 0,
+    })
+    return variables, value_labels
+
+
+def write_catalog(root, n_vars=CATALOG_VARS, chunks=False, seed=0, schema='0.5'):
+    """
+    Write a synthetic catalog under ``<root>/autolabel_keys`` and return that directory.
+
+    With ``chunks=True`` the catalogs are written as folders of semicolon-delimited
+    constituent files (as extracted from the downloads) instead of combined CSVs.
+    ``schema='1.0'`` writes the schema 1.0 layout (see docs/schema.md).
+    """
+    label_dir = os.path.join(root, 'autolabel_keys')
+    os.makedirs(label_dir, exist_ok=True)
+    if schema == '1.0':
+        variables, value_labels = make_catalog_v1(n_vars, seed)
+    else:
+        variables, value_labels = make_catalog(n_vars, seed)
+    for label_type, df in (('variables', variables), ('value_labels', value_labels)):
+        stem = f"{DOMAIN}_{label_type}_{LANG}"
+        if chunks:
+            folder = os.path.join(label_dir, stem)
+            os.makedirs(folder, exist_ok=True)
+            for i, part in enumerate(np.array_split(np.arange(len(df)), CHUNK_FILES)):
+                df.iloc[part].to_csv(os.path.join(folder, f"{stem}_{i:04d}.csv"), sep=';', index=False)
+        else:
+            df.to_csv(os.path.join(label_dir, f"{stem}.csv"), index=False)
+    return label_dir
+
+
+def use_registream_dir(root):
+    """Point registream at a benchmark catalog and drop anything cached in memory."""
+    os.environ['REGISTREAM_DIR'] = root
+    from registream.catalog import clear_catalog_cache
+    from registream.label_fetcher import LabelFetcher
+    LabelFetcher._custom_dir_message_shown = True  # keep benchmark output quiet
+    clear_catalog_cache()
+
+
+def make_labeled_frame(rows, cols, n_codes=20, seed=0):
+    """Frame of small integer codes named after catalog variables, all with labels."""
+    rng = np.random.default_rng(seed)
+    data = {f"var{i:06d}": rng.integers(1, n_codes + 1, size=rows, dtype=np.int8) for i in range(cols)}
+    df = pd.DataFrame(data)
+    labels = {str(code): f"Category {code}" for code in range(1, n_codes + 1)}
+    df.set_value_labels({col: labels for col in df.columns})
+    df.set_variable_labels({col: f"Label of {col}" for col in df.columns})
+    return df
+
+
+def write_release(site_root, folder, version, label_type='variables'):
+    """
+    Publish a folder of constituent files as a catalog version for a stand-in server.
+
+    Writes ``<site_root>/api/v1/datasets/<domain>/<type>/<lang>/<version>/``
+    with the ``manifest`` and ``chunks/`` that ``LabelFetcher.update`` requests,
+    and the same under ``latest/``.
+    """
+    import hashlib
+    import json
+    import shutil
+
+    chunks = []
+    for name in sorted(f for f in os.listdir(folder) if f.endswith('.csv')):
+        with open(os.path.join(folder, name), 'rb') as f:
+            data = f.read()
+        chunks.append({'name': name, 'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()})
+    manifest = {'domain': DOMAIN, 'type': label_type, 'lang': LANG, 'version': version, 'chunks': chunks}
+
+    dataset_dir = os.path.join(site_root, 'api', 'v1', 'datasets', DOMAIN, label_type, LANG)
+    for release in (version, 'latest'):
+        release_dir = os.path.join(dataset_dir, release)
+        shutil.rmtree(release_dir, ignore_errors=True)
+        shutil.copytree(folder, os.path.join(release_dir, 'chunks'))
+        with open(os.path.join(release_dir, 'manifest'), 'w') as f:
+            json.dump(manifest, f)
+    return manifest
+
+
+def serve_directory(root):
+    """
+    Serve a directory over HTTP on a free local port, as a stand-in for registream.org.
+
+    Returns the server (call ``shutdown()`` when done) and its base URL, to be
+    used as REGISTREAM_API_HOST.
+    """
+    import functools
+    import threading
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    handler = functools.partial(QuietHandler, directory=root)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
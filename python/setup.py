@@ -26,6 +26,12 @@ setup(
         "matplotlib>=3.0.0",
         "seaborn>=0.11.0",
     ],
+    extras_require={
+        "parquet": ["pyarrow>=1.0.0"],
+    },
+    entry_points={
+        "console_scripts": ["registream=registream.cli:main"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
@@ -9,10 +9,22 @@ from .autolabel import (
     get_value_labels, set_value_labels,
     rename_with_labels, copy_labels, meta_search
 )
-from .lookup import lookup
+from .lookup import lookup, lookup_table
+from .search import search, build_search_index
+from .stata import write_stata, read_stata
+from .parquet import write_parquet, read_parquet
+from .csv_reader import read_csv, concat_chunks
+from .instrumentation import (
+    stats, enable_stats, reset_stats, add_stats_callback, remove_stats_callback
+)
+from .usage import set_usage_logging
+from .client import use_server
+from .label_fetcher import update_labels
+from .shared import share_catalog, unshare_catalog
 
 # Export these symbols when importing the package
-__all__ = ['lookup', 'autolabel']
+__all__ = ['lookup', 'lookup_table', 'search', 'autolabel', 'write_stata', 'read_stata',
+           'write_parquet', 'read_parquet', 'read_csv', 'concat_chunks', 'stats']
 
 # Add the methods to pandas DataFrame
 import pandas as pd
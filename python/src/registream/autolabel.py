@@ -1,11 +1,16 @@
 import ast
+import numpy as np
 import pandas as pd
 from .label_fetcher import LabelFetcher
-from tqdm import tqdm
+from .catalog import load_catalog, value_labels_for, _domains
+from .instrumentation import timer, count
+from .usage import argument_repr, log_usage
+from .client import get_client
 import json
 import re
-import seaborn as sns
-import matplotlib.pyplot as plt
+import sys
+import threading
+import importlib.util
 from functools import wraps
 
 # Helper for safer JSON parsing
@@ -92,6 +97,362 @@ def _normalize_dict_keys(obj):
             
     return result
 
+def _lookup_label(val_dict, value):
+    """Return the label for a raw value, falling back to the value as a string."""
+    key = str(value)
+    if key in val_dict:
+        return val_dict[key]
+    # Integer codes stored in float columns (e.g. because of missing values)
+    if isinstance(value, float) and value.is_integer():
+        return val_dict.get(str(int(value)), key)
+    return key
+
+def _code_strings(series):
+    """Return codes as the strings used for value label keys (1.0 becomes '1')."""
+    text = series.astype(str)
+    if pd.api.types.is_float_dtype(series.dtype):
+        # Integer codes stored in float columns (e.g. read from Stata with missing values)
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        whole = np.isfinite(values) & (np.floor(values) == values)
+        if whole.any():
+            ints = pd.Series(np.where(whole, values, 0).astype('int64'), index=series.index,
+                             name=series.name).astype(str)
+            text = ints.where(whole, text)
+    return text
+
+def _decode_categorical(series, val_dict):
+    """
+    Decode a coded Series into a categorical Series of value labels.
+    
+    Labels are looked up once per distinct code rather than once per row, and
+    the result stores small integer codes instead of one string per row.
+    Missing values stay missing.
+    """
+    try:
+        codes, uniques = pd.factorize(series, sort=True)
+    except TypeError:
+        # Mixed types that cannot be ordered
+        codes, uniques = pd.factorize(series)
+    labels = [_lookup_label(val_dict, value) for value in uniques]
+    
+    # Several codes may share a label (e.g. '1' and 'M' both 'Man')
+    categories = pd.Index(labels, dtype=object).unique()
+    if len(labels):
+        remap = categories.get_indexer(labels)
+        codes = np.where(codes >= 0, remap[codes], -1)
+    decoded = pd.Categorical.from_codes(codes, categories=categories)
+    return pd.Series(decoded, index=series.index, name=series.name)
+
+def _label_codes(series, val_dict, labels):
+    """
+    Return the raw values of a column that decode to any of the labels.
+
+    Labels are translated through a reverse index of the value labels (several
+    codes may share a label). Codes without a label are displayed as they are,
+    so a string that is not a labeled code also matches itself.
+    """
+    reverse = {}
+    for code, label in val_dict.items():
+        reverse.setdefault(label, []).append(code)
+    codes = []
+    for label in labels:
+        codes.extend(reverse.get(label, ()))
+        if isinstance(label, str) and label not in val_dict:
+            codes.append(label)
+
+    # Value label keys are strings; compare numeric columns with numbers
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        numbers = pd.to_numeric(pd.Series(codes, dtype=object), errors='coerce').dropna().tolist()
+        codes = [int(n) if float(n).is_integer() else n for n in numbers]
+    return list(dict.fromkeys(codes))
+
+def _label_keys(df, columns, value_labels):
+    """
+    Return the keys to aggregate the columns on, and the columns whose results still need value labels.
+
+    Columns are aggregated on their raw codes and only the result is labeled.
+    Where several codes share a label, the column is decoded first (once per
+    distinct code, see _decode_categorical) so that those codes form one group.
+    """
+    keys, pending = [], set()
+    for col in columns:
+        val_dict = value_labels.get(col)
+        if val_dict and len(set(val_dict.values())) < len(val_dict):
+            keys.append(_decode_categorical(df[col], val_dict))
+        else:
+            keys.append(df[col])
+            if val_dict:
+                pending.add(col)
+    return keys, pending
+
+def _label_index(index, value_labels, variable_labels, pending):
+    """Apply value labels to the levels of the pending columns and variable labels to the level names."""
+    def label(values, name):
+        if name not in pending:
+            return values
+        val_dict = value_labels[name]
+        return pd.Index([value if pd.isna(value) else _lookup_label(val_dict, value) for value in values])
+    names = [variable_labels.get(name, name) for name in index.names]
+    if isinstance(index, pd.MultiIndex):
+        arrays = [label(index.get_level_values(i), name) for i, name in enumerate(index.names)]
+        return pd.MultiIndex.from_arrays(arrays, names=names)
+    return pd.Index(label(index, index.name), name=names[0])
+
+class _LabeledGroupBy:
+    """
+    A pandas groupby on the raw codes whose results get variable and value labels.
+
+    Any groupby method can be called (``agg``, ``sum``, ``size``, ...); results
+    indexed by the groups have their group keys labeled and their columns
+    renamed to the variable labels. Groups are in code order.
+    """
+
+    def __init__(self, accessor, by, kwargs):
+        df = accessor._df
+        self._by = [by] if isinstance(by, str) else list(by)
+        self._value_labels = accessor.value_labels
+        self._variable_labels = accessor.variable_labels
+        keys, self._pending = _label_keys(df, self._by, self._value_labels)
+        # Columns to aggregate when no selection is made (None for pandas' default)
+        self._columns = None
+        if len(self._pending) < sum(1 for col in self._by if self._value_labels.get(col)):
+            # Group on the decoded keys, but do not aggregate the coded columns
+            keys = [col if col in self._pending or not self._value_labels.get(col) else key
+                    for col, key in zip(self._by, keys)]
+            kwargs.setdefault('observed', True)
+            self._columns = [col for col in df.columns if col not in self._by]
+        else:
+            keys = self._by
+        self._groupby = df.groupby(keys, **kwargs)
+
+    def _label(self, result):
+        if not isinstance(result, (pd.Series, pd.DataFrame)):
+            return result
+        if list(result.index.names) == self._by:
+            result.index = _label_index(result.index, self._value_labels, self._variable_labels, self._pending)
+        if isinstance(result, pd.DataFrame):
+            for col in self._pending & set(result.columns):
+                # as_index=False puts the group keys in columns
+                val_dict = self._value_labels[col]
+                result[col] = [value if pd.isna(value) else _lookup_label(val_dict, value) for value in result[col]]
+            return result.rename(columns=self._variable_labels)
+        if result.name in self._variable_labels:
+            result.name = self._variable_labels[result.name]
+        return result
+
+    def __getitem__(self, key):
+        selected = object.__new__(_LabeledGroupBy)
+        selected.__dict__.update(self.__dict__)
+        selected._groupby = self._groupby[key]
+        selected._columns = None
+        return selected
+
+    def __getattr__(self, attr):
+        value = getattr(self._groupby, attr)
+        if hasattr(value, 'ngroups'):
+            # Column selected as an attribute (df.lab.groupby('kon').inkomst)
+            return self[attr]
+        if self._columns is not None:
+            value = getattr(self._groupby[self._columns], attr)
+        if not callable(value):
+            return value
+        @wraps(value)
+        def labeled(*args, **kwargs):
+            return self._label(value(*args, **kwargs))
+        return labeled
+
+    def __iter__(self):
+        return iter(self._groupby if self._columns is None else self._groupby[self._columns])
+
+# Literals, backtick-quoted column names and local variable references (@name) of a query
+_QUERY_TOKENS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|`([^`]*)`|@""")
+
+def _translate_query(expr, df, value_labels):
+    """
+    Rewrite comparisons of labeled columns with label strings as comparisons with their codes.
+
+    ``kon == "Woman"`` becomes ``(kon == 2)`` and ``jurform not in ["Aktiebolag", "HB"]``
+    becomes ``(jurform not in [49, 31])``. Other comparisons are left as they are.
+    """
+    names = []
+    def protect(match):
+        if match.group(1) is not None:
+            return match.group(1)
+        if match.group(2) is not None:
+            names.append(match.group(2))
+            return f"__rs_name{len(names) - 1}__"
+        return '__rs_local__'
+    source = _QUERY_TOKENS.sub(protect, expr)
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError:
+        return expr  # Let pandas report the error
+    source = source.strip().encode('utf-8')
+    line_starts = [0]
+    for line in source.split(b'\n')[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    def column_of(node):
+        if not isinstance(node, ast.Name):
+            return None
+        match = re.fullmatch(r'__rs_name(\d+)__', node.id)
+        column = names[int(match.group(1))] if match else node.id
+        return column if value_labels.get(column) and column in df.columns else None
+
+    def labels_of(node):
+        items = node.elts if isinstance(node, (ast.List, ast.Tuple, ast.Set)) else [node]
+        if not items or not all(isinstance(item, ast.Constant) and isinstance(item.value, str) for item in items):
+            return None
+        return [item.value for item in items]
+
+    def span(node):
+        return (line_starts[node.lineno - 1] + node.col_offset,
+                line_starts[node.end_lineno - 1] + node.end_col_offset)
+
+    edits = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Compare) or len(node.ops) != 1:
+            continue
+        op, left, right = node.ops[0], node.left, node.comparators[0]
+        if column_of(left) is None and isinstance(op, (ast.Eq, ast.NotEq)):
+            left, right = right, left
+        column, labels = column_of(left), labels_of(right)
+        if column is None or labels is None or not isinstance(op, (ast.Eq, ast.NotEq, ast.In, ast.NotIn)):
+            continue
+        codes = _label_codes(df[column], value_labels[column], labels)
+        start, end = span(left)
+        negate = isinstance(op, (ast.NotEq, ast.NotIn))
+        if len(codes) == 1:
+            # A plain comparison is faster than isin
+            test = f"{'!=' if negate else '=='} {codes[0]!r}"
+        else:
+            test = f"{'not in' if negate else 'in'} [{', '.join(repr(c) for c in codes)}]"
+        text = f"({source[start:end].decode('utf-8')} {test})"
+        edits.append((span(node), text.encode('utf-8')))
+
+    for (start, end), text in sorted(edits, reverse=True):
+        source = source[:start] + text + source[end:]
+    result = source.decode('utf-8').replace('__rs_local__', '@')
+    return re.sub(r'__rs_name(\d+)__', lambda match: f"`{names[int(match.group(1))]}`", result)
+
+# Keyword arguments through which seaborn functions reference columns of `data`
+_PLOT_COLUMN_PARAMS = ('x', 'y', 'hue', 'style', 'size', 'units', 'weights', 'col', 'row')
+
+def _prepare_plot_data(accessor, func_name, kwargs):
+    """
+    Build the frame handed to a seaborn function for a labeled accessor.
+    
+    Only the columns the plot references are taken from the accessor's frame,
+    and value labels are decoded only for those columns (as categoricals).
+    Functions that reference no columns (e.g. heatmap) receive all columns.
+    """
+    df = accessor._df
+    value_labels = accessor.value_labels
+    x_param = kwargs.get('x', None)
+    y_param = kwargs.get('y', None)
+    hue_param = kwargs.get('hue', None)
+    
+    referenced = []
+    for param in _PLOT_COLUMN_PARAMS:
+        col = kwargs.get(param, None)
+        if isinstance(col, str) and col in df.columns and col not in referenced:
+            referenced.append(col)
+    
+    # Select the referenced columns only; decoded columns are assigned into this small frame
+    plot_df = df[referenced] if referenced else df
+    decoded = {}
+    for col in plot_df.columns:
+        val_dict = value_labels.get(col)
+        if not val_dict:
+            continue
+        # Skip the x-axis variable for scatter/line plots to avoid "Year XXXX" labels
+        if col == x_param and func_name in ['scatterplot', 'lineplot']:
+            continue
+        # Only apply value labels to hue variable for better category display
+        if col == hue_param or (col != x_param and col != y_param):
+            decoded[col] = _decode_categorical(plot_df[col], val_dict)
+    
+    if decoded:
+        # Build a new frame around the decoded columns; the source frame is never modified
+        plot_df = pd.DataFrame({col: decoded.get(col, plot_df[col]) for col in plot_df.columns},
+                               index=plot_df.index)
+    return plot_df
+
+def _collect_label_objects(stores, deep):
+    """
+    Map id -> [object, component, parent ids] for the labels dicts of each
+    language, in the order the objects are reached from the top.
+    """
+    found = {}
+
+    def visit(obj, component, parent):
+        entry = found.get(id(obj))
+        if entry is None:
+            found[id(obj)] = [obj, component, {parent}]
+            return True
+        entry[2].add(parent)
+        return False
+
+    for labels in stores:
+        variable_labels = labels.get('variable_labels', {})
+        value_labels = labels.get('value_labels', {})
+        visit(labels, 'labels', None)
+        if visit(variable_labels, 'variable_labels', id(labels)) and deep:
+            for key, label in variable_labels.items():
+                visit(key, 'strings', id(variable_labels))
+                visit(label, 'strings', id(variable_labels))
+        if visit(value_labels, 'value_labels', id(labels)):
+            for key, val_dict in value_labels.items():
+                if deep:
+                    visit(key, 'strings', id(value_labels))
+                if visit(val_dict, 'value_labels', id(value_labels)) and deep:
+                    for code, label in val_dict.items():
+                        visit(code, 'strings', id(val_dict))
+                        visit(label, 'strings', id(val_dict))
+    return found
+
+
+def _label_memory_usage(attrs, deep=True, others=()):
+    """
+    Measure the objects in attrs['registream_labels'] and the other loaded languages.
+
+    Every object is counted once, however often it is referenced. An object is
+    shared when it is the same object as one held by the catalog cache (value
+    label dicts parsed from a catalog) or by the labels of the frames in
+    `others`, or when it is only reachable through shared dicts.
+    """
+    from .catalog import _cached_value_label_dicts
+    outside = {id(val_dict) for val_dict in _cached_value_label_dicts()}
+    for other in others:
+        if 'registream_labels' in other.attrs:
+            outside.update(_collect_label_objects(_label_stores(other.attrs), deep))
+
+    components = ['labels', 'variable_labels', 'value_labels', 'strings']
+    totals = {component: [0, 0, 0] for component in components}
+    shared_ids = set()
+    stores = _label_stores(attrs) if 'registream_labels' in attrs else []
+    for key, (obj, component, parents) in _collect_label_objects(stores, deep).items():
+        size = sys.getsizeof(obj)
+        shared = key in outside or parents <= shared_ids
+        if shared:
+            shared_ids.add(key)
+        totals[component][0] += size
+        totals[component][1] += size if shared else 0
+        totals[component][2] += 1
+
+    result = pd.DataFrame([totals[component] for component in components], index=components,
+                          columns=['bytes', 'shared_bytes', 'objects'])
+    result.loc['total'] = result.sum()
+    return result
+
+# Serializes changes to the label stores of frames (see _publish_labels)
+_labels_lock = threading.RLock()
+# Serializes patching pandas and Seaborn (see _claim_patch)
+_patch_lock = threading.Lock()
+
 # Store the original pandas methods before any modification
 _original_setitem = pd.DataFrame.__setitem__
 _original_rename = pd.DataFrame.rename
@@ -107,10 +468,13 @@ def autolabel(df, label_type='variables', domain='scb', lang='eng', variables="*
         The DataFrame to label
     label_type : str, default 'variables'
         Type of labels to apply ('variables' or 'values')
-    domain : str, default 'scb'
-        The domain to search for variables
-    lang : str, default 'eng'
-        Language for variable descriptions ('eng' or 'swe')
+    domain : str or list, default 'scb'
+        The domain to search for variables. With a list such as ['custom', 'scb']
+        each variable gets its labels from the first domain that has it
+    lang : str or list, default 'eng'
+        Language for variable descriptions ('eng' or 'swe'). A list such as
+        ['eng', 'swe'] loads every language, activates the first, and lets
+        ``df.lab.set_language`` switch between them
     variables : list or str, default "*"
         List of variables to label or "*" for all
     verbose : bool, default True
@@ -129,9 +493,31 @@ def autolabel(df, label_type='variables', domain='scb', lang='eng', variables="*
        - Windows: C:\\Users\\<username>\\AppData\\Local\\registream\\autolabel_keys\\
        - macOS/Linux: ~/.registream/autolabel_keys/
     """
-    # Initialize the labels in the attrs dictionary if they don't exist
-    if 'registream_labels' not in df.attrs:
-        df.attrs['registream_labels'] = {'variable_labels': {}, 'value_labels': {}}
+    log_usage(f"autolabel(label_type={label_type!r}, domain={domain!r}, lang={lang!r}, variables={argument_repr(variables)})")
+    if isinstance(lang, str):
+        return _autolabel(df, label_type, domain, lang, variables, verbose, languages=False)
+
+    langs = list(lang)
+    if not langs:
+        raise ValueError("lang must be a language code or a non-empty list of language codes")
+    for lg in langs:
+        _autolabel(df, label_type, domain, lg, variables, verbose, languages=True)
+    with _labels_lock:
+        _share_equal_labels(df.attrs['registream_languages'])
+        _set_language(df, langs[0])
+    return df
+
+
+def _autolabel(df, label_type, domain, lang, variables, verbose, languages):
+    """Apply the labels of one language (see autolabel)."""
+    # Once several languages are loaded, labels are applied to the label store of
+    # this language, which becomes active. Otherwise they are added to the active
+    # labels, so one language's variable labels and another's value labels combine
+    if languages or 'registream_languages' in df.attrs:
+        store = _set_language(df, lang, create=True)
+    else:
+        with _labels_lock:
+            store = df.attrs.setdefault('registream_labels', {'variable_labels': {}, 'value_labels': {}})
     
     # Determine which variables to process
     if variables == "*":
@@ -148,66 +534,185 @@ def autolabel(df, label_type='variables', domain='scb', lang='eng', variables="*
             print("No variables to process. Make sure the specified variables exist in the DataFrame.")
         return df
     
-    fetcher = LabelFetcher(domain=domain, lang=lang, label_type=label_type)
-    csv_path = fetcher.ensure_labels()
+    stage_info = {'domain': domain, 'lang': lang, 'label_type': label_type}
+    # A label service (registream.use_server) or shared catalog (registream.share_catalog)
+    # answers for the requested columns without reading the CSV in this process
+    from .shared import get_shared_source
+    for source in (get_client(), get_shared_source()):
+        if source is not None:
+            labeled = _autolabel_from_source(df, store, source, variables_to_process, label_type, domain, lang,
+                                             verbose)
+            if labeled is not None:
+                return labeled
 
-    # Read only the necessary columns from the CSV
-    labels_df = pd.read_csv(csv_path, delimiter=',', encoding='utf-8', on_bad_lines='skip')
-    labels_df.columns = labels_df.columns.str.strip()
-    labels_df['variable'] = labels_df['variable'].str.strip()
+    # Schema 1.0 catalogs are read with the legacy column names (see load_catalog)
+    # Several domains are resolved through one merged catalog, the first domain taking precedence
+    with timer('autolabel.fetch', **stage_info):
+        for name in _domains(domain):
+            LabelFetcher(domain=name, lang=lang, label_type=label_type).ensure_labels()
+    with timer('autolabel.read_csv', **stage_info):
+        catalog = load_catalog(domain=domain, lang=lang, label_type=label_type)
+    count('autolabel.catalog_rows', len(catalog), **stage_info)
     
     # Filter to only include variables in the DataFrame
-    labels_df = labels_df[labels_df['variable'].isin(variables_to_process)]
+    matched = [var for var in variables_to_process if var in catalog.index]
+    count('autolabel.matched_variables', len(matched), **stage_info)
     
-    if labels_df.empty:
+    if not matched:
         if verbose:
             print(f"No matching variables found in the {domain} domain for the specified columns.")
         return df
 
     if label_type == 'variables':
-        required_cols = {'variable', 'variable_desc'}
-        if not required_cols.issubset(labels_df.columns):
+        if 'variable_desc' not in catalog.columns:
             return df  # Completely silently return without any message
 
-        df.attrs['registream_labels']['variable_labels'] = labels_df.set_index('variable')['variable_desc'].to_dict()
+        with timer('autolabel.apply_labels', **stage_info):
+            store['variable_labels'] = catalog.loc[matched, 'variable_desc'].to_dict()
         
         if verbose:
-            print(f"\n✓ Applied variable labels to {len(df.attrs['registream_labels']['variable_labels'])} variables\n")
+            print(f"\n✓ Applied variable labels to {len(store['variable_labels'])} variables\n")
 
     elif label_type == 'values':
-        required_cols = {'variable', 'value_labels'}
-        if not required_cols.issubset(labels_df.columns):
+        if 'value_labels' not in catalog.columns:
             return df  # Completely silently return without any message
 
-        success_count = 0
-        error_count = 0
-        
-        if verbose:                
-            # Use tqdm only if verbose is True
-            for _, row in tqdm(labels_df.iterrows(), total=len(labels_df), desc="Parsing value labels"):
-                var = row['variable']
-                val_labels_str = row['value_labels']
-                val_dict = safe_json_parse(val_labels_str)
-                # Always initialize value labels, even if empty
-                df.attrs['registream_labels']['value_labels'][var] = val_dict
-                if val_dict:  # If not empty
-                    success_count += 1
-                else:
-                    # Silently count errors but don't print warnings
-                    error_count += 1
+        with timer('autolabel.parse_value_labels', **stage_info):
+            # Variables that share a value label set share one parsed dict
+            labels = value_labels_for(matched, domain=domain, lang=lang, progress=verbose)
+            # Always initialize value labels, even if empty
+            _publish_labels(store, 'value_labels', {var: val_dict or {} for var, val_dict in labels.items()})
+        success_count = sum(1 for val_dict in labels.values() if val_dict)
+        error_count = len(labels) - success_count
+        count('autolabel.value_labels_parsed', success_count, **stage_info)
+        count('autolabel.value_labels_empty', error_count, **stage_info)
             
+        if verbose:
             print(f"\n✓ Applied value labels to {success_count} variables\n")
-        else:
-            # No progress bar if verbose is False
-            for _, row in labels_df.iterrows():
-                var = row['variable']
-                val_labels_str = row['value_labels']
-                val_dict = safe_json_parse(val_labels_str)
-                # Always initialize value labels, even if empty
-                df.attrs['registream_labels']['value_labels'][var] = val_dict
     
     return df
 
+def _autolabel_from_source(df, store, source, variables, label_type, domain, lang, verbose):
+    """
+    Apply labels from a label service client or the shared catalog in one batch.
+
+    Returns None if the source has no up-to-date catalog, so the caller reads the CSV.
+    """
+    stage_info = {'domain': domain, 'lang': lang, 'label_type': label_type}
+    if label_type == 'variables':
+        with timer('autolabel.fetch', **stage_info):
+            labels = source.variable_labels(variables, domain=domain, lang=lang)
+        if labels is None:
+            return None
+        count('autolabel.matched_variables', len(labels), **stage_info)
+        if not labels:
+            if verbose:
+                print(f"No matching variables found in the {domain} domain for the specified columns.")
+            return df
+        store['variable_labels'] = labels
+        if verbose:
+            print(f"\n✓ Applied variable labels to {len(labels)} variables\n")
+
+    elif label_type == 'values':
+        with timer('autolabel.fetch', **stage_info):
+            labels = source.value_labels(variables, domain=domain, lang=lang)
+        if labels is None:
+            return None
+        count('autolabel.matched_variables', len(labels), **stage_info)
+        if not labels:
+            if verbose:
+                print(f"No matching variables found in the {domain} domain for the specified columns.")
+            return df
+        _publish_labels(store, 'value_labels', labels)
+        success_count = sum(1 for val_dict in labels.values() if val_dict)
+        count('autolabel.value_labels_parsed', success_count, **stage_info)
+        count('autolabel.value_labels_empty', len(labels) - success_count, **stage_info)
+        if verbose:
+            print(f"\n✓ Applied value labels to {success_count} variables\n")
+
+    return df
+
+def _set_language(df, lang, create=False):
+    """
+    Make `lang` the active label language of df.
+
+    Each loaded language has its own labels in ``attrs['registream_languages']``,
+    and ``attrs['registream_labels']`` is the same dict as the active one, so
+    switching is one assignment and edits apply to the active language.
+    Returns the label store of the language.
+    """
+    with _labels_lock:
+        return _activate_language(df.attrs, lang, create)
+
+
+def _activate_language(attrs, lang, create):
+    languages = attrs.get('registream_languages')
+    if languages is None:
+        if not create:
+            raise ValueError(f"No labels in {lang!r} are loaded. Use df.autolabel(lang=[...]) first.")
+        languages = attrs['registream_languages'] = {}
+        # Labels set before any language was loaded belong to the first one
+        if 'registream_labels' in attrs:
+            languages[lang] = attrs['registream_labels']
+    if lang not in languages:
+        if not create:
+            raise ValueError(f"No labels in {lang!r} are loaded (loaded: {', '.join(languages)}). "
+                             f"Use df.autolabel(lang={lang!r}) first.")
+        languages[lang] = {'variable_labels': {}, 'value_labels': {}}
+    attrs['registream_labels'] = languages[lang]
+    attrs['registream_language'] = lang
+    return languages[lang]
+
+
+def _publish_labels(store, component, labels):
+    """
+    Add labels to the 'variable_labels' or 'value_labels' of a label store.
+
+    The dict is replaced by an updated copy instead of being changed, so a
+    thread reading the labels of the frame never sees it change size.
+    """
+    with _labels_lock:
+        store[component] = {**store[component], **labels}
+
+
+def _share_equal_labels(languages):
+    """
+    Make the languages share equal value label dicts and label strings.
+
+    Codes are the same in every language; labels that do not differ (names,
+    numeric classifications) are then stored once. Dicts are only changed in
+    place to equal values, since they may be shared with the catalog cache.
+    """
+    strings = {}
+    done = set()
+    first_sets = {}
+    for labels in languages.values():
+        variable_labels = labels['variable_labels']
+        for var, label in variable_labels.items():
+            if isinstance(label, str):
+                variable_labels[var] = strings.setdefault(label, label)
+        value_labels = labels['value_labels']
+        for var, val_dict in value_labels.items():
+            other = first_sets.setdefault(var, val_dict)
+            if other is not val_dict and other == val_dict:
+                value_labels[var] = other
+                continue
+            if id(val_dict) in done:
+                continue
+            done.add(id(val_dict))
+            for code, label in val_dict.items():
+                if isinstance(label, str):
+                    val_dict[code] = strings.setdefault(label, label)
+
+
+def _label_stores(attrs):
+    """The active labels and, if several languages are loaded, the labels of each language."""
+    stores = [attrs['registream_labels']]
+    for labels in attrs.get('registream_languages', {}).values():
+        if all(labels is not store for store in stores):
+            stores.append(labels)
+    return stores
+
 # Conditional monkey-patching: Only affect DataFrames with registream_labels
 def _conditional_setitem(self, key, value):
     """
@@ -218,18 +723,8 @@ def _conditional_setitem(self, key, value):
     _original_setitem(self, key, value)
     
     # Only apply label preservation for DataFrames with registream_labels
-    if isinstance(value, pd.Series) and 'registream_labels' in self.attrs:
-        source_col = value.name
-        
-        # Copy variable labels if available
-        if source_col and source_col in self.attrs['registream_labels']['variable_labels']:
-            self.attrs['registream_labels']['variable_labels'][key] = \
-                self.attrs['registream_labels']['variable_labels'][source_col]
-        
-        # Copy value labels if available
-        if source_col and source_col in self.attrs['registream_labels']['value_labels']:
-            self.attrs['registream_labels']['value_labels'][key] = \
-                self.attrs['registream_labels']['value_labels'][source_col]
+    if isinstance(value, pd.Series) and 'registream_labels' in self.attrs and value.name:
+        _copy_column_labels(self, value.name, key)
 
 def _conditional_rename(self, *args, **kwargs):
     """
@@ -264,15 +759,14 @@ def _conditional_rename(self, *args, **kwargs):
     
     # If columns is provided and is a dictionary, update label mappings
     if columns and isinstance(columns, dict):
-        # Update variable labels using comprehension for efficiency
-        result.attrs['registream_labels']['variable_labels'] = {
-            columns.get(k, k): v for k, v in self.attrs['registream_labels']['variable_labels'].items()
-        }
-        
-        # Update value labels using comprehension for efficiency
-        result.attrs['registream_labels']['value_labels'] = {
-            columns.get(k, k): v for k, v in self.attrs['registream_labels']['value_labels'].items()
-        }
+        # In every loaded language (the result's labels are copies of self's).
+        # Renamed dicts replace the old ones, as in _publish_labels.
+        with _labels_lock:
+            for labels in _label_stores(result.attrs):
+                for component in ('variable_labels', 'value_labels'):
+                    labels[component] = {
+                        columns.get(k, k): v for k, v in labels[component].items()
+                    }
     
     return result
 
@@ -284,15 +778,11 @@ pd.DataFrame.rename = _conditional_rename
 def _copy_column_labels(df, source_col, target_col):
     """Copy labels from one column to another if present."""
     if 'registream_labels' in df.attrs:
-        # Copy variable label if exists
-        if source_col in df.attrs['registream_labels']['variable_labels']:
-            df.attrs['registream_labels']['variable_labels'][target_col] = \
-                df.attrs['registream_labels']['variable_labels'][source_col]
-        
-        # Copy value labels if exists
-        if source_col in df.attrs['registream_labels']['value_labels']:
-            df.attrs['registream_labels']['value_labels'][target_col] = \
-                df.attrs['registream_labels']['value_labels'][source_col]
+        with _labels_lock:
+            for labels in _label_stores(df.attrs):
+                for component in ('variable_labels', 'value_labels'):
+                    if source_col in labels[component]:
+                        _publish_labels(labels, component, {target_col: labels[component][source_col]})
     return df
 
 # Function to rename columns while preserving labels
@@ -410,6 +900,10 @@ def set_variable_labels(df, labels, label=None):
     # Initialize the registream_labels attribute if it doesn't exist
     if 'registream_labels' not in df.attrs:
         df.attrs['registream_labels'] = {'variable_labels': {}, 'value_labels': {}}
+    store = df.attrs['registream_labels']
+    current = store['variable_labels']
+    # Collected and published at once (see _publish_labels)
+    updates = {}
 
     # If `labels` is a string, treat it as a single variable assignment
     if isinstance(labels, str):
@@ -418,11 +912,11 @@ def set_variable_labels(df, labels, label=None):
         
         # Handle callable input for single column
         if callable(label):
-            current_label = df.attrs['registream_labels']['variable_labels'].get(labels)
+            current_label = current.get(labels)
             new_label = label(current_label)
-            df.attrs['registream_labels']['variable_labels'][labels] = new_label
+            updates[labels] = new_label
         else:
-            df.attrs['registream_labels']['variable_labels'][labels] = label
+            updates[labels] = label
     
     # If `labels` is a list, apply the same label to all columns in the list
     elif isinstance(labels, list):
@@ -432,25 +926,26 @@ def set_variable_labels(df, labels, label=None):
         for col in labels:
             # Handle callable input for each column in the list
             if callable(label):
-                current_label = df.attrs['registream_labels']['variable_labels'].get(col)
+                current_label = current.get(col)
                 new_label = label(current_label)
-                df.attrs['registream_labels']['variable_labels'][col] = new_label
+                updates[col] = new_label
             else:
-                df.attrs['registream_labels']['variable_labels'][col] = label
+                updates[col] = label
     
     # If `labels` is a dictionary, update multiple columns
     elif isinstance(labels, dict):
         for col, col_label in labels.items():
             # Handle callable input for each column in the dictionary
             if callable(col_label):
-                current_label = df.attrs['registream_labels']['variable_labels'].get(col)
+                current_label = current.get(col)
                 new_label = col_label(current_label)
-                df.attrs['registream_labels']['variable_labels'][col] = new_label
+                updates[col] = new_label
             else:
-                df.attrs['registream_labels']['variable_labels'][col] = col_label
+                updates[col] = col_label
     else:
         raise TypeError("labels must be a string, list, or dictionary.")
 
+    _publish_labels(store, 'variable_labels', updates)
     return df
 
 
@@ -524,6 +1019,10 @@ def set_value_labels(df, columns, value_labels=None, overwrite=False):
     # Ensure the labels structure exists
     if 'registream_labels' not in df.attrs:
         df.attrs['registream_labels'] = {'variable_labels': {}, 'value_labels': {}}
+    store = df.attrs['registream_labels']
+    current = store['value_labels']
+    # Collected and published at once (see _publish_labels)
+    updates = {}
 
     # Handle setting or updating value labels
     if isinstance(columns, str):
@@ -531,10 +1030,10 @@ def set_value_labels(df, columns, value_labels=None, overwrite=False):
             raise ValueError("Must provide `value_labels` when setting for a single column.")
         
         if overwrite:
-            df.attrs['registream_labels']['value_labels'][columns] = value_labels
+            updates[columns] = value_labels
         else:
-            current_labels = df.attrs['registream_labels']['value_labels'].get(columns, {})
-            df.attrs['registream_labels']['value_labels'][columns] = {**current_labels, **value_labels}
+            current_labels = current.get(columns, {})
+            updates[columns] = {**current_labels, **value_labels}
 
     elif isinstance(columns, list):
         if value_labels is None:
@@ -542,26 +1041,27 @@ def set_value_labels(df, columns, value_labels=None, overwrite=False):
         
         for column in columns:
             if overwrite:
-                df.attrs['registream_labels']['value_labels'][column] = value_labels
+                updates[column] = value_labels
             else:
-                current_labels = df.attrs['registream_labels']['value_labels'].get(column, {})
-                df.attrs['registream_labels']['value_labels'][column] = {**current_labels, **value_labels}
+                current_labels = current.get(column, {})
+                updates[column] = {**current_labels, **value_labels}
 
     elif isinstance(columns, dict):
         for column, labels in columns.items():
             if overwrite:
-                df.attrs['registream_labels']['value_labels'][column] = labels
+                updates[column] = labels
             else:
-                current_labels = df.attrs['registream_labels']['value_labels'].get(column, {})
-                df.attrs['registream_labels']['value_labels'][column] = {**current_labels, **labels}
+                current_labels = current.get(column, {})
+                updates[column] = {**current_labels, **labels}
 
     else:
         raise TypeError("`columns` must be a string, list, or a dictionary when setting value labels.")
 
+    _publish_labels(store, 'value_labels', updates)
     return df
 
 # Add a metadata search method to pandas DataFrame
-def meta_search(df, pattern, include_values=False):
+def meta_search(df, pattern, include_values=False, return_df=False):
     """
     Search for variables in metadata (names and labels) using regex pattern.
     
@@ -573,18 +1073,19 @@ def meta_search(df, pattern, include_values=False):
         Regex pattern to search for in variable names and labels
     include_values : bool, default False
         Whether to also search in value labels
+    return_df : bool, default False
+        If True, return the matches as a DataFrame instead of printing them
         
     Returns:
     --------
-    None
-        Prints search results to console
+    None or pandas.DataFrame
+        Prints search results to console, or with ``return_df=True`` returns a
+        DataFrame with columns ``variable``, ``label``, ``name_match``,
+        ``label_match`` and ``value_matches`` (list of "value: label" strings)
     """
     # Compile the regex pattern (case insensitive)
     regex = re.compile(pattern, re.IGNORECASE)
     
-    # Create a list to store matching variables
-    matches = []
-    
     # Check if the DataFrame has been labeled
     has_labels = 'registream_labels' in df.attrs
     
@@ -595,33 +1096,52 @@ def meta_search(df, pattern, include_values=False):
         variable_labels = df.attrs['registream_labels']['variable_labels']
         value_labels = df.attrs['registream_labels']['value_labels']
     
-    # Search in all columns
-    for col in df.columns:
-        # Check for match in variable name
-        name_match = regex.search(col)
-        
-        # Check for match in variable label (if available)
-        label_match = None
-        var_label = variable_labels.get(col, '')
-        if var_label:
-            label_match = regex.search(str(var_label))
-        
-        # Check for value label matches if requested
-        value_matches = []
-        if include_values and col in value_labels:
-            for val, val_label in value_labels[col].items():
-                if regex.search(str(val_label)):
-                    value_matches.append(f"{val}: {val_label}")
-        
-        # If any match is found, add to results
-        if name_match or label_match or value_matches:
-            matches.append({
-                'variable': col,
-                'label': var_label,
-                'name_match': bool(name_match),
-                'label_match': bool(label_match),
-                'value_matches': value_matches
-            })
+    # Precompute string columns for names and labels, aligned with df.columns
+    columns = list(df.columns)
+    names = pd.Series(columns, dtype=object).astype(str)
+    labels = pd.Series(variable_labels, dtype=object).reindex(columns).reset_index(drop=True)
+    labels = labels.where(labels.notna(), '')
+    has_label = labels.astype(bool).to_numpy()
+    
+    # Vectorized matching over all columns at once
+    name_match = names.str.contains(pattern, flags=re.IGNORECASE, regex=True).to_numpy(dtype=bool)
+    label_match = labels.astype(str).str.contains(pattern, flags=re.IGNORECASE, regex=True).to_numpy(dtype=bool)
+    label_match = label_match & has_label
+    
+    # Flatten value labels into one string column (position of owning column, value, label)
+    value_matches = {}
+    if include_values and value_labels:
+        positions, codes, val_texts = [], [], []
+        for pos, col in enumerate(columns):
+            val_dict = value_labels.get(col)
+            if val_dict:
+                positions.extend([pos] * len(val_dict))
+                codes.extend(val_dict.keys())
+                val_texts.extend(val_dict.values())
+        if val_texts:
+            flat = pd.DataFrame({'pos': positions, 'code': codes,
+                                 'label': pd.Series(val_texts, dtype=object).astype(str)})
+            flat = flat[flat['label'].str.contains(pattern, flags=re.IGNORECASE, regex=True)]
+            # Only the matching value labels are formatted
+            for pos, code, val_label in zip(flat['pos'], flat['code'], flat['label']):
+                value_matches.setdefault(pos, []).append(f"{code}: {val_label}")
+    
+    # Collect the matching variables
+    hits = name_match | label_match
+    hits[list(value_matches)] = True
+    matches = []
+    for pos in np.flatnonzero(hits):
+        matches.append({
+            'variable': columns[pos],
+            'label': labels.iat[pos],
+            'name_match': bool(name_match[pos]),
+            'label_match': bool(label_match[pos]),
+            'value_matches': value_matches.get(pos, [])
+        })
+    
+    if return_df:
+        return pd.DataFrame(matches, columns=['variable', 'label', 'name_match',
+                                              'label_match', 'value_matches'])
     
     # Print results
     if matches:
@@ -683,132 +1203,46 @@ class AutoLabelAccessor:
     def _apply_seaborn_monkeypatch(self):
         """
         Apply a monkeypatch to make standard Seaborn functions automatically apply labels.
-        This happens only when this accessor's methods are called.
+        This happens only when this accessor's methods are called. Seaborn itself is
+        patched by an import hook as soon as the user imports it.
         """
-        try:            
-            # Only apply the monkeypatch once per class
-            if not hasattr(self.__class__, '_monkeypatched'):
-                self.__class__._monkeypatched = True
-                
-                # Save original plot functions
-                original_plot_functions = {}
-                
-                # Functions to patch - include all common plotting functions
-                functions_to_patch = ['scatterplot', 'lineplot', 'barplot', 'boxplot', 
-                                    'violinplot', 'stripplot', 'swarmplot', 'countplot',
-                                    'histplot', 'kdeplot', 'ecdfplot', 'heatmap',
-                                    'relplot', 'lmplot', 'regplot', 'residplot']
-                
-                # Also patch pandas plot method
-                pd_plot = pd.DataFrame.plot
-                
-                @wraps(pd_plot)
-                def wrapped_pd_plot(df, *args, **kwargs):
-                    # Check if it was called through a labeled accessor
-                    if hasattr(df, '_is_labeled_accessor_call') and df._is_labeled_accessor_call:
-                        # Get the accessor that called this method
-                        accessor = df._current_accessor
-                        
-                        # Call the original plotting method
-                        ax = pd_plot(df, *args, **kwargs)
-                        
-                        # Apply axis labels after plotting
-                        x = kwargs.get('x', None)
-                        y = kwargs.get('y', None)
-                        
-                        if hasattr(ax, 'set_xlabel') and x in accessor.variable_labels:
-                            ax.set_xlabel(accessor.variable_labels[x])
-                        
-                        if hasattr(ax, 'set_ylabel') and y in accessor.variable_labels:
-                            if isinstance(y, str) and y in accessor.variable_labels:
-                                ax.set_ylabel(accessor.variable_labels[y])
-                        
-                        return ax
-                    else:
-                        # Regular DataFrame, call the original method
-                        return pd_plot(df, *args, **kwargs)
-                
-                # Patch pandas plot method
-                pd.DataFrame.plot = wrapped_pd_plot
-                
-                for func_name in functions_to_patch:
-                    if hasattr(sns, func_name):
-                        original_func = getattr(sns, func_name)
-                        original_plot_functions[func_name] = original_func
-                        
-                        @wraps(original_func)
-                        def wrapped_func(func_name=func_name, *args, **kwargs):
-                            orig_func = original_plot_functions[func_name]
-                            data = kwargs.get('data', None)
-                            
-                            # Check if we're given a labeled accessor
-                            if data is not None and hasattr(data, '_df') and isinstance(data, AutoLabelAccessor):
-                                # Instead of replacing column names, we'll use the original DataFrame
-                                # and set up a post-plot function to update axis labels
-                                labels_info = {
-                                    'variable_labels': data.variable_labels,
-                                    'value_labels': data.value_labels
-                                }
-                                
-                                # Get axis parameters
-                                x_param = kwargs.get('x', None)
-                                y_param = kwargs.get('y', None)
-                                hue_param = kwargs.get('hue', None)
-
-                                # Create a copy of the DataFrame for plotting
-                                df_with_values = data._df.copy()
-                                
-                                # Smart handling of value labels - only apply to categorical variables
-                                # For x-axis in scatter/line plots, often we want to keep the original values
-                                for col, val_dict in labels_info['value_labels'].items():
-                                    # Skip the x-axis variable for scatter/line plots to avoid "Year XXXX" labels
-                                    if col == x_param and func_name in ['scatterplot', 'lineplot']:
-                                        continue
-                                    # Only apply value labels to hue variable for better category display
-                                    if col == hue_param or (col != x_param and col != y_param):
-                                        if col in df_with_values.columns:
-                                            df_with_values[col] = df_with_values[col].astype(str).replace(val_dict)
-                                
-                                # Replace the accessor with the prepared DataFrame
-                                kwargs['data'] = df_with_values
-                                
-                                # Call the original function
-                                ax = orig_func(*args, **kwargs)
-                                
-                                # After plotting, apply axis labels based on the parameters
-                                # Update x-axis label if applicable
-                                if x_param and x_param in labels_info['variable_labels']:
-                                    ax.set_xlabel(labels_info['variable_labels'][x_param])
-                                
-                                # Update y-axis label if applicable
-                                if y_param and y_param in labels_info['variable_labels']:
-                                    ax.set_ylabel(labels_info['variable_labels'][y_param])
-                                
-                                # Update hue legend if applicable
-                                if hue_param and hue_param in labels_info['variable_labels']:
-                                    legend = ax.get_legend()
-                                    if legend:
-                                        # Update legend title
-                                        legend.set_title(labels_info['variable_labels'][hue_param])
-                                        
-                                        # Apply value labels to legend text if available
-                                        if hue_param in labels_info['value_labels']:
-                                            value_dict = labels_info['value_labels'][hue_param]
-                                            for text in legend.get_texts():
-                                                original_text = text.get_text()
-                                                if original_text in value_dict:
-                                                    text.set_text(value_dict[original_text])
-                                
-                                return ax
-                            else:
-                                # If it's not a labeled accessor, use the original function
-                                return orig_func(*args, **kwargs)
-                        
-                        # Replace the original Seaborn function
-                        setattr(sns, func_name, wrapped_func)
-        except ImportError:
-            # Seaborn not available, skip monkeypatching
-            pass
+        # Patch pandas plotting once per class (needs no extra imports)
+        if not hasattr(self.__class__, '_pd_plot_patched') and _claim_patch(self.__class__, '_pd_plot_patched'):
+            
+            pd_plot = pd.DataFrame.plot
+            
+            @wraps(pd_plot)
+            def wrapped_pd_plot(df, *args, **kwargs):
+                # Check if it was called through a labeled accessor
+                if hasattr(df, '_is_labeled_accessor_call') and df._is_labeled_accessor_call:
+                    # Get the accessor that called this method
+                    accessor = df._current_accessor
+                    
+                    # Call the original plotting method
+                    ax = pd_plot(df, *args, **kwargs)
+                    
+                    # Apply axis labels after plotting
+                    x = kwargs.get('x', None)
+                    y = kwargs.get('y', None)
+                    
+                    if hasattr(ax, 'set_xlabel') and x in accessor.variable_labels:
+                        ax.set_xlabel(accessor.variable_labels[x])
+                    
+                    if hasattr(ax, 'set_ylabel') and y in accessor.variable_labels:
+                        if isinstance(y, str) and y in accessor.variable_labels:
+                            ax.set_ylabel(accessor.variable_labels[y])
+                    
+                    return ax
+                else:
+                    # Regular DataFrame, call the original method
+                    return pd_plot(df, *args, **kwargs)
+            
+            # Patch pandas plot method
+            pd.DataFrame.plot = wrapped_pd_plot
+        
+        # Seaborn is patched when it is imported (see _install_seaborn_patch)
+        if 'seaborn' in sys.modules:
+            _patch_seaborn(sys.modules['seaborn'])
     
     @property
     def display_mode(self):
@@ -839,6 +1273,33 @@ class AutoLabelAccessor:
         """Set display mode to show only variable labels in column headers."""
         self.display_mode = 'variable_only'
         return self
+
+    @property
+    def language(self):
+        """The language of the active labels, or None unless several languages were loaded."""
+        return self._df.attrs.get('registream_language')
+
+    @property
+    def languages(self):
+        """The languages whose labels are loaded."""
+        return list(self._df.attrs.get('registream_languages', {}))
+
+    def set_language(self, lang):
+        """
+        Switch the labels to another loaded language, without reading any files.
+
+        Parameters:
+        -----------
+        lang : str
+            A language loaded with ``df.autolabel(lang=[...])``, e.g. 'swe'
+
+        Returns:
+        --------
+        AutoLabelAccessor
+            The accessor, for chaining (e.g. ``df.lab.set_language('swe').head()``)
+        """
+        _set_language(self._df, lang)
+        return self
     
     def _apply_value_labels(self, df=None):
         """Return a copy of the DataFrame with value labels applied to categorical variables."""
@@ -849,7 +1310,7 @@ class AutoLabelAccessor:
         if self._display_mode == 'both':
             for col, val_dict in self.value_labels.items():
                 if col in df_copy.columns and val_dict:  # Only apply if value labels exist
-                    df_copy[col] = df_copy[col].astype(str).replace(val_dict)
+                    df_copy[col] = _code_strings(df_copy[col]).replace(val_dict)
         
         # Always apply variable labels to column names
         if self.variable_labels:
@@ -857,13 +1318,42 @@ class AutoLabelAccessor:
             
         return df_copy
     
+    def _render_truncated(self, render):
+        """
+        Render the labeled frame the way pandas would, decoding only the visible rows.
+        
+        Follows pandas' `display.max_rows` / `display.min_rows` semantics: frames
+        longer than `max_rows` show `min_rows` rows split between head and tail.
+        Only those rows (plus one on each side, so pandas still draws the
+        truncation marker) are copied and labeled.
+        """
+        df = self._df
+        max_rows = pd.get_option('display.max_rows')
+        if not max_rows or len(df) <= max_rows:
+            return render(self._apply_value_labels())
+        
+        min_rows = pd.get_option('display.min_rows')
+        shown = min(min_rows, max_rows) if min_rows else max_rows
+        edge = shown // 2 + 1
+        window = pd.concat([df.iloc[:edge], df.iloc[-edge:]])
+        
+        with pd.option_context('display.max_rows', len(window) - 1, 'display.min_rows', shown):
+            text = render(self._apply_value_labels(window))
+        
+        # The dimensions footer must describe the whole frame, not the window
+        marker = f"{len(window)} rows"
+        pos = text.rfind(marker)
+        if pos != -1:
+            text = text[:pos] + f"{len(df)} rows" + text[pos + len(marker):]
+        return text
+    
     def __repr__(self):
         """Return string representation with labels applied according to display mode."""
-        return self._apply_value_labels().__repr__()
+        return self._render_truncated(repr)
         
     def _repr_html_(self):
         """Return HTML representation with labels applied according to display mode."""
-        return self._apply_value_labels()._repr_html_()
+        return self._render_truncated(lambda df: df._repr_html_())
     
     def head(self, n=5):
         """Return first n rows with labels applied according to display mode."""
@@ -923,7 +1413,7 @@ class AutoLabelAccessor:
             series = self._df[attr].copy()
             series.name = self.variable_labels.get(attr, attr)
             if attr in self.value_labels:
-                return series.astype(str).replace(self.value_labels[attr])
+                return _code_strings(series).replace(self.value_labels[attr])
             return series
         else:
             # Handle special attributes needed by seaborn and pandas
@@ -975,7 +1465,7 @@ class AutoLabelAccessor:
                 df_with_values = self._df.copy()
                 for col, val_dict in self.value_labels.items():
                     if col in df_with_values.columns:
-                        df_with_values[col] = df_with_values[col].astype(str).replace(val_dict)
+                        df_with_values[col] = _code_strings(df_with_values[col]).replace(val_dict)
                 return df_with_values[key]
             else:
                 return self._df[key]
@@ -1005,6 +1495,191 @@ class AutoLabelAccessor:
         """Return the original column names for compatibility with seaborn."""
         return self._df.columns
 
+    def value_counts(self, columns=None, normalize=False, sort=True, ascending=False, dropna=True):
+        """
+        Count the rows of each value, with value and variable labels.
+
+        Counts the raw codes and labels only the result, instead of decoding
+        every row. Codes that share a label are counted together.
+
+        Parameters:
+        -----------
+        columns : str, list or None, default None
+            A column, or the columns whose combinations to count (None for all)
+        normalize : bool, default False
+            Return proportions instead of counts
+        sort : bool, default True
+            Sort by count
+        ascending : bool, default False
+            Sort in ascending order
+        dropna : bool, default True
+            Do not count missing values
+
+        Returns:
+        --------
+        pandas.Series
+            The counts, indexed by value label (one level per column) and
+            named after the variable labels
+        """
+        df = self._df
+        single = isinstance(columns, str)
+        columns = [columns] if single else list(df.columns if columns is None else columns)
+        keys, pending = _label_keys(df, columns, self.value_labels)
+        options = dict(normalize=normalize, sort=sort, ascending=ascending, dropna=dropna)
+        if single:
+            counts = keys[0].value_counts(**options)
+        elif any(isinstance(key.dtype, pd.CategoricalDtype) for key in keys):
+            # DataFrame.value_counts would count every combination of categories,
+            # observed or not, so decoded keys are counted with a groupby
+            frame = pd.DataFrame(dict(zip(columns, keys)), copy=False)
+            counts = frame.groupby(columns, observed=True, dropna=dropna).size()
+            if normalize:
+                counts = counts / counts.sum()
+            if sort:
+                counts = counts.sort_values(ascending=ascending, kind='stable')
+            counts.name = 'proportion' if normalize else 'count'
+        else:
+            counts = pd.DataFrame(dict(zip(columns, keys)), copy=False).value_counts(**options)
+        counts.index = _label_index(counts.index, self.value_labels, self.variable_labels, pending)
+        return counts
+
+    def crosstab(self, index, columns, values=None, aggfunc=None, **kwargs):
+        """
+        Cross-tabulate columns, with value and variable labels.
+
+        Tabulates the raw codes with ``pandas.crosstab`` and labels only the
+        rows and columns of the table.
+
+        Parameters:
+        -----------
+        index : str or list
+            Column(s) whose values form the rows
+        columns : str or list
+            Column(s) whose values form the columns
+        values : str, optional
+            Column to aggregate with ``aggfunc`` instead of counting rows
+        aggfunc : function or str, optional
+            How to aggregate ``values``
+        **kwargs
+            Passed to ``pandas.crosstab`` (e.g. ``margins``, ``normalize``)
+
+        Returns:
+        --------
+        pandas.DataFrame
+            The table, labeled
+        """
+        df = self._df
+        rows = [index] if isinstance(index, str) else list(index)
+        cols = [columns] if isinstance(columns, str) else list(columns)
+        row_keys, row_pending = _label_keys(df, rows, self.value_labels)
+        col_keys, col_pending = _label_keys(df, cols, self.value_labels)
+        table = pd.crosstab(row_keys, col_keys, values=None if values is None else df[values],
+                            aggfunc=aggfunc, **kwargs)
+        table.index = _label_index(table.index, self.value_labels, self.variable_labels, row_pending)
+        table.columns = _label_index(table.columns, self.value_labels, self.variable_labels, col_pending)
+        return table
+
+    def groupby(self, by, **kwargs):
+        """
+        Group on the raw codes and label the results.
+
+        ``df.lab.groupby('kon').agg(...)`` (or ``.mean()``, ``.size()``, ...)
+        aggregates the codes like ``DataFrame.groupby`` and then applies value
+        labels to the group keys and variable labels to the columns of the
+        result, so only the result rows are labeled.
+
+        Parameters:
+        -----------
+        by : str or list
+            Column(s) to group by
+        **kwargs
+            Passed to ``DataFrame.groupby``
+
+        Returns:
+        --------
+        A groupby object whose methods return labeled results
+        """
+        return _LabeledGroupBy(self, by, kwargs)
+
+    def isin(self, column, labels):
+        """
+        Return a boolean mask of the rows whose value label is one of the labels.
+
+        Gives the same result as ``df.lab[column].isin(labels)``, but the labels
+        are translated to their codes and the raw column is compared, so no
+        rows are decoded.
+
+        Parameters:
+        -----------
+        column : str
+            The column to test
+        labels : str or list
+            Value labels (as displayed by ``df.lab``) to look for
+
+        Returns:
+        --------
+        pandas.Series
+            True for the rows whose value has one of the labels
+        """
+        series = self._df[column]
+        if isinstance(labels, str):
+            labels = [labels]
+        val_dict = self.value_labels.get(column)
+        if not val_dict:
+            return series.isin(labels)
+        return series.isin(_label_codes(series, val_dict, labels))
+
+    def query(self, expr, **kwargs):
+        """
+        Filter rows with a pandas query written in terms of value labels.
+
+        Comparisons of a labeled column with label strings (``==``, ``!=``,
+        ``in`` and ``not in``) are translated to comparisons with the codes,
+        and the query runs on the raw data, so it costs what the same
+        ``DataFrame.query`` on codes costs. Comparisons with numbers still
+        compare codes.
+
+        Parameters:
+        -----------
+        expr : str
+            The query, e.g. ``'kon == "Woman" and jurform in ["Aktiebolag"]'``
+        **kwargs
+            Passed to ``DataFrame.query``
+
+        Returns:
+        --------
+        pandas.DataFrame
+            The matching rows, with their labels
+        """
+        # Local variables (@name) are looked up in the caller's frame
+        kwargs['level'] = kwargs.get('level', 0) + 1
+        return self._df.query(_translate_query(expr, self._df, self.value_labels), **kwargs)
+
+    def memory_usage(self, deep=True, others=()):
+        """
+        Report the memory used by the labels of the DataFrame.
+
+        Parameters:
+        -----------
+        deep : bool, default True
+            Include the label strings (and value codes), not only the dicts
+        others : list of pandas.DataFrame, default ()
+            Other labeled frames; labels they hold as well count as shared
+
+        Returns:
+        --------
+        pandas.DataFrame
+            Bytes used by the ``labels`` dicts of each language, the
+            ``variable_labels`` dict, the ``value_labels`` dicts and the
+            ``strings`` (plus a ``total`` row), with ``shared_bytes`` the part
+            that is the same objects as the value labels cached from the
+            catalog or the labels of ``others``, and ``objects`` the number of
+            distinct objects. Objects referenced several times are counted
+            once. Compare with ``df.memory_usage(deep=True).sum()`` for the
+            data itself.
+        """
+        return _label_memory_usage(self._df.attrs, deep=deep, others=others)
+
     def autolabel(self, label_type='variables', domain='scb', lang='eng', variables="*", verbose=True):
         """
         Apply variable and value labels directly from the accessor.
@@ -1013,10 +1688,11 @@ class AutoLabelAccessor:
         -----------
         label_type : str, default 'variables'
             Type of labels to apply ('variables' or 'values')
-        domain : str, default 'scb'
-            The domain to search for variables
-        lang : str, default 'eng'
-            Language for variable descriptions ('eng' or 'swe')
+        domain : str or list, default 'scb'
+            The domain to search for variables, or a list of domains in order of precedence
+        lang : str or list, default 'eng'
+            Language for variable descriptions ('eng' or 'swe'), or a list of
+            languages to load (see ``set_language``)
         variables : list or str, default "*"
             List of variables to label or "*" for all
         verbose : bool, default True
@@ -1026,4 +1702,177 @@ class AutoLabelAccessor:
         autolabel(self._df, label_type, domain, lang, variables, verbose)
         return self
 
+    def to_stata(self, path, chunksize=100_000, suffix='_lbl', data_label=None):
+        """
+        Write the DataFrame to a Stata .dta file with native variable and value labels.
+
+        Rows are converted and written in chunks, so no labeled copy of the
+        data is made. Numeric columns carry their value labels directly; string
+        columns with value labels get an encoded copy named ``<column><suffix>``.
+
+        Parameters:
+        -----------
+        path : str
+            Output file path
+        chunksize : int, default 100000
+            Number of rows converted and written at a time
+        suffix : str or None, default '_lbl'
+            Suffix of the encoded copy of labeled string columns. None replaces
+            the string column with its encoded version
+        data_label : str, optional
+            Dataset label (at most 80 characters)
+
+        Returns:
+        --------
+        str
+            The path of the written file
+        """
+        from .stata import write_stata
+        return write_stata(self._df, path, chunksize=chunksize, suffix=suffix, data_label=data_label)
+
+    def to_parquet(self, path, index=None, **kwargs):
+        """
+        Write the DataFrame to Parquet with its labels stored in the file metadata.
+
+        Read it back with ``registream.read_parquet`` to restore the labels
+        without calling ``autolabel`` again. Requires pyarrow.
+
+        Parameters:
+        -----------
+        path : str
+            Output file path
+        index : bool, optional
+            Whether to store the index, as in ``DataFrame.to_parquet``
+        **kwargs :
+            Passed to ``pyarrow.parquet.write_table`` (e.g. ``compression``)
+
+        Returns:
+        --------
+        str
+            The path of the written file
+        """
+        from .parquet import write_parquet
+        return write_parquet(self._df, path, index=index, **kwargs)
+
+def _claim_patch(cls, flag):
+    """Set a class-level patch flag, returning True for the one thread that set it."""
+    with _patch_lock:
+        if getattr(cls, flag, False):
+            return False
+        setattr(cls, flag, True)
+        return True
+
+def _patch_seaborn(sns):
+    """
+    Wrap common Seaborn plotting functions so they accept a labeled accessor
+    (``data=df.lab``) and apply variable and value labels to the plot.
+    Runs at most once per process.
+    """
+    if not _claim_patch(AutoLabelAccessor, '_monkeypatched'):
+        return
+    
+    # Save original plot functions
+    original_plot_functions = {}
+    
+    # Functions to patch - include all common plotting functions
+    functions_to_patch = ['scatterplot', 'lineplot', 'barplot', 'boxplot', 
+                        'violinplot', 'stripplot', 'swarmplot', 'countplot',
+                        'histplot', 'kdeplot', 'ecdfplot', 'heatmap',
+                        'relplot', 'lmplot', 'regplot', 'residplot']
+    
+    for func_name in functions_to_patch:
+        if hasattr(sns, func_name):
+            original_func = getattr(sns, func_name)
+            original_plot_functions[func_name] = original_func
+            
+            @wraps(original_func)
+            def wrapped_func(func_name=func_name, *args, **kwargs):
+                orig_func = original_plot_functions[func_name]
+                data = kwargs.get('data', None)
+                
+                # Check if we're given a labeled accessor
+                if data is not None and hasattr(data, '_df') and isinstance(data, AutoLabelAccessor):
+                    # Instead of replacing column names, we'll use the original DataFrame
+                    # and set up a post-plot function to update axis labels
+                    labels_info = {
+                        'variable_labels': data.variable_labels,
+                        'value_labels': data.value_labels
+                    }
+                    
+                    # Get axis parameters
+                    x_param = kwargs.get('x', None)
+                    y_param = kwargs.get('y', None)
+                    hue_param = kwargs.get('hue', None)
+                    
+                    # Decode only the columns referenced by the plot, without copying the frame
+                    df_with_values = _prepare_plot_data(data, func_name, kwargs)
+                    
+                    # Replace the accessor with the prepared DataFrame
+                    kwargs['data'] = df_with_values
+                    
+                    # Call the original function
+                    ax = orig_func(*args, **kwargs)
+                    
+                    # After plotting, apply axis labels based on the parameters
+                    # Update x-axis label if applicable
+                    if x_param and x_param in labels_info['variable_labels']:
+                        ax.set_xlabel(labels_info['variable_labels'][x_param])
+                    
+                    # Update y-axis label if applicable
+                    if y_param and y_param in labels_info['variable_labels']:
+                        ax.set_ylabel(labels_info['variable_labels'][y_param])
+                    
+                    # Update hue legend if applicable
+                    if hue_param and hue_param in labels_info['variable_labels']:
+                        legend = ax.get_legend()
+                        if legend:
+                            # Update legend title
+                            legend.set_title(labels_info['variable_labels'][hue_param])
+                            
+                            # Apply value labels to legend text if available
+                            if hue_param in labels_info['value_labels']:
+                                value_dict = labels_info['value_labels'][hue_param]
+                                for text in legend.get_texts():
+                                    original_text = text.get_text()
+                                    if original_text in value_dict:
+                                        text.set_text(value_dict[original_text])
+                    
+                    return ax
+                else:
+                    # If it's not a labeled accessor, use the original function
+                    return orig_func(*args, **kwargs)
+            
+            # Replace the original Seaborn function
+            setattr(sns, func_name, wrapped_func)
+
+class _SeabornImportHook:
+    """
+    Import hook that patches Seaborn right after it is imported.
+    
+    This keeps `import registream` from importing Seaborn itself, while plots
+    like ``sns.scatterplot(data=df.lab, ...)`` still work on the first call.
+    """
+    def find_spec(self, fullname, path, target=None):
+        if fullname != 'seaborn':
+            return None
+        # Let the regular finders locate seaborn, then hook into its loading
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            exec_module = spec.loader.exec_module
+            
+            def exec_and_patch(module):
+                exec_module(module)
+                _patch_seaborn(module)
+            
+            spec.loader.exec_module = exec_and_patch
+        return spec
+
+def _install_seaborn_patch():
+    """Patch Seaborn now if it is already imported, otherwise as soon as it is."""
+    if 'seaborn' in sys.modules:
+        _patch_seaborn(sys.modules['seaborn'])
+    elif not any(isinstance(finder, _SeabornImportHook) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _SeabornImportHook())
 
+_install_seaborn_patch()
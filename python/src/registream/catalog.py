@@ -0,0 +1,211 @@
+import os
+import pandas as pd
+from .label_fetcher import LabelFetcher
+from .instrumentation import timer
+from .schema import (SCHEMA_V1, ValueLabelSets, detect_schema, label_set_ids,
+                     normalize_variables)
+from .store import LabelStore
+
+# Loaded catalogs keyed by (domain, lang, label_type). Each entry remembers the
+# file signature it was built from so a re-downloaded file is picked up.
+_catalog_cache = LabelStore('catalog')
+# Parsed value label sets keyed by (domain, lang), with the catalog they belong to
+_label_sets = LabelStore('catalog.value_label_sets')
+# Merged multi-domain catalogs keyed by (domains, lang, label_type), with their parts
+_merged_cache = LabelStore('catalog')
+
+
+def _file_signature(path):
+    """Return a cheap signature (mtime, size) identifying a file's contents."""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_catalog(domain='scb', lang='eng', label_type='variables'):
+    """
+    Load a label catalog as a DataFrame indexed by variable name.
+
+    The catalog is read once and cached in memory; later calls are served from
+    the cache until the underlying CSV file changes on disk. Threads that ask
+    for a catalog while it is being read wait for that read.
+
+    Parameters:
+    -----------
+    domain : str or list, default 'scb'
+        The domain to load labels for. With a list such as ['custom', 'scb']
+        the catalogs are merged and each variable comes from the first domain
+        that has it
+    lang : str, default 'eng'
+        Language of the labels ('eng' or 'swe')
+    label_type : str, default 'variables'
+        Type of labels to load ('variables' or 'values')
+
+    Returns:
+    --------
+    pandas.DataFrame
+        The catalog with a unique, hashed index on the variable name. Merged
+        catalogs have a ``domain`` column with the domain of each variable
+    """
+    domains = _domains(domain)
+    if len(domains) > 1:
+        return _load_merged_catalog(domains, lang, label_type)
+    domain = domains[0]
+
+    fetcher = LabelFetcher(domain=domain, lang=lang, label_type=label_type)
+    csv_path = fetcher.ensure_labels()
+    signature = _file_signature(csv_path)
+
+    def current(cached):
+        # Schema 1.0 value labels are mapped to variables through the variables catalog
+        return cached[0] == (csv_path, signature) and (
+            cached[2] is None or cached[2] is load_catalog(domain, lang, 'variables'))
+
+    def read():
+        variables = None
+        with timer('catalog.read_csv', domain=domain, lang=lang, label_type=label_type):
+            catalog = pd.read_csv(csv_path, delimiter=',', encoding='utf-8', on_bad_lines='skip')
+            catalog.columns = catalog.columns.str.strip()
+            if detect_schema(catalog.columns) == SCHEMA_V1 and label_type == 'values':
+                variables = load_catalog(domain, lang, 'variables')
+                catalog = _variable_value_labels(catalog, variables)
+            else:
+                catalog = normalize_variables(catalog)
+                catalog['variable'] = catalog['variable'].str.strip()
+
+                # A unique index lets lookups use the hash table instead of boolean scans
+                catalog = catalog.drop_duplicates(subset=['variable'], keep='first').set_index('variable')
+        return ((csv_path, signature), catalog, variables)
+
+    return _catalog_cache.get_or_load((domain, lang, label_type), read, current)[1]
+
+
+def _domains(domain):
+    """Return a domain name or a list of them as a tuple in precedence order."""
+    if isinstance(domain, str):
+        return (domain,)
+    domains = tuple(dict.fromkeys(domain))
+    if not domains:
+        raise ValueError("domain must be a domain name or a non-empty list of domain names")
+    return domains
+
+
+def _load_merged_catalog(domains, lang, label_type):
+    """Merge the catalogs of several domains, keeping the first domain's row for each variable."""
+    parts = [load_catalog(domain, lang, label_type) for domain in domains]
+
+    def merge():
+        with timer('catalog.merge', domain=','.join(domains), lang=lang, label_type=label_type):
+            merged = pd.concat([part.assign(domain=domain) for domain, part in zip(domains, parts)])
+            merged = merged[~merged.index.duplicated(keep='first')]
+        return (parts, merged)
+
+    return _merged_cache.get_or_load((domains, lang, label_type), merge,
+                                     lambda cached: all(a is b for a, b in zip(cached[0], parts)))[1]
+
+
+def _variable_value_labels(sets, variables):
+    """
+    Map schema 1.0 value label sets (one row per value_label_id) to variables.
+
+    Returns the legacy layout: indexed by variable with the set's JSON text in
+    ``value_labels``, plus its ``value_label_id``.
+    """
+    texts = dict(zip(label_set_ids(sets['value_label_id']), sets['value_labels_json']))
+    if 'value_label_id' not in variables.columns:
+        ids = []
+    else:
+        ids = label_set_ids(variables['value_label_id'])
+    linked = [(var, i) for var, i in zip(variables.index, ids) if i is not None]
+    return pd.DataFrame(
+        {
+            'value_label_id': [i for _, i in linked],
+            'value_labels': [texts.get(i) for _, i in linked],
+        },
+        index=pd.Index([var for var, _ in linked], name='variable'),
+    )
+
+
+def load_value_label_sets(domain='scb', lang='eng'):
+    """
+    Return the ValueLabelSets of a catalog, which parses each set once.
+
+    The sets are rebuilt when the value labels catalog is reloaded.
+    """
+    values = load_catalog(domain=domain, lang=lang, label_type='values')
+
+    def build():
+        if 'value_label_id' in values.columns:
+            return (values, ValueLabelSets(dict(zip(values['value_label_id'].tolist(),
+                                                    values['value_labels'].tolist()))))
+        return (values, ValueLabelSets())
+
+    return _label_sets.get_or_load((domain, lang), build, lambda cached: cached[0] is values)[1]
+
+
+def _cached_value_label_dicts():
+    """Return the value label dicts parsed so far from the catalogs held in memory or shared."""
+    from .shared import _attached
+    parsed = [val_dict for _, sets in _label_sets.values() for val_dict in sets.parsed()]
+    return parsed + [val_dict for _, shared in list(_attached.values())
+                     for val_dict in shared.value_label_sets.parsed()]
+
+
+def value_labels_for(variables, domain='scb', lang='eng', progress=False):
+    """
+    Return the parsed value labels of the variables found in the value labels catalog.
+
+    Variables sharing a value label set get the same dict object.
+
+    Parameters:
+    -----------
+    variables : list
+        Variable names
+    domain : str or list, default 'scb'
+        The domain, or domains in order of precedence, to load labels for
+    lang : str, default 'eng'
+        Language of the labels ('eng' or 'swe')
+    progress : bool, default False
+        Show a progress bar while parsing
+
+    Returns:
+    --------
+    dict
+        ``{variable: {code: label}}``, with None for variables listed in the
+        catalog without a label set. Variables not in the catalog are left out.
+    """
+    domains = _domains(domain)
+    if len(domains) > 1:
+        # Each variable's set comes from (and is shared within) the domain that has it
+        merged = load_catalog(domains, lang, 'values')
+        found = [var for var in dict.fromkeys(variables) if var in merged.index]
+        owners = merged['domain'].reindex(found).tolist()
+        result = {}
+        for domain in domains:
+            group = [var for var, owner in zip(found, owners) if owner == domain]
+            if group:
+                result.update(value_labels_for(group, domain, lang, progress))
+        return {var: result[var] for var in found if var in result}
+    domain = domains[0]
+
+    values = load_catalog(domain=domain, lang=lang, label_type='values')
+    if 'value_labels' not in values.columns:
+        return {}
+    sets = load_value_label_sets(domain, lang)
+    found = [var for var in dict.fromkeys(variables) if var in values.index]
+    rows = values.loc[found]
+    if 'value_label_id' in values.columns:
+        pairs, parse = zip(found, rows['value_label_id'].tolist()), sets.get
+    else:
+        pairs, parse = zip(found, rows['value_labels'].tolist()), sets.parse
+    if progress:
+        # Imported here to keep `import registream` fast
+        from tqdm import tqdm
+        pairs = tqdm(pairs, total=len(found), desc="Parsing value labels")
+    return {var: parse(raw) if isinstance(raw, (str, int)) else None for var, raw in pairs}
+
+
+def clear_catalog_cache():
+    """Drop all catalogs held in memory."""
+    _catalog_cache.clear()
+    _label_sets.clear()
+    _merged_cache.clear()
@@ -0,0 +1,29 @@
+import argparse
+
+from .server import DEFAULT_HOST, DEFAULT_PORT
+
+
+def main(argv=None):
+    """Entry point of the ``registream`` command."""
+    parser = argparse.ArgumentParser(prog='registream', description="RegiStream command line tools")
+    commands = parser.add_subparsers(dest='command')
+
+    serve_parser = commands.add_parser('serve', help="Run the local label service")
+    serve_parser.add_argument('--host', default=DEFAULT_HOST, help="Loopback address to listen on")
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    serve_parser.add_argument('--socket', dest='socket_path', help="Listen on this Unix socket instead")
+    serve_parser.add_argument('--domain', default='scb', help="Domain to load at startup")
+    serve_parser.add_argument('--lang', action='append', dest='langs',
+                              help="Language to load at startup (repeatable; default eng and swe)")
+    serve_parser.add_argument('--no-preload', dest='preload', action='store_false',
+                              help="Load catalogs on first request instead of at startup")
+
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        from .server import serve
+        serve(host=args.host, port=args.port, socket_path=args.socket_path, domain=args.domain,
+              langs=tuple(args.langs or ('eng', 'swe')), preload=args.preload)
+    else:
+        parser.print_help()
+        return 1
+    return 0
@@ -0,0 +1,135 @@
+import http.client
+import json
+import os
+import socket
+import threading
+from urllib.parse import urlencode, urlparse
+
+# URL of the label service used by autolabel/lookup/search, e.g.
+# 'http://127.0.0.1:8765' or 'unix:///tmp/registream.sock'. None reads files.
+_server_url = None
+_clients = {}
+_local = threading.local()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout):
+        super().__init__('localhost', timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+class LabelClient:
+    """
+    Client for a label service started with ``registream serve``.
+
+    Each thread keeps one persistent connection to the service.
+    """
+
+    def __init__(self, url, timeout=60):
+        self.url = url
+        self.timeout = timeout
+        parsed = urlparse(url)
+        if parsed.scheme == 'unix':
+            self._socket_path = parsed.path
+        elif parsed.scheme == 'http':
+            self._socket_path = None
+            self._host, self._port = parsed.hostname, parsed.port or 80
+        else:
+            raise ValueError(f"Unsupported label service URL: {url!r} (use http:// or unix://)")
+
+    def _connection(self):
+        connections = _local.__dict__.setdefault('connections', {})
+        conn = connections.get(self.url)
+        if conn is None:
+            if self._socket_path:
+                conn = _UnixHTTPConnection(self._socket_path, self.timeout)
+            else:
+                conn = http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+            connections[self.url] = conn
+        return conn
+
+    def _request(self, method, path, payload=None):
+        body = None if payload is None else json.dumps(payload).encode('utf-8')
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        for attempt in (1, 2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = json.loads(response.read() or b'{}')
+                break
+            except (http.client.HTTPException, ConnectionError, socket.timeout, OSError) as e:
+                conn.close()
+                # A kept-alive connection may have been closed by the server; retry once
+                if attempt == 2:
+                    raise ConnectionError(
+                        f"Could not reach the RegiStream label service at {self.url} ({e}). "
+                        "Start it with `registream serve` or call registream.use_server(None)."
+                    )
+        if response.status == 400:
+            raise ValueError(data.get('error'))
+        if response.status != 200:
+            raise RuntimeError(f"Label service error: {data.get('error')}")
+        return data
+
+    def variable_labels(self, variables, domain='scb', lang='eng'):
+        """Return {variable: label} for the variables found in the catalog."""
+        payload = {'variables': list(variables), 'domain': domain, 'lang': lang}
+        return self._request('POST', '/variables', payload)['result']
+
+    def value_labels(self, variables, domain='scb', lang='eng'):
+        """Return {variable: {code: label}} for the variables with value labels."""
+        payload = {'variables': list(variables), 'domain': domain, 'lang': lang}
+        return self._request('POST', '/values', payload)['result']
+
+    def lookup(self, variables, domain='scb', lang='eng'):
+        """Return the records of ``lookup_table``."""
+        payload = {'variables': list(variables), 'domain': domain, 'lang': lang}
+        return self._request('POST', '/lookup', payload)['result']
+
+    def search(self, query, domain='scb', lang=None, limit=20):
+        """Return the records of ``search``."""
+        params = {'q': query, 'domain': domain, 'limit': int(limit)}
+        if lang is not None:
+            params['lang'] = lang if isinstance(lang, str) else ','.join(lang)
+        return self._request('GET', '/search?' + urlencode(params))['results']
+
+    def health(self):
+        return self._request('GET', '/health')
+
+
+def use_server(url):
+    """
+    Resolve labels through a local label service instead of reading the catalog files.
+
+    ``autolabel``, ``lookup``, ``lookup_table`` and ``search`` then send batch
+    queries to the service, so worker processes do not each load the catalog.
+    The REGISTREAM_SERVER environment variable has the same effect.
+
+    Parameters:
+    -----------
+    url : str or None
+        e.g. 'http://127.0.0.1:8765' or 'unix:///tmp/registream.sock'. None
+        goes back to reading the catalog files
+    """
+    global _server_url
+    if url is not None:
+        LabelClient(url)  # validate
+    _server_url = url
+
+
+def get_client():
+    """Return the client for the configured label service, or None."""
+    url = _server_url or os.environ.get('REGISTREAM_SERVER')
+    if not url:
+        return None
+    client = _clients.get(url)
+    if client is None:
+        # Threads that get here at once all use the client stored first
+        client = _clients.setdefault(url, LabelClient(url))
+    return client
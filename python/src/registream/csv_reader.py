@@ -0,0 +1,173 @@
+import warnings
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .autolabel import autolabel as _autolabel_frame, _decode_categorical
+from .stata import _with_labels
+
+
+def _catalog_labels(columns, autolabel, domain, lang):
+    """Look up the labels of the columns once, on an empty frame with the CSV header."""
+    header = pd.DataFrame(columns=columns)
+    if autolabel in (True, 'variables'):
+        _autolabel_frame(header, 'variables', domain=domain, lang=lang, verbose=False)
+    if autolabel in (True, 'values'):
+        _autolabel_frame(header, 'values', domain=domain, lang=lang, verbose=False)
+    return header.attrs['registream_labels']
+
+
+def _decoders(labels, decode, columns):
+    """Return {column: function decoding a chunk of it} for the columns to decode."""
+    value_labels = labels['value_labels']
+    if decode is True:
+        decode = columns
+    elif decode is False or decode is None:
+        decode = []
+    elif isinstance(decode, str):
+        decode = [decode]
+
+    return {col: _Decoder(col, value_labels[col]) for col in decode if value_labels.get(col)}
+
+
+class _Decoder:
+    """
+    Decodes the chunks of one column to categoricals of one dtype.
+
+    The categories are the labels. Codes without a label become categories of
+    their own, added after the known ones the first time a chunk has them, and
+    the column's dtype is the extended one from that chunk on.
+    """
+
+    def __init__(self, column, val_dict):
+        self.column = column
+        self.val_dict = val_dict
+        self.dtype = pd.CategoricalDtype(pd.Index(list(val_dict.values()), dtype=object).unique())
+        self.decoded = False
+
+    def __call__(self, series):
+        decoded = _decode_categorical(series, self.val_dict)
+        new = decoded.cat.categories.difference(self.dtype.categories, sort=False)
+        if len(new):
+            self.dtype = pd.CategoricalDtype(pd.Index([*self.dtype.categories, *new], dtype=object))
+            if self.decoded:
+                # Chunks already returned have the previous dtype
+                warnings.warn(f"Column '{self.column}' has codes without value labels ({', '.join(map(str, new[:5]))}"
+                              f"{', ...' if len(new) > 5 else ''}); they are added to its categories from this "
+                              f"chunk on. Use registream.concat_chunks to combine chunks with different categories.",
+                              stacklevel=4)
+        self.decoded = True
+        return decoded.astype(self.dtype)
+
+
+def _label_chunk(chunk, labels, decoders):
+    """Decode the requested columns of a chunk and attach its labels."""
+    for col, decoder in decoders.items():
+        if col in chunk.columns:
+            chunk[col] = decoder(chunk[col])
+    return _with_labels(chunk, labels)
+
+
+def _without_decoded(labels, decoders):
+    """Decoded columns hold their labels as values, so they drop their value labels."""
+    if not decoders:
+        return labels
+    value_labels = {col: val_dict for col, val_dict in labels['value_labels'].items() if col not in decoders}
+    return {'variable_labels': labels['variable_labels'], 'value_labels': value_labels}
+
+
+def _read_csv_chunks(reader, autolabel, decode, domain, lang):
+    """Yield labeled chunks from a TextFileReader."""
+    with reader:
+        labels = decoders = None
+        for chunk in reader:
+            if labels is None:
+                labels = _catalog_labels(chunk.columns, autolabel, domain, lang)
+                decoders = _decoders(labels, decode, list(chunk.columns))
+                labels = _without_decoded(labels, decoders)
+            yield _label_chunk(chunk, labels, decoders)
+
+
+def concat_chunks(chunks):
+    """
+    Concatenate labeled chunks, as returned by ``read_csv`` or ``read_stata``.
+
+    Categorical columns whose chunks have different categories (decoded
+    columns with codes without labels) stay categorical, with the union of the
+    categories in the order they were added. ``pandas.concat`` would turn them
+    into object columns. The labels are those of the first chunk.
+
+    Parameters:
+    -----------
+    chunks : iterable of pandas.DataFrame
+        The chunks
+
+    Returns:
+    --------
+    pandas.DataFrame
+        The chunks in one DataFrame, with labels
+    """
+    chunks = list(chunks)
+    if not chunks:
+        raise ValueError("No chunks to concatenate")
+    columns = {}
+    for col, dtype in chunks[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype) and any(chunk[col].dtype != dtype for chunk in chunks[1:]):
+            columns[col] = union_categoricals([chunk[col] for chunk in chunks])
+    df = pd.concat(chunks)
+    for col, values in columns.items():
+        df[col] = pd.Categorical(values)
+    df.attrs = dict(chunks[0].attrs)
+    return df
+
+
+def read_csv(path, autolabel=True, decode=False, chunksize=None, domain='scb', lang='eng', **kwargs):
+    """
+    Read a CSV file with labels from the registream catalog.
+
+    The labels of the columns are looked up once, for the header, and attached
+    to the data (or to every chunk of it). Value-labeled columns can be decoded
+    to categoricals as they are read, one chunk at a time, so memory stays
+    bounded by the chunk size.
+
+    Parameters:
+    -----------
+    path : str or file-like
+        The CSV file, as accepted by ``pandas.read_csv``
+    autolabel : bool or str, default True
+        Apply variable and value labels (True), only 'variables' or 'values',
+        or no labels (False)
+    decode : bool, str or list, default False
+        Columns to decode to categoricals of their value labels (True for all
+        value-labeled columns). Chunks share one categorical dtype per column;
+        codes without labels extend it from the chunk where they first appear
+        (see concat_chunks)
+    chunksize : int, optional
+        Return an iterator yielding labeled DataFrames of ``chunksize`` rows
+        instead of reading the whole file
+    domain : str or list, default 'scb'
+        The domain to take labels from, or a list of domains in order of precedence
+    lang : str, default 'eng'
+        Language of the labels ('eng' or 'swe')
+    **kwargs
+        Passed to ``pandas.read_csv``
+
+    Returns:
+    --------
+    pandas.DataFrame or iterator of pandas.DataFrame
+        The labeled data (or chunks of it when ``chunksize`` is given)
+    """
+    if autolabel not in (True, False, 'variables', 'values'):
+        raise ValueError("autolabel must be True, False, 'variables' or 'values'")
+    if chunksize is not None:
+        reader = pd.read_csv(path, chunksize=chunksize, **kwargs)
+        if not autolabel:
+            return reader
+        return _read_csv_chunks(reader, autolabel, decode, domain, lang)
+
+    df = pd.read_csv(path, **kwargs)
+    if not autolabel:
+        return df
+    labels = _catalog_labels(df.columns, autolabel, domain, lang)
+    decoders = _decoders(labels, decode, list(df.columns))
+    return _label_chunk(df, _without_decoded(labels, decoders), decoders)
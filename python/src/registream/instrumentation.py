@@ -0,0 +1,182 @@
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger('registream')
+
+# Instrumentation is off unless enabled with enable_stats(), the REGISTREAM_STATS
+# environment variable, or by registering a callback. When it is off, timer()
+# returns a shared no-op object and count() returns after one flag check.
+_enabled = os.environ.get('REGISTREAM_STATS', '').lower() in ('1', 'true', 'yes')
+_callbacks = []
+_timers = {}
+_counters = {}
+_lock = threading.Lock()
+
+
+class _NullTimer:
+    """Stand-in for _Timer while instrumentation is off."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Time a `with` block and record it under a stage name."""
+    __slots__ = ('name', 'info', 'start')
+
+    def __init__(self, name, info):
+        self.name = name
+        self.info = info
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        with _lock:
+            calls, total, longest = _timers.get(self.name, (0, 0.0, 0.0))
+            _timers[self.name] = (calls + 1, total + seconds, max(longest, seconds))
+        _emit('timer', self.name, seconds, self.info)
+        return False
+
+
+def _emit(kind, name, value, info):
+    """Send one measurement to the logger and the registered callbacks."""
+    if logger.isEnabledFor(logging.DEBUG):
+        if kind == 'timer':
+            logger.debug("%s took %.4fs", name, value,
+                         extra={'registream_stage': name, 'registream_seconds': value})
+        else:
+            logger.debug("%s += %s", name, value,
+                         extra={'registream_counter': name, 'registream_value': value})
+    if _callbacks:
+        event = dict(info, type=kind, name=name, value=value)
+        for callback in list(_callbacks):
+            callback(event)
+
+
+def timer(name, **info):
+    """
+    Return a context manager that times a stage when instrumentation is on.
+
+    Parameters:
+    -----------
+    name : str
+        Stage name, e.g. 'fetch.download'
+    **info :
+        Extra details passed to callbacks with the measurement
+    """
+    if not (_enabled or _callbacks):
+        return _NULL_TIMER
+    return _Timer(name, info)
+
+
+def count(name, n=1, **info):
+    """
+    Add `n` to a counter when instrumentation is on.
+
+    Parameters:
+    -----------
+    name : str
+        Counter name, e.g. 'autolabel.value_labels_parsed'
+    n : int, default 1
+        Amount to add
+    **info :
+        Extra details passed to callbacks with the measurement
+    """
+    if not (_enabled or _callbacks):
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+    _emit('counter', name, n, info)
+
+
+def enable_stats(enabled=True):
+    """
+    Turn collection of timings and counters on or off.
+
+    Measurements are also logged at DEBUG level to the 'registream' logger.
+    Collection can be turned on at startup with REGISTREAM_STATS=1.
+
+    Parameters:
+    -----------
+    enabled : bool, default True
+        Whether to collect statistics
+    """
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def reset_stats():
+    """Clear all collected timings and counters."""
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def stats(reset=False):
+    """
+    Return the timings and counters collected so far.
+
+    Parameters:
+    -----------
+    reset : bool, default False
+        Clear the collected statistics after reading them
+
+    Returns:
+    --------
+    dict
+        ``{'timers': {stage: {'calls', 'total', 'mean', 'max'}}, 'counters': {name: value}}``
+        with times in seconds
+
+    Examples:
+    ---------
+    >>> registream.enable_stats()
+    >>> df.autolabel(label_type='values', verbose=False)
+    >>> registream.stats()['timers']['autolabel.parse_value_labels']
+    {'calls': 1, 'total': 0.41, 'mean': 0.41, 'max': 0.41}
+    """
+    with _lock:
+        result = {
+            'timers': {
+                name: {'calls': calls, 'total': total, 'mean': total / calls, 'max': longest}
+                for name, (calls, total, longest) in sorted(_timers.items())
+            },
+            'counters': dict(sorted(_counters.items())),
+        }
+        if reset:
+            _timers.clear()
+            _counters.clear()
+    return result
+
+
+def add_stats_callback(callback):
+    """
+    Call `callback(event)` for every measurement, even if stats collection is off.
+
+    `event` is a dict with ``type`` ('timer' or 'counter'), ``name`` and
+    ``value`` (seconds for timers, the increment for counters), plus any
+    details of the stage such as ``domain``, ``lang`` or ``label_type``.
+
+    Parameters:
+    -----------
+    callback : callable
+        Function taking one event dict
+    """
+    _callbacks.append(callback)
+
+
+def remove_stats_callback(callback):
+    """Stop calling a callback registered with add_stats_callback."""
+    if callback in _callbacks:
+        _callbacks.remove(callback)
@@ -1,12 +1,24 @@
+import hashlib
+import json
 import os
-import requests
 import zipfile
 import pandas as pd
 import shutil
 import platform
+import threading
+import warnings
+from .instrumentation import timer, count
+from .registry import DatasetRegistry
+from .store import key_lock
+from .schema import detect_schema, key_column, bad_lines, validate_catalog
 
 class LabelFetcher:
     BASE_URL = "https://registream.org/data"
+    API_HOST = "https://registream.org"
+    # Lists the constituent files of a catalog version (see update())
+    MANIFEST_NAME = 'manifest.json'
+    # Validation problems printed after combining (all are kept in validation_issues)
+    MAX_REPORTED_ISSUES = 20
     
     # ANSI color codes
     YELLOW = "\033[93m"  # Warning/info
@@ -16,8 +28,10 @@ class LabelFetcher:
     BOLD = "\033[1m"     # Bold text
     RESET = "\033[0m"    # Reset formatting
     
-    # Class-level flag to track if the custom directory message has been shown
+    # Class-level flag to track if the custom directory message has been shown,
+    # set under the lock so that only one thread prints it
     _custom_dir_message_shown = False
+    _message_lock = threading.Lock()
     
     @classmethod
     def get_default_dir(cls):
@@ -34,8 +48,10 @@ class LabelFetcher:
         if custom_dir:
             # Only show the message once per script execution
             if not cls._custom_dir_message_shown:
-                print(f"\n{cls.YELLOW}Using custom REGISTREAM_DIR: {custom_dir}{cls.RESET}")
-                cls._custom_dir_message_shown = True
+                with cls._message_lock:
+                    if not cls._custom_dir_message_shown:
+                        cls._custom_dir_message_shown = True
+                        print(f"\n{cls.YELLOW}Using custom REGISTREAM_DIR: {custom_dir}{cls.RESET}")
             return os.path.join(custom_dir, 'autolabel_keys')
             
         # Use platform-specific default directories if no custom directory is set
@@ -47,6 +63,16 @@ class LabelFetcher:
             # macOS/Linux: ~/.registream/
             return os.path.expanduser('~/.registream/autolabel_keys')
 
+    @classmethod
+    def get_api_host(cls):
+        """
+        Return the API host, which the REGISTREAM_API_HOST environment variable overrides.
+
+        Like the Stata package's test host, this lets a local server stand in
+        for registream.org.
+        """
+        return os.environ.get('REGISTREAM_API_HOST', cls.API_HOST).rstrip('/')
+
     def __init__(self, domain='scb', lang='eng', label_type='variables'):
         self.domain = domain
         self.lang = lang
@@ -65,6 +91,15 @@ class LabelFetcher:
         self.zip_name = f"{self.domain}_{self.label_type}_{self.lang}.zip"
         self.csv_path = os.path.join(self.label_dir, self.csv_name)
         self.csv_folder = os.path.join(self.label_dir, f"{self.domain}_{self.label_type}_{self.lang}")
+        # Constituent files kept after a delta update, with the manifest they match
+        self.chunk_dir = self.csv_folder + '.chunks'
+        # Entry of the catalog in datasets.csv (the registry shared with the Stata package)
+        self.dataset_key = f"{self.domain}_{self.label_type}_{self.lang}"
+        self.registry = DatasetRegistry(self.label_dir)
+
+    def _stage_info(self):
+        """Details attached to the timings and counters of this fetcher."""
+        return {'domain': self.domain, 'lang': self.lang, 'label_type': self.label_type}
 
     def ensure_labels(self):
         """
@@ -75,61 +110,79 @@ class LabelFetcher:
         str
             Path to the CSV file containing the labels
         """
-        if os.path.exists(self.csv_path):
+        # A catalog in place is checked without taking a lock
+        if os.path.exists(self.csv_path) and self._usable():
             return self.csv_path
 
-        # If constituent CSV files folder exists, just merge them
-        if os.path.exists(self.csv_folder):
-            self.combine_csv_files()
-            return self.csv_path
+        # One thread at a time restores or downloads a catalog; threads that waited find it in place
+        with key_lock(self.csv_path):
+            if os.path.exists(self.csv_path) and self._usable(set_aside=True):
+                return self.csv_path
+
+            # If constituent CSV files folder exists, just merge them
+            if os.path.exists(self.csv_folder):
+                self.combine_csv_files()
+                return self.csv_path
 
-        # Neither file nor folder exists, prompt download
-        print(f"\n{self.BLUE}{self.BOLD}File Not Found{self.RESET}")
-        print(f"{self.BLUE}The file {self.BOLD}{self.csv_name}{self.RESET}{self.BLUE} does not exist locally.{self.RESET}")
-        print(f"{self.BLUE}Expected location: {self.BOLD}{self.csv_path}{self.RESET}")
-        print(f"{self.BLUE}You can manually place the file or constituent CSV files in this location.{self.RESET}\n")
+            # Constituent files kept by update() can be merged again
+            if os.path.exists(os.path.join(self.chunk_dir, self.MANIFEST_NAME)):
+                self.combine_csv_files(self.chunk_dir)
+                return self.csv_path
+
+            # Neither file nor folder exists, prompt download
+            print(f"\n{self.BLUE}{self.BOLD}File Not Found{self.RESET}")
+            print(f"{self.BLUE}The file {self.BOLD}{self.csv_name}{self.RESET}{self.BLUE} does not exist locally.{self.RESET}")
+            print(f"{self.BLUE}Expected location: {self.BOLD}{self.csv_path}{self.RESET}")
+            print(f"{self.BLUE}You can manually place the file or constituent CSV files in this location.{self.RESET}\n")
         
-        permission = input(f"{self.YELLOW}Would you like to download it now? (yes/no): {self.RESET}").strip().lower()
-        if permission != "yes":
-            print(f"\n{self.RED}{self.BOLD}Download permission denied.{self.RESET}")
-            print(f"\n{self.BLUE}{self.BOLD}Please follow these manual steps:{self.RESET}")
-            print(f"{self.BLUE}1. Download {self.BOLD}{self.zip_name}{self.RESET}{self.BLUE} from {self.BOLD}https://registream.org/data/{self.RESET}")
-            print(f"{self.BLUE}2. Extract the zip file to get a folder named {self.BOLD}{self.domain}_{self.label_type}_{self.lang}{self.RESET}")
-            print(f"{self.BLUE}3. Place this folder in {self.BOLD}{self.label_dir}{self.RESET}")
-            print(f"{self.BLUE}4. Alternatively, you can set a custom directory using the REGISTREAM_DIR environment variable{self.RESET}")
-            print(f"{self.BLUE}   Example: {self.BOLD}export REGISTREAM_DIR=\"path/to/your/custom/directory\"{self.RESET}\n")
-            raise PermissionError("Download permission denied.")
+            permission = input(f"{self.YELLOW}Would you like to download it now? (yes/no): {self.RESET}").strip().lower()
+            if permission != "yes":
+                print(f"\n{self.RED}{self.BOLD}Download permission denied.{self.RESET}")
+                print(f"\n{self.BLUE}{self.BOLD}Please follow these manual steps:{self.RESET}")
+                print(f"{self.BLUE}1. Download {self.BOLD}{self.zip_name}{self.RESET}{self.BLUE} from {self.BOLD}https://registream.org/data/{self.RESET}")
+                print(f"{self.BLUE}2. Extract the zip file to get a folder named {self.BOLD}{self.domain}_{self.label_type}_{self.lang}{self.RESET}")
+                print(f"{self.BLUE}3. Place this folder in {self.BOLD}{self.label_dir}{self.RESET}")
+                print(f"{self.BLUE}4. Alternatively, you can set a custom directory using the REGISTREAM_DIR environment variable{self.RESET}")
+                print(f"{self.BLUE}   Example: {self.BOLD}export REGISTREAM_DIR=\"path/to/your/custom/directory\"{self.RESET}\n")
+                raise PermissionError("Download permission denied.")
 
-        self.download_and_extract()
-        self.combine_csv_files()
+            self.download_and_extract()
+            self.combine_csv_files()
 
-        if not os.path.exists(self.csv_path):
-            print(f"\n{self.RED}{self.BOLD}Error: CSV file not found after extraction.{self.RESET}")
-            print(f"{self.RED}Please contact developers or try manual installation.{self.RESET}\n")
-            raise FileNotFoundError("CSV file not found after extraction.")
+            if not os.path.exists(self.csv_path):
+                print(f"\n{self.RED}{self.BOLD}Error: CSV file not found after extraction.{self.RESET}")
+                print(f"{self.RED}Please contact developers or try manual installation.{self.RESET}\n")
+                raise FileNotFoundError("CSV file not found after extraction.")
 
-        return self.csv_path
+            return self.csv_path
 
     def download_and_extract(self):
         """
         Download and extract the zip file containing label data.
         """
+        # Imported here so that `import registream` does not pay for requests
+        import requests
+        
         self.clean_up()
 
-        zip_url = f"{self.BASE_URL}/{self.zip_name}"
+        base_url = f"{self.get_api_host()}/data" if 'REGISTREAM_API_HOST' in os.environ else self.BASE_URL
+        zip_url = f"{base_url}/{self.zip_name}"
         zip_path = os.path.join(self.label_dir, self.zip_name)
 
         os.makedirs(self.label_dir, exist_ok=True)
         print(f"\n{self.BLUE}Downloading {self.BOLD}{zip_url}{self.RESET}{self.BLUE}...{self.RESET}")
         try:
-            response = requests.get(zip_url)
-            response.raise_for_status()
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            with timer('fetch.download', **self._stage_info()):
+                response = requests.get(zip_url)
+                response.raise_for_status()
+                with open(zip_path, 'wb') as f:
+                    f.write(response.content)
+            count('fetch.downloaded_bytes', len(response.content), **self._stage_info())
 
             print(f"{self.BLUE}Extracting files...{self.RESET}")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.label_dir)
+            with timer('fetch.extract', **self._stage_info()):
+                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                    zip_ref.extractall(self.label_dir)
 
             os.remove(zip_path)
             print(f"{self.GREEN}Download and extraction successful!{self.RESET}\n")
@@ -141,63 +194,318 @@ class LabelFetcher:
             print(f"{self.BLUE}3. Place this folder in {self.BOLD}{self.label_dir}{self.RESET}\n")
             raise
 
-    def combine_csv_files(self):
+    def combine_csv_files(self, folder=None):
         """
         Combine multiple CSV files into a single CSV file.
         
+        Parameters:
+        -----------
+        folder : str, optional
+            Folder of constituent files to combine and keep. By default the
+            extracted download folder, which is removed afterwards
+        
         Returns:
         --------
         str
             Path to the combined CSV file
+
+        Each file is checked against the catalog schema as it is read. Problems
+        (including malformed lines, which are skipped) are printed by file and
+        line and kept in ``self.validation_issues``.
         """
+        keep_folder = folder is not None
+        folder = folder or self.csv_folder
         csv_files = sorted([
-            os.path.join(self.csv_folder, f)
-            for f in os.listdir(self.csv_folder)
+            os.path.join(folder, f)
+            for f in os.listdir(folder)
             if f.endswith('.csv')
         ])
 
         if not csv_files:
             print(f"\n{self.RED}{self.BOLD}Error: No CSV files found.{self.RESET}")
-            print(f"{self.RED}No CSV files found in {self.BOLD}{self.csv_folder}{self.RESET}\n")
-            raise FileNotFoundError(f"No CSV files found in {self.csv_folder}.")
+            print(f"{self.RED}No CSV files found in {self.BOLD}{folder}{self.RESET}\n")
+            raise FileNotFoundError(f"No CSV files found in {folder}.")
 
         print(f"{self.BLUE}Combining {self.BOLD}{len(csv_files)}{self.RESET}{self.BLUE} CSV files...{self.RESET}")
         df_list = []
-        for f in csv_files:
-            try:
-                df = pd.read_csv(
-                    f,
-                    delimiter=';',
-                    quoting=0,
-                    on_bad_lines='skip',
-                    encoding='utf-8'
-                )
-                df_list.append(df)
-            except pd.errors.ParserError as e:
-                print(f"{self.YELLOW}Warning: Issue parsing {os.path.basename(f)} ({e}). Skipping problematic lines.{self.RESET}")
+        reports = []
+        label_type = 'values' if self.label_type == 'value_labels' else 'variables'
+        with timer('fetch.combine.read', **self._stage_info()):
+            for f in csv_files:
+                try:
+                    # Malformed lines are skipped, and reported by validate_catalog
+                    with warnings.catch_warnings(record=True) as caught:
+                        warnings.simplefilter('always', pd.errors.ParserWarning)
+                        df = pd.read_csv(
+                            f,
+                            delimiter=';',
+                            quoting=0,
+                            on_bad_lines='warn',
+                            encoding='utf-8'
+                        )
+                    df_list.append(df)
+                except pd.errors.ParserError as e:
+                    print(f"{self.YELLOW}Warning: Issue parsing {os.path.basename(f)} ({e}). Skipping problematic lines.{self.RESET}")
+                    continue
+                with timer('fetch.combine.validate', **self._stage_info()):
+                    reports.append(validate_catalog(df, label_type, os.path.basename(f), bad_lines(caught)))
+        count('fetch.combine.files', len(csv_files), **self._stage_info())
+        self._report_issues(reports)
 
         if not df_list:
             print(f"\n{self.RED}{self.BOLD}Error: All CSV files failed to parse.{self.RESET}\n")
             raise ValueError("All constituent CSV files failed to parse.")
 
-        df_combined = pd.concat(df_list, ignore_index=True)
-        df_combined_sorted = df_combined.sort_values(by='variable')
-        df_combined_sorted = df_combined_sorted.drop_duplicates(subset=['variable'], keep='first')
+        with timer('fetch.combine.merge', **self._stage_info()):
+            df_combined = pd.concat(df_list, ignore_index=True)
+            # Rows are keyed by variable, or by value_label_id in schema 1.0 value label files
+            key = key_column(df_combined.columns)
+            df_combined_sorted = df_combined.sort_values(by=key)
+            df_combined_sorted = df_combined_sorted.drop_duplicates(subset=[key], keep='first')
+        count('fetch.combine.rows', len(df_combined_sorted), **self._stage_info())
         
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
-        df_combined_sorted.to_csv(self.csv_path, index=False)
+        with timer('fetch.combine.write', **self._stage_info()):
+            # Written to a temporary file first so readers never see a partial catalog
+            tmp_path = f"{self.csv_path}.{os.getpid()}.tmp"
+            df_combined_sorted.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, self.csv_path)
+        with timer('fetch.combine.register', **self._stage_info()):
+            manifest = self._local_manifest() if folder == self.chunk_dir else None
+            self.registry.record(
+                self.dataset_key, self.csv_path, self.domain,
+                'values' if self.label_type == 'value_labels' else 'variables', self.lang,
+                version=manifest['version'] if manifest else 'latest',
+                schema=detect_schema(df_combined_sorted.columns))
         
         print(f"{self.GREEN}Successfully combined CSV files into {self.BOLD}{self.csv_path}{self.RESET}\n")
 
         # clean up constituent folder
-        self.clean_up()
+        if not keep_folder:
+            self.clean_up()
 
         return self.csv_path
     
+    def _report_issues(self, reports):
+        """Keep the validation reports of the combined files and print a summary of them."""
+        issues = pd.concat(reports, ignore_index=True) if reports else pd.DataFrame(
+            columns=['file', 'line', 'severity', 'problem'])
+        self.validation_issues = issues
+        if issues.empty:
+            return
+        errors = int((issues['severity'] == 'error').sum())
+        count('fetch.combine.invalid_rows', errors, **self._stage_info())
+        print(f"{self.YELLOW}Warning: {errors} errors and {len(issues) - errors} warnings in "
+              f"{issues['file'].nunique()} of the {self.label_type} files:{self.RESET}")
+        for row in issues.head(self.MAX_REPORTED_ISSUES).itertuples(index=False):
+            print(f"{self.YELLOW}  {row.file}:{row.line}: {row.severity}: {row.problem}{self.RESET}")
+        if len(issues) > self.MAX_REPORTED_ISSUES:
+            print(f"{self.YELLOW}  ... and {len(issues) - self.MAX_REPORTED_ISSUES} more{self.RESET}")
+
+    def _usable(self, set_aside=False):
+        """Check the catalog file against the registry, setting it aside if asked and it does not match."""
+        # One stat against the registry; the file is only hashed again if it was touched
+        status = self.registry.verify(self.dataset_key, self.csv_path)
+        if status in (DatasetRegistry.CORRUPT, DatasetRegistry.MODIFIED):
+            if set_aside:
+                self._set_aside(status)
+            return False
+        count('fetch.local_hits', **self._stage_info())
+        return True
+
+    def _set_aside(self, status):
+        """Move a catalog file that does not match its registry entry out of the way, so it is never parsed."""
+        aside = f"{self.csv_path}.{status}"
+        os.replace(self.csv_path, aside)
+        count(f'fetch.{status}_files', **self._stage_info())
+        reason = ("its size differs from the registered size (incomplete or damaged file)"
+                  if status == DatasetRegistry.CORRUPT else "its contents differ from the registered file")
+        print(f"{self.YELLOW}Warning: {self.csv_name} does not match {self.registry.path}: {reason}.{self.RESET}")
+        print(f"{self.YELLOW}It was moved to {aside} and the catalog will be restored.{self.RESET}")
+        print(f"{self.YELLOW}To use an edited catalog, set its source to 'user' in datasets.csv.{self.RESET}\n")
+
     def clean_up(self):
         """
         Clean up temporary files and folders.
         """
         if os.path.exists(self.csv_folder):
-            shutil.rmtree(self.csv_folder)
\ No newline at end of file
+            shutil.rmtree(self.csv_folder)
+
+    def _dataset_url(self, version):
+        return f"{self.get_api_host()}/api/v1/datasets/{self.domain}/{self.label_type}/{self.lang}/{version}"
+
+    def _local_manifest(self):
+        """Return the manifest of the constituent files kept locally, or None."""
+        try:
+            with open(os.path.join(self.chunk_dir, self.MANIFEST_NAME), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def installed_version(self):
+        """Return the catalog version installed by update(), or None."""
+        manifest = self._local_manifest()
+        return manifest.get('version') if manifest else None
+
+    def _download_chunk(self, session, url, chunk, tmp_path):
+        """Stream one constituent file to tmp_path, checking its size and sha256."""
+        digest = hashlib.sha256()
+        size = 0
+        with session.get(url, stream=True) as response:
+            response.raise_for_status()
+            with open(tmp_path, 'wb') as f:
+                for block in response.iter_content(chunk_size=1 << 16):
+                    digest.update(block)
+                    size += len(block)
+                    f.write(block)
+        if digest.hexdigest() != chunk['sha256'] or size != chunk['size']:
+            os.remove(tmp_path)
+            raise ValueError(f"Downloaded {chunk['name']} does not match the manifest (size or sha256)")
+        return size
+
+    def update(self, version='latest', verbose=True):
+        """
+        Bring the local catalog to a version, downloading only the files that changed.
+
+        Each catalog version has a manifest listing its constituent CSV files
+        with their size and sha256. The files whose hash differs from the local
+        copy are downloaded and checked, files dropped from the release are
+        removed, and the catalog CSV is combined again. The first update
+        downloads every file; if the server has no manifest for the catalog,
+        the whole zip file is downloaded instead.
+
+        Parameters:
+        -----------
+        version : str, default 'latest'
+            Catalog version (e.g. '20251101') or 'latest'
+        verbose : bool, default True
+            Whether to print progress information
+
+        Returns:
+        --------
+        dict
+            ``version``, the ``downloaded``, ``removed`` and ``unchanged`` file
+            names, and the number of ``bytes`` downloaded
+        """
+        # Not while another thread restores or updates the same catalog
+        with key_lock(self.csv_path):
+            return self._update(version, verbose)
+
+    def _update(self, version, verbose):
+        """Update the catalog (see update)."""
+        import requests
+
+        stage_info = self._stage_info()
+        session = requests.Session()
+        with timer('fetch.delta.manifest', **stage_info):
+            response = session.get(f"{self._dataset_url(version)}/manifest")
+        if response.status_code == 404:
+            if verbose:
+                print(f"{self.YELLOW}No file manifest for {self.csv_name}; downloading the full catalog.{self.RESET}")
+            self.download_and_extract()
+            self.combine_csv_files()
+            return {'version': None, 'downloaded': [self.zip_name], 'removed': [], 'unchanged': [], 'bytes': None}
+        response.raise_for_status()
+        manifest = response.json()
+
+        local = self._local_manifest() or {'chunks': []}
+        local_hashes = {chunk['name']: chunk['sha256'] for chunk in local['chunks']}
+        # Names are joined to the chunk folder, so none may point outside it
+        for name in [chunk['name'] for chunk in manifest['chunks']] + list(local_hashes):
+            _check_chunk_name(name)
+        os.makedirs(self.chunk_dir, exist_ok=True)
+
+        changed = [
+            chunk for chunk in manifest['chunks']
+            if local_hashes.get(chunk['name']) != chunk['sha256']
+            or not os.path.exists(os.path.join(self.chunk_dir, chunk['name']))
+        ]
+        names = {chunk['name'] for chunk in manifest['chunks']}
+        removed = sorted(name for name in local_hashes if name not in names)
+        unchanged = sorted(names - {chunk['name'] for chunk in changed})
+
+        if verbose and changed:
+            total = sum(chunk['size'] for chunk in changed)
+            print(f"{self.BLUE}Downloading {self.BOLD}{len(changed)}{self.RESET}{self.BLUE} of "
+                  f"{len(names)} files ({total / 1e6:.1f} MB) for version {manifest['version']}...{self.RESET}")
+
+        # Download everything before touching the local files, so a failed
+        # update leaves the previous version intact
+        downloaded_bytes = 0
+        tmp_paths = []
+        try:
+            with timer('fetch.delta.download', **stage_info):
+                for chunk in changed:
+                    tmp_path = os.path.join(self.chunk_dir, chunk['name'] + '.part')
+                    tmp_paths.append(tmp_path)
+                    url = f"{self._dataset_url(manifest['version'])}/chunks/{chunk['name']}"
+                    downloaded_bytes += self._download_chunk(session, url, chunk, tmp_path)
+        except BaseException:
+            for tmp_path in tmp_paths:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            raise
+        count('fetch.downloaded_bytes', downloaded_bytes, **stage_info)
+        count('fetch.delta.downloaded_files', len(changed), **stage_info)
+        count('fetch.delta.unchanged_files', len(unchanged), **stage_info)
+
+        for chunk, tmp_path in zip(changed, tmp_paths):
+            os.replace(tmp_path, os.path.join(self.chunk_dir, chunk['name']))
+        for name in removed:
+            path = os.path.join(self.chunk_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+        manifest_path = os.path.join(self.chunk_dir, self.MANIFEST_NAME)
+        with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+        if changed or removed or not os.path.exists(self.csv_path):
+            self.combine_csv_files(self.chunk_dir)
+        elif verbose:
+            print(f"{self.GREEN}{self.csv_name} is up to date (version {manifest['version']}).{self.RESET}")
+
+        return {'version': manifest['version'], 'downloaded': [chunk['name'] for chunk in changed],
+                'removed': removed, 'unchanged': unchanged, 'bytes': downloaded_bytes}
+
+
+def _check_chunk_name(name):
+    """Raise ValueError unless a manifest file name is a plain CSV file name."""
+    if (not isinstance(name, str) or name in ('.', '..') or os.path.basename(name) != name
+            or '/' in name or '\\' in name or not name.endswith('.csv')):
+        raise ValueError(f"Invalid file name in catalog manifest: {name!r}")
+
+
+def update_labels(domain='scb', lang=None, label_type=None, version='latest', verbose=True):
+    """
+    Update the local label catalogs, downloading only the files that changed.
+
+    Parameters:
+    -----------
+    domain : str, default 'scb'
+        The domain to update
+    lang : str, list or None, default None
+        Language(s) to update. None updates both English and Swedish
+    label_type : str, list or None, default None
+        Label type(s) to update ('variables' or 'values'). None updates both
+    version : str, default 'latest'
+        Catalog version (e.g. '20251101') or 'latest'
+    verbose : bool, default True
+        Whether to print progress information
+
+    Returns:
+    --------
+    dict
+        The result of ``LabelFetcher.update`` for each (lang, label_type)
+    """
+    langs = ('eng', 'swe') if lang is None else ([lang] if isinstance(lang, str) else list(lang))
+    if label_type is None:
+        label_types = ('variables', 'values')
+    else:
+        label_types = [label_type] if isinstance(label_type, str) else list(label_type)
+    return {
+        (lg, lt): LabelFetcher(domain=domain, lang=lg, label_type=lt).update(version=version, verbose=verbose)
+        for lg in langs for lt in label_types
+    }
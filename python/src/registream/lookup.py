@@ -1,6 +1,80 @@
 import pandas as pd
-import ast
-from .label_fetcher import LabelFetcher
+from .catalog import load_catalog, value_labels_for
+from .usage import argument_repr, log_usage
+from .client import get_client
+
+
+def lookup_table(variables, domain='scb', lang='eng', as_dict=False):
+    """
+    Look up detailed information about variables and return it as data.
+    
+    Parameters:
+    -----------
+    variables : list or str
+        List of variable names to look up
+    domain : str or list, default 'scb'
+        The domain to search for variables, or a list of domains in order of precedence
+    lang : str, default 'eng'
+        Language for variable descriptions ('eng' or 'swe')
+    as_dict : bool, default False
+        If True, return a dictionary keyed by variable name instead of a DataFrame
+        
+    Returns:
+    --------
+    pandas.DataFrame or dict
+        One row per requested variable (in the requested order) with the catalog
+        columns, a parsed ``value_labels`` dictionary (or None) and a boolean
+        ``found`` column. With ``as_dict=True`` a dictionary mapping each
+        variable name to its record.
+    """
+    # If a single string is passed, convert to list
+    if isinstance(variables, str):
+        variables = [variables]
+    variables = list(variables)
+    log_usage(f"lookup_table({argument_repr(variables)}, domain={domain!r}, lang={lang!r})")
+    return _lookup_table(variables, domain, lang, as_dict)
+
+
+def _lookup_table(variables, domain, lang, as_dict=False):
+    """Build the lookup_table result for a list of variable names."""
+    result = _lookup_table_from_source(variables, domain, lang)
+    if result is None:
+        result = _lookup_table_from_files(variables, domain, lang)
+    if as_dict:
+        return {record['variable']: record for record in result.to_dict('records')}
+    return result
+
+
+def _lookup_table_from_source(variables, domain, lang):
+    """Answer from the label service or the shared catalog, if one is in use."""
+    from .shared import get_shared_source
+    client = get_client()
+    if client is not None:
+        return pd.DataFrame(client.lookup(variables, domain=domain, lang=lang))
+    shared = get_shared_source()
+    if shared is not None:
+        return shared.lookup_table(variables, domain, lang)
+    return None
+
+
+def _lookup_table_from_files(variables, domain, lang):
+    """Build the lookup table from the catalogs loaded in this process."""
+    var_df = load_catalog(domain=domain, lang=lang, label_type='variables')
+    
+    # Hashed index lookups: one reindex per catalog instead of a scan per variable
+    result = var_df.reindex(variables)
+    result.index.name = 'variable'
+    if 'variable_desc' in result.columns:
+        result['found'] = result['variable_desc'].notna()
+    else:
+        result['found'] = False
+    
+    # Parse value labels only for the requested variables that have them
+    parsed = value_labels_for(variables, domain=domain, lang=lang)
+    result['value_labels'] = [parsed.get(var) for var in variables]
+    
+    return result.reset_index()
+
 
 def lookup(variables, domain='scb', lang='eng'):
     """
@@ -10,8 +84,8 @@ def lookup(variables, domain='scb', lang='eng'):
     -----------
     variables : list or str
         List of variable names to look up
-    domain : str, default 'scb'
-        The domain to search for variables
+    domain : str or list, default 'scb'
+        The domain to search for variables, or a list of domains in order of precedence
     lang : str, default 'eng'
         Language for variable descriptions ('eng' or 'swe')
         
@@ -26,36 +100,20 @@ def lookup(variables, domain='scb', lang='eng'):
     2. Default platform-specific location otherwise:
        - Windows: C:\\Users\\<username>\\AppData\\Local\\registream\\autolabel_keys\\
        - macOS/Linux: ~/.registream/autolabel_keys/
+       
+    Use ``lookup_table`` to get the same information as a DataFrame.
     """
-    # If a single string is passed, convert to list
     if isinstance(variables, str):
         variables = [variables]
-        
-    # Get variable information
-    fetcher = LabelFetcher(domain=domain, lang=lang, label_type='variables')
-    var_csv_path = fetcher.ensure_labels()
-    var_df = pd.read_csv(var_csv_path, delimiter=',', encoding='utf-8', on_bad_lines='skip')
-    var_df.columns = var_df.columns.str.strip()
-    var_df['variable'] = var_df['variable'].str.strip()
-    
-    # Get value labels information
-    val_fetcher = LabelFetcher(domain=domain, lang=lang, label_type='values')
-    val_csv_path = val_fetcher.ensure_labels()
-    val_df = pd.read_csv(val_csv_path, delimiter=',', encoding='utf-8', on_bad_lines='skip')
-    val_df.columns = val_df.columns.str.strip()
-    val_df['variable'] = val_df['variable'].str.strip()
-    
-    # Create a lookup DataFrame with the requested variables
-    lookup_vars = pd.DataFrame({'variable': variables})
-    
-    # Merge with variable information
-    merged_df = pd.merge(lookup_vars, var_df, on='variable', how='left')
+    variables = list(variables)
+    log_usage(f"lookup({argument_repr(variables)}, domain={domain!r}, lang={lang!r})")
+    merged_df = _lookup_table(variables, domain, lang)
     
     # Track missing variables
     missing_vars = []
     
     # Display information for each variable
-    for i, row in merged_df.iterrows():
+    for row in merged_df.to_dict('records'):
         var_name = row['variable']
         
         # Check if variable was found
@@ -86,35 +144,28 @@ def lookup(variables, domain='scb', lang='eng'):
             else:
                 print("| DEFINITION:   No definition available")
             
-            # Get value labels for this variable
-            val_row = val_df[val_df['variable'] == var_name].iloc[0] if not val_df[val_df['variable'] == var_name].empty else None
+            # Value labels were already parsed by lookup_table
+            val_dict = row.get('value_labels')
             
-            if val_row is not None and pd.notna(val_row.get('value_labels', pd.NA)):
-                try:
-                    # Parse value labels string into a dictionary
-                    val_dict = ast.literal_eval(val_row['value_labels'])
+            if val_dict:
+                # Display up to 8 value labels
+                max_display = 8
+                items = list(val_dict.items())
+                
+                for j, (code, label) in enumerate(items[:max_display]):
+                    # Truncate label if too long
+                    if len(f"{code}: {label}") > 70:
+                        label = label[:65] + "..."
                     
-                    # Display up to 8 value labels
-                    max_display = 8
-                    items = list(val_dict.items())
-                    
-                    if items:
-                        for j, (code, label) in enumerate(items[:max_display]):
-                            # Truncate label if too long
-                            if len(f"{code}: {label}") > 70:
-                                label = label[:65] + "..."
-                            
-                            if j == 0:
-                                print(f"| VALUE LABELS: {code}: {label}")
-                            else:
-                                print(f"|               {code}: {label}")
-                        
-                        # Show count of remaining labels
-                        if len(items) > max_display:
-                            remaining = len(items) - max_display
-                            print(f"|               (and {remaining} more labels)")
-                except Exception as e:
-                    pass  # Silently skip value labels that can't be parsed
+                    if j == 0:
+                        print(f"| VALUE LABELS: {code}: {label}")
+                    else:
+                        print(f"|               {code}: {label}")
+                
+                # Show count of remaining labels
+                if len(items) > max_display:
+                    remaining = len(items) - max_display
+                    print(f"|               (and {remaining} more labels)")
             
             # Print separator
             print("-" * 90)
@@ -0,0 +1,132 @@
+import json
+
+# Arrow metadata keys. Each field carries its variable label and the id of its
+# value label set; the sets themselves are stored once in the schema metadata.
+_LABEL_KEY = b'registream.label'
+_VALUE_SET_KEY = b'registream.value_labels'
+_VALUE_SET_PREFIX = 'registream.value_labels.'
+# df.attrs keys holding the labels, which are stored in the schema instead
+_LABEL_ATTRS = ('registream_labels', 'registream_languages', 'registream_language')
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is an optional dependency."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Parquet support requires pyarrow. Install it with `pip install pyarrow` "
+            "or `pip install registream[parquet]`."
+        )
+    return pyarrow, pyarrow.parquet
+
+
+def _labeled_schema(pa, schema, labels):
+    """Return `schema` with the registream labels added to its metadata."""
+    variable_labels = labels.get('variable_labels', {})
+    value_labels = labels.get('value_labels', {})
+
+    # Store each distinct value label set once, however many columns use it
+    set_ids, set_texts = {}, {}
+    fields = []
+    for field in schema:
+        metadata = dict(field.metadata or {})
+        label = variable_labels.get(field.name)
+        if label:
+            metadata[_LABEL_KEY] = str(label).encode('utf-8')
+        val_dict = value_labels.get(field.name)
+        if val_dict:
+            if id(val_dict) not in set_ids:
+                text = json.dumps({str(k): v for k, v in val_dict.items()},
+                                  ensure_ascii=False, separators=(',', ':'), default=str)
+                set_ids[id(val_dict)] = set_texts.setdefault(text, str(len(set_texts)))
+            metadata[_VALUE_SET_KEY] = set_ids[id(val_dict)].encode('ascii')
+        fields.append(field.with_metadata(metadata) if metadata else field)
+
+    schema_metadata = dict(schema.metadata or {})
+    for text, set_id in set_texts.items():
+        schema_metadata[(_VALUE_SET_PREFIX + set_id).encode('ascii')] = text.encode('utf-8')
+    return pa.schema(fields, metadata=schema_metadata)
+
+
+def write_parquet(df, path, index=None, **kwargs):
+    """
+    Write a DataFrame to Parquet with its registream labels in the file metadata.
+
+    Variable labels are stored in the metadata of each column, and each
+    distinct value label set is stored once in the schema metadata, so the
+    labels add little to the file and reading a few columns back only decodes
+    the labels of those columns.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        The DataFrame to write
+    path : str
+        Output file path
+    index : bool, optional
+        Whether to store the index, as in ``DataFrame.to_parquet``
+    **kwargs :
+        Passed to ``pyarrow.parquet.write_table`` (e.g. ``compression``)
+
+    Returns:
+    --------
+    str
+        The path of the written file
+    """
+    pa, pq = _import_pyarrow()
+    # Newer pyarrow versions copy df.attrs into the pandas metadata; leave the
+    # labels out of it so they are only stored once, in compact form
+    unlabeled = df.copy(deep=False)
+    unlabeled.attrs = {key: value for key, value in df.attrs.items() if key not in _LABEL_ATTRS}
+    table = pa.Table.from_pandas(unlabeled, preserve_index=index)
+    labels = df.attrs.get('registream_labels', {})
+    table = table.cast(_labeled_schema(pa, table.schema, labels))
+    pq.write_table(table, path, **kwargs)
+    return path
+
+
+def _schema_labels(schema):
+    """Rebuild registream labels from the metadata of the fields in `schema`."""
+    schema_metadata = schema.metadata or {}
+    variable_labels, value_labels, sets = {}, {}, {}
+    for field in schema:
+        metadata = field.metadata or {}
+        if _LABEL_KEY in metadata:
+            variable_labels[field.name] = metadata[_LABEL_KEY].decode('utf-8')
+        set_id = metadata.get(_VALUE_SET_KEY)
+        if set_id is None:
+            continue
+        # Decode each set once; columns sharing a set share one dict
+        if set_id not in sets:
+            text = schema_metadata.get(_VALUE_SET_PREFIX.encode('ascii') + set_id)
+            sets[set_id] = json.loads(text) if text is not None else None
+        if sets[set_id]:
+            value_labels[field.name] = sets[set_id]
+    return {'variable_labels': variable_labels, 'value_labels': value_labels}
+
+
+def read_parquet(path, columns=None, **kwargs):
+    """
+    Read a Parquet file written by ``df.lab.to_parquet``, restoring its labels.
+
+    Parameters:
+    -----------
+    path : str
+        Path of the Parquet file
+    columns : list, optional
+        Columns to read. Only the labels of these columns are decoded
+    **kwargs :
+        Passed to ``pyarrow.parquet.read_table`` (e.g. ``filters``)
+
+    Returns:
+    --------
+    pandas.DataFrame
+        The data with ``registream_labels`` restored in ``df.attrs``
+    """
+    _, pq = _import_pyarrow()
+    table = pq.read_table(path, columns=columns, **kwargs)
+    df = table.to_pandas()
+    df.attrs['registream_labels'] = _schema_labels(table.schema)
+    return df
@@ -0,0 +1,178 @@
+import csv
+import datetime
+import hashlib
+import os
+import threading
+import time
+
+REGISTRY_NAME = 'datasets.csv'
+
+# Columns written by the Stata package (see docs/metadata_system.md), then the
+# fingerprint of the catalog file added by the Python package
+FIELDS = ['dataset_key', 'domain', 'type', 'lang', 'version', 'schema', 'downloaded', 'source',
+          'file_size', 'last_checked', 'mtime', 'sha256']
+
+# Stata clock values count milliseconds since 1960 in local time
+_STATA_EPOCH = datetime.datetime(1960, 1, 1)
+
+# Parsed registries keyed by path, with the (mtime, size) they were read at
+_cache = {}
+# Serializes updates, which read, change and replace the whole file
+_write_lock = threading.RLock()
+
+
+def stata_clock(timestamp):
+    """Return a Unix timestamp as a Stata clock value, the way the Stata package writes them."""
+    return (datetime.datetime.fromtimestamp(timestamp) - _STATA_EPOCH) // datetime.timedelta(milliseconds=1)
+
+
+def _from_stata_clock(value):
+    try:
+        return (_STATA_EPOCH + datetime.timedelta(milliseconds=float(value))).timestamp()
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _int(value):
+    # Nanosecond mtimes do not survive a round trip through float
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def file_sha256(path, block_size=1 << 20):
+    """Return the SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DatasetRegistry:
+    """
+    The ``datasets.csv`` registry of installed catalogs, shared with the Stata package.
+
+    Besides the fields the Stata package keeps (version, schema, download
+    time, size), each entry holds the file's modification time and SHA-256
+    digest. ``verify`` compares the size and modification time with the file,
+    which costs one ``stat``, and hashes the file again only when the
+    modification time has changed.
+    """
+
+    OK = 'ok'                  # matches its entry
+    UNTRACKED = 'untracked'    # no entry (custom or older catalogs)
+    MISSING = 'missing'        # entry but no file
+    CORRUPT = 'corrupt'        # size differs from its entry (partial or damaged file)
+    MODIFIED = 'modified'      # same size, different contents
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, REGISTRY_NAME)
+
+    def _read(self):
+        """Return (fields, {dataset_key: entry}), parsing the file only when it has changed."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return list(FIELDS), {}
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _cache.get(self.path)
+        if cached is not None and cached[0] == signature:
+            return cached[1], cached[2]
+        with open(self.path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f, delimiter=';')
+            fields = list(reader.fieldnames or [])
+            entries = {row['dataset_key']: row for row in reader if row.get('dataset_key')}
+        fields += [field for field in FIELDS if field not in fields]
+        _cache[self.path] = (signature, fields, entries)
+        return fields, entries
+
+    def get(self, dataset_key):
+        """Return a copy of the entry of a dataset, or None."""
+        entry = self._read()[1].get(dataset_key)
+        return dict(entry) if entry is not None else None
+
+    def _write(self, dataset_key, updates):
+        """Update one entry and replace the registry atomically. Read-only installations are left as they are."""
+        with _write_lock:
+            fields, entries = self._read()
+            entries = dict(entries)
+            entry = dict(entries.get(dataset_key, {}), **updates)
+            entry['dataset_key'] = dataset_key
+            entries[dataset_key] = entry
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fields, delimiter=';', extrasaction='ignore',
+                                            lineterminator='\n')
+                    writer.writeheader()
+                    for row in entries.values():
+                        writer.writerow({field: '' if row.get(field) is None else row[field] for field in fields})
+                os.replace(tmp_path, self.path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def record(self, dataset_key, path, domain, label_type, lang, version='latest', schema='', source='api'):
+        """
+        Register a catalog file that was just written, with its fingerprint.
+
+        Parameters:
+        -----------
+        dataset_key : str
+            ``<domain>_<variables|value_labels>_<lang>``, the name of the catalog file
+        path : str
+            The catalog file
+        domain, label_type, lang : str
+            The catalog ('variables' or 'values' for label_type)
+        version : str, default 'latest'
+            Catalog version
+        schema : str, default ''
+            Schema version of the file
+        source : str, default 'api'
+            'api' for downloaded catalogs, 'user' for catalogs maintained by the user
+        """
+        stat = os.stat(path)
+        self._write(dataset_key, {
+            'domain': domain, 'type': label_type, 'lang': lang, 'version': version, 'schema': schema,
+            # The download time is the file's, so the fingerprint can tell a later download apart
+            'downloaded': stata_clock(stat.st_mtime), 'source': source, 'file_size': stat.st_size,
+            'last_checked': stata_clock(time.time()), 'mtime': stat.st_mtime_ns, 'sha256': file_sha256(path),
+        })
+
+    def verify(self, dataset_key, path):
+        """
+        Check a catalog file against its entry.
+
+        Returns one of the status constants. Entries without a fingerprint
+        (written by the Stata package or before fingerprints were kept), files
+        downloaded again after the fingerprint was taken and catalogs with
+        source 'user' get a new fingerprint instead of being reported.
+        """
+        entry = self.get(dataset_key)
+        if entry is None:
+            return self.UNTRACKED
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self.MISSING
+        trusted = entry.get('source') == 'user'
+        size = _int(entry.get('file_size'))
+        if size and size != stat.st_size and not trusted:
+            return self.CORRUPT
+        if entry.get('sha256') and _int(entry.get('mtime')) == stat.st_mtime_ns:
+            return self.OK
+
+        digest = file_sha256(path)
+        downloaded = _from_stata_clock(entry.get('downloaded'))
+        fingerprinted = (_int(entry.get('mtime')) or 0) / 1e9
+        stale = downloaded is not None and downloaded > fingerprinted + 1
+        if trusted or stale or not entry.get('sha256') or digest == entry['sha256']:
+            self._write(dataset_key, {'mtime': stat.st_mtime_ns, 'sha256': digest, 'file_size': stat.st_size})
+            return self.OK
+        return self.MODIFIED
@@ -0,0 +1,224 @@
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+# Catalog schema versions (see docs/schema.md)
+SCHEMA_LEGACY = '0.5'
+SCHEMA_V1 = '1.0'
+
+# Schema 1.0 variables columns and the legacy names used throughout the package
+V1_VARIABLE_COLUMNS = {
+    'variable_name': 'variable',
+    'variable_label': 'variable_desc',
+    'variable_definition': 'definition',
+    'variable_unit': 'unit',
+    'variable_type': 'value_type',
+}
+
+# Columns every catalog file must have, by schema and label type (see docs/schema.md)
+REQUIRED_COLUMNS = {
+    (SCHEMA_V1, 'variables'): ['variable_name', 'variable_label', 'variable_definition', 'variable_unit',
+                               'variable_type', 'value_label_id'],
+    (SCHEMA_V1, 'values'): ['value_label_id', 'variable_name', 'value_labels_json'],
+    (SCHEMA_LEGACY, 'variables'): ['variable', 'variable_desc'],
+    (SCHEMA_LEGACY, 'values'): ['variable', 'value_labels'],
+}
+VARIABLE_TYPES = ['categorical', 'continuous', 'text', 'date', 'binary']
+
+# Lines pandas skipped with on_bad_lines='warn' (reported in a ParserWarning)
+_BAD_LINE = re.compile(r'Skipping line (\d+): (.*)')
+
+
+def detect_schema(columns):
+    """Return the schema version of a catalog file from its column names."""
+    columns = set(columns)
+    if 'variable_name' in columns or 'value_labels_json' in columns:
+        return SCHEMA_V1
+    return SCHEMA_LEGACY
+
+
+def key_column(columns):
+    """Return the column that identifies the rows of a catalog file."""
+    columns = list(columns)
+    if 'value_labels_json' in columns:
+        return 'value_label_id'
+    if 'variable_name' in columns:
+        return 'variable_name'
+    return 'variable'
+
+
+def normalize_variables(df):
+    """Rename schema 1.0 variables columns to the legacy names (a no-op for legacy files)."""
+    if detect_schema(df.columns) != SCHEMA_V1:
+        return df
+    return df.rename(columns=V1_VARIABLE_COLUMNS)
+
+
+def label_set_ids(values):
+    """Convert value_label_id values to Python ints (missing ids become None)."""
+    ids = pd.to_numeric(values, errors='coerce')
+    return [None if pd.isna(i) else int(i) for i in ids.tolist()]
+
+
+def parse_value_labels(text):
+    """
+    Parse one value label set into a {code: label} dict.
+
+    Schema 1.0 stores strict JSON with string keys, which is returned as parsed.
+    Anything else (legacy Python-style dicts, nested values) goes through
+    ``safe_json_parse``.
+    """
+    from .autolabel import safe_json_parse
+    if not isinstance(text, str):
+        return {}
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return safe_json_parse(text)
+    if isinstance(parsed, dict) and not any(isinstance(v, (dict, list)) for v in parsed.values()):
+        return parsed
+    return safe_json_parse(text)
+
+
+class ValueLabelSets:
+    """
+    Value label sets parsed on first use and kept, so every variable that uses
+    a set shares one dict.
+
+    Sets are keyed by ``value_label_id`` for schema 1.0 catalogs and by their
+    text for legacy catalogs, where variables that share a code list repeat it.
+    The shared dicts should be treated as read-only. Threads can share the
+    sets: when two threads parse the same set at once, both get the dict that
+    was stored first.
+    """
+
+    def __init__(self, raw=None):
+        # value_label_id -> JSON text (schema 1.0 only)
+        self._raw = raw if raw is not None else {}
+        self._parsed = {}
+
+    def __len__(self):
+        return len(self._parsed)
+
+    def parsed(self):
+        """Return the sets parsed so far."""
+        return list(self._parsed.values())
+
+    def get(self, set_id):
+        """Return the parsed set with this value_label_id, or None if there is none."""
+        parsed = self._parsed.get(set_id)
+        if parsed is None:
+            text = self._raw.get(set_id)
+            if text is None:
+                return None
+            parsed = self._parsed.setdefault(set_id, parse_value_labels(text))
+        return parsed
+
+    def parse(self, text):
+        """Return the parsed set for a label text, reusing the dict of an identical text."""
+        parsed = self._parsed.get(text)
+        if parsed is None:
+            parsed = self._parsed.setdefault(text, parse_value_labels(text))
+        return parsed
+
+
+def bad_lines(caught):
+    """Return (line, reason) for the malformed lines reported in caught ParserWarnings."""
+    found = []
+    for warning in caught:
+        if issubclass(warning.category, pd.errors.ParserWarning):
+            found.extend((int(line), reason) for line, reason in _BAD_LINE.findall(str(warning.message)))
+    return found
+
+
+def _blank(values):
+    # isspace stops at the first other character, so long labels cost nothing
+    text = values.astype(str)
+    return values.isna().to_numpy() | (text == '').to_numpy() | text.str.isspace().to_numpy()
+
+
+def _not_integer(values):
+    numbers = pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    return ~_blank(values) & ~(np.isfinite(numbers) & (np.floor(numbers) == numbers))
+
+
+def _not_object(values):
+    text = values.astype(str)
+    bad = ~(text.str.startswith('{') & text.str.endswith('}')).to_numpy() & ~_blank(values)
+    if bad.any():
+        # Only the few rows that failed are stripped of surrounding whitespace and checked again
+        stripped = text[bad].str.strip()
+        bad[bad] = ~(stripped.str.startswith('{') & stripped.str.endswith('}')).to_numpy()
+    return bad
+
+
+def validate_catalog(df, label_type, file=None, skipped=()):
+    """
+    Check the rows of one catalog file against its schema.
+
+    Every check works on whole columns, so a file is validated in one pass and
+    no value labels are parsed. Value label sets are only checked to be
+    enclosed in braces, which catches rows cut off by a bad download or split.
+    Line numbers count the header as line 1 and assume one line per row.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        The file as read (before combining)
+    label_type : str
+        'variables' or 'values'
+    file : str, optional
+        Name of the file, for the report
+    skipped : list, default ()
+        (line, reason) of the malformed lines the reader skipped (see bad_lines)
+
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per problem with the columns file, line, severity ('error' or
+        'warning') and problem. Empty if the file is valid
+    """
+    issues = [(line, 'error', f"malformed line skipped ({reason})") for line, reason in skipped]
+    schema = detect_schema(df.columns)
+    missing = [col for col in REQUIRED_COLUMNS[(schema, label_type)] if col not in df.columns]
+    if missing:
+        issues.append((1, 'error', f"missing required column(s): {', '.join(missing)}"))
+
+    checks = []
+    if schema == SCHEMA_V1 and label_type == 'variables':
+        if 'variable_name' in df.columns:
+            checks.append((_blank(df['variable_name']), 'error', "empty variable_name"))
+        if 'variable_type' in df.columns:
+            types = df['variable_type']
+            checks.append((~_blank(types) & ~types.isin(VARIABLE_TYPES).to_numpy(), 'warning',
+                           "non-standard variable_type"))
+        if 'value_label_id' in df.columns:
+            checks.append((_not_integer(df['value_label_id']), 'error', "value_label_id is not an integer"))
+    elif schema == SCHEMA_V1:
+        if 'value_label_id' in df.columns:
+            ids = df['value_label_id']
+            checks.append((_blank(ids), 'error', "empty value_label_id"))
+            checks.append((_not_integer(ids), 'error', "value_label_id is not an integer"))
+        if 'value_labels_json' in df.columns:
+            checks.append((_blank(df['value_labels_json']), 'warning', "empty value_labels_json"))
+            checks.append((_not_object(df['value_labels_json']), 'error', "value_labels_json is not a JSON object"))
+    else:
+        if 'variable' in df.columns:
+            checks.append((_blank(df['variable']), 'error', "empty variable"))
+        if label_type == 'values' and 'value_labels' in df.columns:
+            checks.append((_blank(df['value_labels']), 'warning', "empty value_labels"))
+            checks.append((_not_object(df['value_labels']), 'error', "value_labels is not a dictionary"))
+
+    if checks:
+        # Rows after a skipped line sit one line further down
+        lines = np.arange(2, len(df) + 2)
+        for line in sorted(line for line, _ in skipped):
+            lines[lines >= line] += 1
+        for mask, severity, problem in checks:
+            issues.extend((int(line), severity, problem) for line in lines[mask])
+
+    report = pd.DataFrame(issues, columns=['line', 'severity', 'problem'])
+    report.insert(0, 'file', file)
+    return report.sort_values('line', kind='stable', ignore_index=True)
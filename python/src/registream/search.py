@@ -0,0 +1,175 @@
+import os
+import re
+import sqlite3
+import pandas as pd
+from .label_fetcher import LabelFetcher
+from .catalog import load_catalog
+from .usage import argument_repr, log_usage
+from .client import get_client
+
+# Default languages covered by the catalog-wide index
+DEFAULT_LANGS = ('eng', 'swe')
+
+# bm25 column weights: variable, lang, label, definition, value_labels.
+# Hits in names and labels rank above hits buried in long definitions.
+_BM25_WEIGHTS = (10.0, 0.0, 5.0, 1.0, 1.0)
+
+
+def _index_path(domain):
+    """Return the path of the search index database for a domain."""
+    return os.path.join(LabelFetcher.get_default_dir(), f"{domain}_search.sqlite")
+
+
+def _connect(path):
+    """Open the index database, creating the schema if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5("
+            "variable, lang UNINDEXED, label, definition, value_labels, "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+    except sqlite3.OperationalError as e:
+        conn.close()
+        raise RuntimeError(
+            "The full-text search index requires SQLite with the FTS5 extension, "
+            f"which is not available in this Python build ({e})."
+        )
+    conn.execute("CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, signature TEXT)")
+    return conn
+
+
+def _source_signature(domain, lang, label_type):
+    """Return the path and a signature string of a catalog file, downloading it if needed."""
+    fetcher = LabelFetcher(domain=domain, lang=lang, label_type=label_type)
+    csv_path = fetcher.ensure_labels()
+    stat = os.stat(csv_path)
+    return f"{csv_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _index_language(conn, domain, lang):
+    """Replace all indexed rows for one language with the current catalog contents."""
+    var_df = load_catalog(domain=domain, lang=lang, label_type='variables')
+    val_df = load_catalog(domain=domain, lang=lang, label_type='values')
+
+    def text_column(df, column):
+        if column not in df.columns:
+            return pd.Series('', index=df.index)
+        return df[column].fillna('').astype(str)
+
+    # Value labels are indexed as raw text: the tokenizer drops the braces and
+    # quotes, so there is no need to parse every dictionary
+    value_text = text_column(val_df, 'value_labels').reindex(var_df.index, fill_value='')
+
+    rows = zip(
+        var_df.index.tolist(),
+        [lang] * len(var_df),
+        text_column(var_df, 'variable_desc').tolist(),
+        text_column(var_df, 'definition').tolist(),
+        value_text.tolist(),
+    )
+    conn.execute("DELETE FROM docs WHERE lang = ?", (lang,))
+    conn.executemany("INSERT INTO docs VALUES (?, ?, ?, ?, ?)", rows)
+
+
+def build_search_index(domain='scb', lang=None, force=False):
+    """
+    Build or refresh the full-text search index for a domain.
+
+    The index is stored as an SQLite database next to the label files and is
+    only rebuilt for languages whose catalog files changed since the last build.
+
+    Parameters:
+    -----------
+    domain : str, default 'scb'
+        The domain to index
+    lang : str, list or None, default None
+        Language(s) to index. None indexes both English and Swedish
+    force : bool, default False
+        Rebuild the index even if the catalog files are unchanged
+
+    Returns:
+    --------
+    str
+        Path to the index database
+    """
+    langs = DEFAULT_LANGS if lang is None else ([lang] if isinstance(lang, str) else list(lang))
+    path = _index_path(domain)
+
+    conn = _connect(path)
+    try:
+        with conn:
+            for lg in langs:
+                signature = '|'.join(
+                    _source_signature(domain, lg, label_type)
+                    for label_type in ('variables', 'values')
+                )
+                row = conn.execute("SELECT signature FROM sources WHERE name = ?", (lg,)).fetchone()
+                if not force and row is not None and row[0] == signature:
+                    continue
+                _index_language(conn, domain, lg)
+                conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (lg, signature))
+    finally:
+        conn.close()
+    return path
+
+
+def _to_fts_query(query):
+    """Turn free text into an FTS5 query where every word must match as a prefix."""
+    words = re.findall(r"\w+", query, flags=re.UNICODE)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def search(query, domain='scb', lang=None, limit=20):
+    """
+    Search variable names, labels, definitions and value labels across the catalog.
+
+    Parameters:
+    -----------
+    query : str
+        Free-text query. Every word must match (as a prefix), case and accent insensitive
+    domain : str, default 'scb'
+        The domain to search
+    lang : str, list or None, default None
+        Language(s) to search. None searches both English and Swedish
+    limit : int, default 20
+        Maximum number of results to return
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Matching variables ranked by relevance (highest ``score`` first), with
+        columns ``variable``, ``lang``, ``label``, ``definition`` and ``score``
+    """
+    log_usage(f"search({argument_repr(query)}, domain={domain!r}, lang={lang!r}, limit={limit!r})")
+    client = get_client()
+    if client is not None:
+        return pd.DataFrame(client.search(query, domain=domain, lang=lang, limit=limit),
+                            columns=['variable', 'lang', 'label', 'definition', 'score'])
+    return _search(query, domain, lang, limit)
+
+
+def _search(query, domain='scb', lang=None, limit=20):
+    """Run a search against the local index."""
+    columns = ['variable', 'lang', 'label', 'definition', 'score']
+    fts_query = _to_fts_query(query)
+    if not fts_query:
+        return pd.DataFrame(columns=columns)
+
+    langs = DEFAULT_LANGS if lang is None else ([lang] if isinstance(lang, str) else list(lang))
+    path = build_search_index(domain=domain, lang=langs)
+
+    placeholders = ', '.join('?' * len(langs))
+    weights = ', '.join(str(w) for w in _BM25_WEIGHTS)
+    sql = (
+        f"SELECT variable, lang, label, definition, -bm25(docs, {weights}) AS score "
+        f"FROM docs WHERE docs MATCH ? AND lang IN ({placeholders}) "
+        "ORDER BY score DESC LIMIT ?"
+    )
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(sql, (fts_query, *langs, int(limit))).fetchall()
+    finally:
+        conn.close()
+    return pd.DataFrame(rows, columns=columns)
@@ -0,0 +1,207 @@
+import json
+import os
+import socket
+import socketserver
+import stat
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .catalog import load_catalog, value_labels_for
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# The service only listens on the local machine
+_LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+
+class LabelService:
+    """
+    Answers label queries from catalogs held in memory.
+
+    Catalogs are loaded once (and reloaded when their files change, see
+    ``load_catalog``). Value label sets are parsed on first request and kept.
+    Answers always come from the files, even in a process that has a label
+    service configured itself.
+    """
+
+    def preload(self, domain, langs):
+        for lang in langs:
+            load_catalog(domain=domain, lang=lang, label_type='variables')
+            load_catalog(domain=domain, lang=lang, label_type='values')
+
+    def variable_labels(self, variables, domain='scb', lang='eng'):
+        """Return {variable: label} for the variables found in the catalog."""
+        catalog = load_catalog(domain=domain, lang=lang, label_type='variables')
+        if 'variable_desc' not in catalog.columns:
+            return {}
+        found = catalog['variable_desc'].reindex(list(variables)).dropna()
+        return {var: str(label) for var, label in found.items()}
+
+    def value_labels(self, variables, domain='scb', lang='eng'):
+        """Return {variable: {code: label}} for the variables with value labels."""
+        # Variables in the catalog get a dict (empty if unparseable), as in autolabel
+        labels = value_labels_for(variables, domain=domain, lang=lang)
+        return {var: val_dict or {} for var, val_dict in labels.items()}
+
+    def lookup(self, variables, domain='scb', lang='eng'):
+        """Return lookup_table records (missing values as None)."""
+        from .lookup import _lookup_table_from_files
+        table = _lookup_table_from_files(list(variables), domain, lang)
+        table = table.astype(object).where(table.notna(), None)
+        return table.to_dict('records')
+
+    def search(self, query, domain='scb', lang=None, limit=20):
+        from .search import _search
+        return _search(query, domain=domain, lang=lang, limit=limit).to_dict('records')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """JSON over HTTP: POST /variables, /values, /lookup; GET /search, /health."""
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without this small responses wait for delayed ACKs
+    disable_nagle_algorithm = True
+    service = None
+
+    def log_message(self, format, *args):
+        # Requests are not logged; the service is meant to run quietly
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            if url.path == '/health':
+                self._send(200, {'status': 'ok', 'pid': os.getpid()})
+            elif url.path == '/search':
+                lang = params.get('lang')
+                results = self.service.search(
+                    params.get('q', ''), domain=params.get('domain', 'scb'),
+                    lang=lang.split(',') if lang else None, limit=int(params.get('limit', 20)),
+                )
+                self._send(200, {'results': results})
+            else:
+                self._send(404, {'error': f"Unknown path: {url.path}"})
+        except Exception as e:
+            self._send(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def do_POST(self):
+        handlers = {
+            '/variables': self.service.variable_labels,
+            '/values': self.service.value_labels,
+            '/lookup': self.service.lookup,
+        }
+        handler = handlers.get(urlparse(self.path).path)
+        if handler is None:
+            self._send(404, {'error': f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            variables = request['variables']
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {'error': f"Expected a JSON body with a 'variables' list ({e})"})
+            return
+        try:
+            result = handler(variables, domain=request.get('domain', 'scb'), lang=request.get('lang', 'eng'))
+            self._send(200, {'result': result})
+        except Exception as e:
+            self._send(500, {'error': f"{type(e).__name__}: {e}"})
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        return request, ('local', 0)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, service=None):
+    """
+    Create (but do not start) the label service's HTTP server.
+
+    Parameters:
+    -----------
+    host : str, default '127.0.0.1'
+        Loopback address to listen on
+    port : int, default 8765
+        TCP port to listen on (0 picks a free port)
+    socket_path : str, optional
+        Listen on this Unix domain socket instead of a TCP port
+    service : LabelService, optional
+        The service answering requests; a new one by default
+
+    Returns:
+    --------
+    socketserver.BaseServer
+        Call ``serve_forever()`` to start it
+    """
+    handler = type('Handler', (_Handler,), {'service': service or LabelService()})
+    if socket_path:
+        # A stale socket from an earlier run is replaced; any other file is left alone
+        try:
+            mode = os.lstat(socket_path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"{socket_path} exists and is not a socket")
+            os.remove(socket_path)
+        # Unix sockets have no TCP options to set
+        handler.disable_nagle_algorithm = False
+        return _UnixHTTPServer(socket_path, handler)
+    if host not in _LOOPBACK_HOSTS:
+        raise ValueError(f"The label service only listens on the local machine, not on {host!r}")
+    server_class = ThreadingHTTPServer
+    if ':' in host:
+        server_class = type('IPv6Server', (ThreadingHTTPServer,), {'address_family': socket.AF_INET6})
+    return server_class((host, port), handler)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, domain='scb', langs=('eng', 'swe'),
+          preload=True):
+    """
+    Run the local label service until interrupted.
+
+    Worker processes then resolve labels through it instead of each loading
+    the catalog (see ``registream.use_server``).
+
+    Parameters:
+    -----------
+    host : str, default '127.0.0.1'
+        Loopback address to listen on
+    port : int, default 8765
+        TCP port to listen on
+    socket_path : str, optional
+        Listen on this Unix domain socket instead of a TCP port
+    domain : str, default 'scb'
+        Domain whose catalogs are loaded at startup
+    langs : tuple, default ('eng', 'swe')
+        Languages whose catalogs are loaded at startup
+    preload : bool, default True
+        Load the catalogs before accepting requests instead of on first use
+    """
+    service = LabelService()
+    if preload:
+        service.preload(domain, langs)
+    server = make_server(host, port, socket_path, service)
+    where = f"unix://{socket_path}" if socket_path else f"http://{host}:{server.server_address[1]}"
+    print(f"RegiStream label service listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
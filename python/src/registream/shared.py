@@ -0,0 +1,326 @@
+import bisect
+import json
+import mmap
+import os
+
+import numpy as np
+import pandas as pd
+
+from .catalog import load_catalog, _domains, _file_signature
+from .instrumentation import timer, count
+from .label_fetcher import LabelFetcher
+from .schema import ValueLabelSets
+from .store import key_lock
+
+# Processes started after share_catalog() inherit this variable, so pool
+# workers use the shared files whatever the start method (fork or spawn)
+ENV_VAR = 'REGISTREAM_SHARED_CATALOG'
+
+_MAGIC = b'RSCATMAP'
+_VERSION = 1
+
+# Attached catalogs of this process keyed by (domain, lang, label_type)
+_attached = {}
+
+
+def _csv_path(domain, lang, label_type):
+    return LabelFetcher(domain=domain, lang=lang, label_type=label_type).csv_path
+
+
+def _map_path(domain, lang, label_type):
+    """The shared file sits next to the catalog CSV it was built from."""
+    return os.path.splitext(_csv_path(domain, lang, label_type))[0] + '.rsmap'
+
+
+def _write_map(catalog, path, source):
+    """
+    Write a catalog as a read-only file layout that can be mapped without parsing.
+
+    Layout: magic, header length, JSON header (fields, rows, source file), then
+    a little-endian uint64 array of byte offsets (one per field per row, plus
+    the end) and the UTF-8 text of all fields. Rows are sorted by variable
+    name so lookups are binary searches. An empty field means a missing value.
+    """
+    catalog = catalog.sort_index(key=lambda index: index.map(lambda name: str(name).encode('utf-8')))
+    fields = ['variable'] + [str(column) for column in catalog.columns]
+    columns = [catalog.index.astype(str).tolist()]
+    for column in catalog.columns:
+        values = catalog[column]
+        columns.append(values.where(values.notna(), '').astype(str).tolist())
+
+    chunks = []
+    lengths = np.empty(len(catalog) * len(fields), dtype=np.uint64)
+    i = 0
+    for row in zip(*columns):
+        for value in row:
+            data = value.encode('utf-8')
+            chunks.append(data)
+            lengths[i] = len(data)
+            i += 1
+    offsets = np.zeros(len(lengths) + 1, dtype='<u8')
+    np.cumsum(lengths, out=offsets[1:])
+
+    numeric = [str(column) for column in catalog.columns if pd.api.types.is_numeric_dtype(catalog[column])]
+    header = json.dumps({
+        'version': _VERSION, 'fields': fields, 'numeric': numeric, 'rows': len(catalog), 'source': source,
+    }).encode('utf-8')
+    # Pad the header so the offset array is 8-byte aligned
+    header += b' ' * (-(len(_MAGIC) + 8 + len(header)) % 8)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        f.write(offsets.tobytes())
+        f.write(b''.join(chunks))
+    # Processes that already mapped the old file keep reading it until they re-attach
+    os.replace(tmp_path, path)
+
+
+class SharedCatalog:
+    """
+    A catalog file mapped read-only into memory.
+
+    All processes that attach to the same file share its pages through the
+    operating system's page cache, so memory use does not grow with the number
+    of worker processes. Nothing is parsed on attach; fields are decoded when
+    they are looked up. Value label sets are parsed once per process and
+    kept, so variables that use the same set share one dict.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not a shared catalog file")
+        header_length = int.from_bytes(self._map[len(_MAGIC):len(_MAGIC) + 8], 'little')
+        start = len(_MAGIC) + 8
+        self.header = json.loads(self._map[start:start + header_length])
+        self.fields = self.header['fields']
+        self.rows = self.header['rows']
+        start += header_length
+        n_offsets = self.rows * len(self.fields) + 1
+        self._offsets = np.frombuffer(self._map, dtype='<u8', count=n_offsets, offset=start)
+        self._data = start + 8 * n_offsets
+        self._names = _Names(self)
+        self.value_label_sets = ValueLabelSets()
+
+    def _field(self, row, field):
+        i = row * len(self.fields) + field
+        start, end = int(self._offsets[i]), int(self._offsets[i + 1])
+        if start == end:
+            return None
+        return self._map[self._data + start:self._data + end].decode('utf-8')
+
+    def _row(self, variable):
+        """Return the row number of a variable, or None."""
+        key = variable.encode('utf-8')
+        row = bisect.bisect_left(self._names, key)
+        if row < self.rows and self._names[row] == key:
+            return row
+        return None
+
+    def get(self, variables, field):
+        """Return {variable: value} of one field for the variables in the catalog."""
+        column = self.fields.index(field)
+        result = {}
+        for variable in variables:
+            row = self._row(str(variable))
+            if row is not None:
+                result[variable] = self._field(row, column)
+        return result
+
+    def value_labels(self, variables):
+        """Return {variable: parsed value labels} for the variables in the catalog."""
+        column = self.fields.index('value_labels')
+        sets = self.value_label_sets
+        result = {}
+        for variable in variables:
+            row = self._row(str(variable))
+            if row is not None:
+                text = self._field(row, column)
+                result[variable] = sets.parse(text) if text is not None else None
+        return result
+
+    def records(self, variables):
+        """Return one dict of all fields per variable (None for variables not in the catalog)."""
+        result = []
+        for variable in variables:
+            row = self._row(str(variable))
+            if row is None:
+                result.append(None)
+            else:
+                result.append({field: self._field(row, i) for i, field in enumerate(self.fields)})
+        return result
+
+    def close(self):
+        self._offsets = None
+        self._map.close()
+
+
+class _Names:
+    """Sequence view of the (UTF-8 encoded) variable names, for bisect."""
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+
+    def __len__(self):
+        return self._catalog.rows
+
+    def __getitem__(self, row):
+        catalog = self._catalog
+        i = row * len(catalog.fields)
+        start, end = int(catalog._offsets[i]), int(catalog._offsets[i + 1])
+        return catalog._map[catalog._data + start:catalog._data + end]
+
+
+def attach(domain='scb', lang='eng', label_type='variables'):
+    """
+    Return the shared catalog of this process, or None if there is no up-to-date file.
+
+    Workers never build the file; if it is missing or older than the CSV they
+    fall back to reading the CSV as usual.
+    """
+    key = (domain, lang, label_type)
+    path = _map_path(domain, lang, label_type)
+    csv_path = _csv_path(domain, lang, label_type)
+    try:
+        map_signature = _file_signature(path)
+        source = [csv_path, list(_file_signature(csv_path))]
+    except OSError:
+        return None
+    cached = _attached.get(key)
+    if cached is not None and cached[0] == map_signature:
+        return cached[1] if cached[1].header['source'] == source else None
+    # One thread maps the file; the others use its mapping
+    with key_lock(path):
+        cached = _attached.get(key)
+        if cached is not None and cached[0] == map_signature:
+            return cached[1] if cached[1].header['source'] == source else None
+        try:
+            shared = SharedCatalog(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        if shared.header['source'] != source:
+            shared.close()
+            return None
+        count('shared.attach', domain=domain, lang=lang, label_type=label_type)
+        _attached[key] = (map_signature, shared)
+        return shared
+
+
+def share_catalog(domain='scb', lang=None, label_types=('variables', 'values')):
+    """
+    Load the catalog once into a file that pool worker processes map into memory.
+
+    Call this in the parent process before creating a ``multiprocessing`` or
+    ``concurrent.futures`` pool. Workers then answer ``autolabel`` and
+    ``lookup_table`` from the shared pages instead of each parsing the CSV
+    files and keeping their own copy, so their memory stays flat as the pool
+    grows. The file is rebuilt only when the catalog changes.
+
+    Parameters:
+    -----------
+    domain : str, default 'scb'
+        The domain to share
+    lang : str, list or None, default None
+        Language(s) to share. None shares both English and Swedish
+    label_types : tuple, default ('variables', 'values')
+        Label types to share
+
+    Returns:
+    --------
+    list
+        Paths of the shared catalog files
+    """
+    langs = ('eng', 'swe') if lang is None else ([lang] if isinstance(lang, str) else list(lang))
+    paths = []
+    for lg in langs:
+        for label_type in label_types:
+            catalog = load_catalog(domain=domain, lang=lg, label_type=label_type)
+            csv_path = _csv_path(domain, lg, label_type)
+            source = [csv_path, list(_file_signature(csv_path))]
+            path = _map_path(domain, lg, label_type)
+            if attach(domain, lg, label_type) is None:
+                with timer('shared.build', domain=domain, lang=lg, label_type=label_type):
+                    _write_map(catalog, path, source)
+            paths.append(path)
+    os.environ[ENV_VAR] = '1'
+    return paths
+
+
+def unshare_catalog():
+    """Go back to reading the CSV files in every process started from now on."""
+    os.environ.pop(ENV_VAR, None)
+    for _, shared in _attached.values():
+        shared.close()
+    _attached.clear()
+
+
+class SharedLabelSource:
+    """Answers autolabel and lookup_table from the shared catalog files."""
+
+    def _first_match(self, method, variables, domain, lang):
+        """Ask each domain in turn for the variables no earlier domain had."""
+        result = {}
+        remaining = list(variables)
+        for name in _domains(domain):
+            found = method(remaining, name, lang)
+            if found is None:
+                return None
+            result.update(found)
+            remaining = [var for var in remaining if var not in found]
+        return {var: result[var] for var in variables if var in result}
+
+    def variable_labels(self, variables, domain='scb', lang='eng'):
+        if not isinstance(domain, str):
+            return self._first_match(self.variable_labels, variables, domain, lang)
+        shared = attach(domain, lang, 'variables')
+        if shared is None or 'variable_desc' not in shared.fields:
+            return None
+        found = shared.get(variables, 'variable_desc')
+        return {var: label for var, label in found.items() if label is not None}
+
+    def value_labels(self, variables, domain='scb', lang='eng'):
+        if not isinstance(domain, str):
+            return self._first_match(self.value_labels, variables, domain, lang)
+        shared = attach(domain, lang, 'values')
+        if shared is None or 'value_labels' not in shared.fields:
+            return None
+        return {var: val_dict if val_dict is not None else {}
+                for var, val_dict in shared.value_labels(variables).items()}
+
+    def lookup_table(self, variables, domain='scb', lang='eng'):
+        if not isinstance(domain, str):
+            return None  # merged from the catalog files instead
+        var_shared = attach(domain, lang, 'variables')
+        val_shared = attach(domain, lang, 'values')
+        if var_shared is None or val_shared is None:
+            return None
+        fields = var_shared.fields
+        rows = []
+        value_labels = val_shared.value_labels(variables) if 'value_labels' in val_shared.fields else {}
+        for variable, record in zip(variables, var_shared.records(variables)):
+            row = record if record is not None else dict.fromkeys(fields, None)
+            row['variable'] = variable
+            row['found'] = record is not None and row.get('variable_desc') is not None
+            row['value_labels'] = value_labels.get(variable)
+            rows.append(row)
+        columns = fields + [c for c in ('found', 'value_labels') if c not in fields]
+        table = pd.DataFrame(rows, columns=columns)
+        # Fields are stored as text; restore the numeric columns of the CSV
+        for column in var_shared.header.get('numeric', []):
+            table[column] = pd.to_numeric(table[column])
+        return table
+
+
+_source = SharedLabelSource()
+
+
+def get_shared_source():
+    """Return the shared-catalog label source if sharing is on in this process, or None."""
+    if os.environ.get(ENV_VAR) != '1':
+        return None
+    return _source
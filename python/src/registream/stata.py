@@ -0,0 +1,519 @@
+import datetime
+import re
+import struct
+import warnings
+import numpy as np
+import pandas as pd
+
+# Stata 14+ (dta format 118) type codes
+_BYTE, _INT, _LONG, _FLOAT, _DOUBLE = 65530, 65529, 65528, 65527, 65526
+_MAX_STR_WIDTH = 2045
+
+# numpy dtype, missing value, smallest and largest valid value per numeric type
+_NUMERIC_TYPES = {
+    _BYTE: ('<i1', 101, -127, 100),
+    _INT: ('<i2', 32741, -32767, 32740),
+    _LONG: ('<i4', 2147483621, -2147483647, 2147483620),
+    _FLOAT: ('<f4', struct.unpack('<f', b'\x00\x00\x00\x7f')[0], None, None),
+    _DOUBLE: ('<f8', struct.unpack('<d', b'\x00\x00\x00\x00\x00\x00\xe0\x7f')[0], None, None),
+}
+_FORMATS = {_BYTE: '%8.0g', _INT: '%8.0g', _LONG: '%12.0g', _FLOAT: '%9.0g', _DOUBLE: '%10.0g'}
+
+# Names Stata does not accept as variable names
+_RESERVED_NAMES = frozenset(
+    "aggregate array boolean break byte case catch class colvector complex const continue "
+    "default delegate delete do double else eltypedef end enum explicit export external float "
+    "for friend function global goto if inline int local long NULL pragma protected quad "
+    "rowvector short typedef typename virtual _all _N _skip _b _pi str# in _pred strL _coef "
+    "_rc using _cons _se with _n".split()
+)
+
+# Byte offset of the row count in the header
+_N_OFFSET = len(b'<stata_dta><header><release>118</release><byteorder>LSF</byteorder><K>') + 2 + len(b'</K><N>')
+
+_MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+_STATA_EPOCH = np.datetime64('1960-01-01T00:00:00', 'ms')
+
+
+class _Column:
+    """How one output variable is derived from a source column and stored."""
+
+    def __init__(self, name, source, kind, typ, fmt, label=''):
+        self.name = name          # Stata variable name
+        self.source = source      # Source column in the DataFrame
+        self.kind = kind          # 'numeric', 'datetime', 'string', 'encoded' or 'categorical'
+        self.typ = typ            # Stata type code
+        self.fmt = fmt            # Stata display format
+        self.label = label        # Variable label
+        self.value_label = ''     # Name of the attached value label set
+        self.categories = None    # pd.Index of codes for 'encoded' / 'categorical' columns
+        self.code_labels = None   # Labels for the categories of 'encoded' columns
+
+    @property
+    def dtype(self):
+        if self.typ <= _MAX_STR_WIDTH:
+            return f'S{self.typ}'
+        return _NUMERIC_TYPES[self.typ][0]
+
+
+def _stata_name(name, taken):
+    """Turn a column name into a valid, unique Stata variable name."""
+    new = re.sub(r'[^A-Za-z0-9_]', '_', str(name))
+    if not new or new[0].isdigit() or new in _RESERVED_NAMES:
+        new = '_' + new
+    new = new[:32]
+    base, i = new, 1
+    while new in taken:
+        suffix = f"_{i}"
+        new = base[:32 - len(suffix)] + suffix
+        i += 1
+    return new
+
+
+def _smallest_int_type(min_value, max_value):
+    """Return the smallest Stata integer type holding the range, or double."""
+    for typ in (_BYTE, _INT, _LONG):
+        _, _, low, high = _NUMERIC_TYPES[typ]
+        if min_value >= low and max_value <= high:
+            return typ
+    return _DOUBLE
+
+
+def _utf8_width(series):
+    """Return the largest UTF-8 byte length of the non-missing strings in a Series."""
+    uniques = pd.unique(series.dropna().astype(str))
+    if not len(uniques):
+        return 1
+    return max(max(len(value.encode('utf-8')) for value in uniques), 1)
+
+
+def _int_value_labels(val_dict):
+    """Keep the value labels whose codes are integers Stata can label."""
+    result = {}
+    for code, label in val_dict.items():
+        try:
+            value = int(str(code))
+        except ValueError:
+            continue
+        if -2147483647 <= value <= 2147483620:
+            result[value] = str(label)
+    return result
+
+
+def _code_string(value):
+    """Return a code as value label keys write it (1.0 as '1')."""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _pad(text, length):
+    """Encode text as UTF-8, truncated and null-padded to a fixed length."""
+    raw = str(text).encode('utf-8')[:length - 1]
+    # Do not cut a multi-byte character in half
+    raw = raw.decode('utf-8', errors='ignore').encode('utf-8')
+    return raw + b'\x00' * (length - len(raw))
+
+
+def _value_label_table(name, labels):
+    """Build a <lbl> entry for a value label set."""
+    items = sorted(labels.items())
+    offsets, texts, pos = [], [], 0
+    for _, text in items:
+        raw = str(text).encode('utf-8')[:32000] + b'\x00'
+        offsets.append(pos)
+        texts.append(raw)
+        pos += len(raw)
+    n = len(items)
+    table = struct.pack('<ii', n, pos)
+    table += struct.pack(f'<{n}i', *offsets) + struct.pack(f'<{n}i', *(v for v, _ in items))
+    table += b''.join(texts)
+    return b'<lbl>' + struct.pack('<i', len(table)) + _pad(name, 129) + b'\x00' * 3 + table + b'</lbl>'
+
+
+class _DtaWriter:
+    """
+    Stream a DataFrame (or an iterable of DataFrame chunks) to a Stata 14+ .dta file.
+
+    Rows are converted and written one chunk at a time, so the only extra memory
+    needed is one chunk's worth of binary records. Value label tables are
+    written after the data, which lets encoded string columns discover new codes
+    while streaming.
+    """
+
+    def __init__(self, path, variable_labels, value_labels, suffix='_lbl', data_label='',
+                 str_widths=None):
+        self.path = path
+        self.variable_labels = variable_labels or {}
+        self.value_labels = value_labels or {}
+        self.suffix = suffix
+        self.data_label = data_label or ''
+        self.str_widths = str_widths or {}
+        self.columns = []
+
+    # -- column layout ---------------------------------------------------------
+
+    def _plan(self, df, full):
+        """Decide output variables and types; `full` means df holds all rows."""
+        taken = set()
+
+        def add(source, kind, typ, fmt, name=None, label=None):
+            column = _Column(_stata_name(source if name is None else name, taken), source, kind,
+                             typ, fmt, self.variable_labels.get(source, '') if label is None else label)
+            if column.name != str(source if name is None else name):
+                warnings.warn(f"Column '{source}' is written to Stata as '{column.name}'")
+            taken.add(column.name)
+            self.columns.append(column)
+            return column
+
+        for col in df.columns:
+            series = df[col]
+            dtype = series.dtype
+            val_dict = self.value_labels.get(col) or {}
+
+            if isinstance(dtype, pd.CategoricalDtype):
+                column = add(col, 'categorical', _smallest_int_type(1, max(len(dtype.categories), 1)), '%8.0g')
+                column.categories = dtype.categories
+            elif pd.api.types.is_bool_dtype(dtype):
+                add(col, 'numeric', _BYTE, '%8.0g')
+            elif pd.api.types.is_integer_dtype(dtype):
+                if full:
+                    # A column without values fits any type
+                    typ = _smallest_int_type(series.min(), series.max()) if series.notna().any() else _BYTE
+                    if typ == _DOUBLE:
+                        warnings.warn(f"Column '{col}' exceeds Stata's long range and is stored as double")
+                else:
+                    # Later chunks may hold larger values than the first one
+                    typ = _LONG if np.dtype(getattr(dtype, 'numpy_dtype', dtype)).itemsize <= 4 else _DOUBLE
+                add(col, 'numeric', typ, _FORMATS[typ])
+            elif pd.api.types.is_float_dtype(dtype):
+                typ = _FLOAT if np.dtype(getattr(dtype, 'numpy_dtype', dtype)).itemsize <= 4 else _DOUBLE
+                add(col, 'numeric', typ, _FORMATS[typ])
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                add(col, 'datetime', _DOUBLE, '%tc')
+            else:
+                # Strings (and anything else, written as its string form)
+                width = self.str_widths.get(col)
+                if width is None:
+                    width = _utf8_width(series)
+                if width > _MAX_STR_WIDTH:
+                    raise ValueError(
+                        f"Column '{col}' has strings longer than {_MAX_STR_WIDTH} bytes, "
+                        "which Stata can only store as strL (not supported)."
+                    )
+                if not val_dict or self.suffix is not None:
+                    add(col, 'string', width, f'%{width}s')
+                if val_dict:
+                    # String codes cannot carry Stata value labels: add an encoded
+                    # copy (like Stata's `encode`) and keep the original codes
+                    name = col if self.suffix is None else f"{col}{self.suffix}"
+                    uniques = pd.Index(series.dropna().astype(str).unique()) if full else pd.Index([])
+                    categories = pd.Index(sorted(uniques), dtype=object)
+                    typ = _smallest_int_type(1, max(len(categories), 1)) if full else _LONG
+                    column = add(col, 'encoded', typ, _FORMATS[typ], name=name)
+                    column.categories = categories
+
+        if len(self.columns) > 32767:
+            raise ValueError("Stata .dta files hold at most 32,767 variables")
+
+    # -- data conversion ---------------------------------------------------------
+
+    def _convert(self, column, series):
+        """Convert one chunk of a source column to its stored numpy representation."""
+        if column.kind == 'string':
+            # Encode each distinct string once; registry codes repeat a lot
+            codes, uniques = pd.factorize(series)
+            encoded = [str(value).encode('utf-8') for value in uniques]
+            if encoded and max(len(value) for value in encoded) > column.typ:
+                raise ValueError(
+                    f"Column '{column.source}' has strings longer than {column.typ} bytes in a "
+                    f"later chunk; pass str_widths={{'{column.source}': <width>}}"
+                )
+            # Missing values (code -1) pick the trailing empty string
+            return np.array(encoded + [b''], dtype=column.dtype)[codes]
+
+        np_dtype, missing = _NUMERIC_TYPES[column.typ][:2]
+        if column.kind == 'encoded':
+            missing_mask = series.isna().to_numpy()
+            as_text = series.astype(str)
+            new = pd.Index(as_text[~missing_mask].unique()).difference(column.categories)
+            if len(new):
+                # Codes first seen in this chunk (only when streaming chunks)
+                column.categories = column.categories.append(pd.Index(sorted(new), dtype=object))
+            positions = column.categories.get_indexer(as_text)
+            positions[missing_mask] = -1
+            return np.where(positions >= 0, positions + 1, missing).astype(np_dtype)
+        if column.kind == 'categorical':
+            positions = series.cat.codes.to_numpy()
+            return np.where(positions >= 0, positions + 1, missing).astype(np_dtype)
+        if column.kind == 'datetime':
+            stamps = series.to_numpy(dtype='datetime64[ms]')
+            values = (stamps - _STATA_EPOCH).astype('i8').astype(np_dtype)
+            values[np.isnat(stamps)] = missing
+            return values
+        if column.typ in (_FLOAT, _DOUBLE):
+            values = series.to_numpy(dtype=np_dtype, na_value=np.nan)
+            return np.where(np.isnan(values), missing, values).astype(np_dtype)
+        return series.to_numpy(dtype=np_dtype, na_value=missing)
+
+    def _records(self, chunk):
+        """Convert a chunk of rows to Stata's binary record layout."""
+        records = np.empty(len(chunk), dtype=[(f'f{i}', c.dtype) for i, c in enumerate(self.columns)])
+        for i, column in enumerate(self.columns):
+            records[f'f{i}'] = self._convert(column, chunk[column.source])
+        return records.tobytes()
+
+    # -- value labels ------------------------------------------------------------
+
+    def _assign_label_names(self):
+        """Attach value label set names, sharing one set between columns with the same labels."""
+        by_source = {}
+        for column in self.columns:
+            if column.kind in ('categorical', 'encoded'):
+                column.value_label = column.name
+            elif column.kind == 'numeric' and self.value_labels.get(column.source):
+                val_dict = self.value_labels[column.source]
+                if id(val_dict) not in by_source:
+                    by_source[id(val_dict)] = column.name if _int_value_labels(val_dict) else ''
+                column.value_label = by_source[id(val_dict)]
+
+    def _label_sets(self):
+        """Build the value label sets once all data (and so all encoded codes) is written."""
+        sets = []
+        for column in self.columns:
+            if column.value_label != column.name:
+                continue
+            if column.kind == 'categorical':
+                # Categories that are codes take their registream value labels
+                by_code = {str(code): label for code, label in (self.value_labels.get(column.source) or {}).items()}
+                labels = {i + 1: str(by_code.get(_code_string(c), c)) for i, c in enumerate(column.categories)}
+            elif column.kind == 'encoded':
+                val_dict = self.value_labels.get(column.source) or {}
+                labels = {i + 1: str(val_dict.get(c, c)) for i, c in enumerate(column.categories)}
+            else:
+                labels = _int_value_labels(self.value_labels[column.source])
+            if labels:
+                sets.append((column.name, labels))
+        return sets
+
+    # -- file layout -------------------------------------------------------------
+
+    def _header(self, nobs):
+        now = datetime.datetime.now()
+        stamp = f"{now.day:02d} {_MONTHS[now.month - 1]} {now.year} {now.hour:02d}:{now.minute:02d}"
+        label = self.data_label.encode('utf-8')[:80]
+        return (
+            b'<stata_dta><header><release>118</release><byteorder>LSF</byteorder>'
+            + b'<K>' + struct.pack('<H', len(self.columns)) + b'</K>'
+            + b'<N>' + struct.pack('<Q', nobs) + b'</N>'
+            + b'<label>' + struct.pack('<H', len(label)) + label + b'</label>'
+            + b'<timestamp>' + bytes([len(stamp)]) + stamp.encode('ascii') + b'</timestamp>'
+            + b'</header>'
+        )
+
+    def _descriptors(self, offsets, f):
+        """Write the variable descriptor sections, recording their offsets."""
+        columns = self.columns
+        sections = [
+            ('variable_types', b''.join(struct.pack('<H', c.typ) for c in columns)),
+            ('varnames', b''.join(_pad(c.name, 129) for c in columns)),
+            ('sortlist', b'\x00\x00' * (len(columns) + 1)),
+            ('formats', b''.join(_pad(c.fmt, 57) for c in columns)),
+            ('value_label_names', b''.join(_pad(c.value_label, 129) for c in columns)),
+            ('variable_labels', b''.join(_pad(str(c.label)[:80], 321) for c in columns)),
+            ('characteristics', b''),
+        ]
+        for tag, body in sections:
+            offsets.append(f.tell())
+            f.write(f'<{tag}>'.encode('ascii') + body + f'</{tag}>'.encode('ascii'))
+
+    def write(self, chunks, nobs=None):
+        """
+        Write the file from an iterator of DataFrame chunks.
+
+        `nobs` is the total number of rows if known up front; otherwise the
+        header is patched once all chunks have been written.
+        """
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is None:
+            raise ValueError("No data to write")
+        if not self.columns:
+            self._plan(first, full=nobs is not None)
+        self._assign_label_names()
+
+        with open(self.path, 'wb') as f:
+            f.write(self._header(nobs or 0))
+            map_offset = f.tell()
+            f.write(b'<map>' + b'\x00' * (14 * 8) + b'</map>')
+            offsets = [0, map_offset]
+            self._descriptors(offsets, f)
+
+            # Data, one chunk at a time
+            offsets.append(f.tell())
+            f.write(b'<data>')
+            written = 0
+            for chunk in _chain_first(first, chunks):
+                f.write(self._records(chunk))
+                written += len(chunk)
+            f.write(b'</data>')
+
+            offsets.append(f.tell())
+            f.write(b'<strls></strls>')
+
+            offsets.append(f.tell())
+            f.write(b'<value_labels>')
+            for name, labels in self._label_sets():
+                f.write(_value_label_table(name, labels))
+            f.write(b'</value_labels>')
+
+            offsets.append(f.tell())
+            f.write(b'</stata_dta>')
+            offsets.append(f.tell())
+
+            # Fill in the section map and the final row count
+            f.seek(map_offset + len(b'<map>'))
+            f.write(struct.pack('<14Q', *offsets))
+            if written != nobs:
+                f.seek(_N_OFFSET)
+                f.write(struct.pack('<Q', written))
+        return self.path
+
+
+def write_stata(data, path, variable_labels=None, value_labels=None, chunksize=100_000,
+                suffix='_lbl', data_label=None, str_widths=None):
+    """
+    Write data to a Stata .dta file with native variable and value labels.
+
+    Parameters:
+    -----------
+    data : pandas.DataFrame or iterable of pandas.DataFrame
+        The data to write. An iterable of chunks (e.g. from
+        ``pd.read_csv(..., chunksize=...)``) is streamed to disk without ever
+        holding the whole dataset in memory
+    path : str
+        Output file path
+    variable_labels : dict, optional
+        Column name -> variable label. Defaults to the registream labels of
+        ``data`` (or of its first chunk)
+    value_labels : dict, optional
+        Column name -> {code: label}. Defaults like ``variable_labels``
+    chunksize : int, default 100000
+        Number of rows converted and written at a time
+    suffix : str or None, default '_lbl'
+        String columns with value labels cannot carry Stata value labels. They
+        are kept unchanged and an encoded numeric copy named ``<column><suffix>``
+        carries the labels. With ``suffix=None`` the encoded copy replaces the
+        original column, as Stata's ``encode`` does (the string codes are lost)
+    data_label : str, optional
+        Dataset label (at most 80 characters)
+    str_widths : dict, optional
+        Column name -> string width in bytes. Only needed when streaming chunks
+        whose later strings are longer than those in the first chunk
+
+    Returns:
+    --------
+    str
+        The path of the written file
+    """
+    if isinstance(data, pd.DataFrame):
+        first, nobs = data, len(data)
+        chunks = (data.iloc[start:start + chunksize] for start in range(0, max(nobs, 1), chunksize))
+    else:
+        chunks = iter(data)
+        first, nobs = next(chunks, None), None
+        if first is None:
+            raise ValueError("No data to write")
+        chunks = _chain_first(first, chunks)
+
+    labels = first.attrs.get('registream_labels', {})
+    writer = _DtaWriter(
+        path,
+        labels.get('variable_labels', {}) if variable_labels is None else variable_labels,
+        labels.get('value_labels', {}) if value_labels is None else value_labels,
+        suffix=suffix, data_label=data_label, str_widths=str_widths,
+    )
+    if nobs is not None:
+        writer._plan(first, full=True)
+    return writer.write(chunks, nobs=nobs)
+
+
+def _chain_first(first, rest):
+    """Yield `first` followed by the items of `rest`."""
+    yield first
+    for item in rest:
+        yield item
+
+
+def _stata_labels(reader, columns):
+    """Build registream labels for `columns` from an open StataReader."""
+    variable_labels = reader.variable_labels()
+    label_sets = reader.value_labels()
+    # Which value label set each variable uses (not part of pandas' public API)
+    lbllist = dict(zip(getattr(reader, '_varlist', None) or reader.varlist,
+                       getattr(reader, '_lbllist', None) or reader.lbllist))
+
+    value_labels, converted = {}, {}
+    for col in columns:
+        name = lbllist.get(col)
+        if not name or name not in label_sets:
+            continue
+        # Convert each set once, so columns sharing a set share one dict
+        if name not in converted:
+            converted[name] = {str(int(code)): str(label) for code, label in label_sets[name].items()}
+        value_labels[col] = converted[name]
+
+    return {
+        'variable_labels': {col: variable_labels[col] for col in columns if variable_labels.get(col)},
+        'value_labels': value_labels,
+    }
+
+
+def _with_labels(df, labels):
+    """Attach a per-frame copy of the labels (value label dicts are shared)."""
+    df.attrs['registream_labels'] = {
+        'variable_labels': dict(labels['variable_labels']),
+        'value_labels': dict(labels['value_labels']),
+    }
+    return df
+
+
+def read_stata(path, chunksize=None, columns=None):
+    """
+    Read a Stata .dta file with its variable and value labels as registream labels.
+
+    Values keep their numeric codes (no conversion to categoricals), so the
+    data stays compact and ``df.lab`` decodes it on display. The labels are
+    read from the file's descriptors and label tables in the same pass as the
+    data.
+
+    Parameters:
+    -----------
+    path : str
+        Path of the .dta file
+    chunksize : int, optional
+        Return an iterator yielding DataFrames of ``chunksize`` rows, each
+        carrying the labels of its columns, instead of reading the whole file
+    columns : list, optional
+        Columns to read. Only the labels of these columns are kept
+
+    Returns:
+    --------
+    pandas.DataFrame or iterator of pandas.DataFrame
+        The labeled data (or chunks of it when ``chunksize`` is given)
+    """
+    reader = pd.read_stata(path, columns=columns, convert_categoricals=False,
+                           iterator=True, chunksize=chunksize)
+    if chunksize is None:
+        with reader:
+            labels = _stata_labels(reader, columns if columns is not None else reader.variable_labels())
+            return _with_labels(reader.read(), labels)
+    return _read_stata_chunks(reader, columns)
+
+
+def _read_stata_chunks(reader, columns):
+    """Yield labeled chunks from a StataReader opened with a chunksize."""
+    with reader:
+        labels = _stata_labels(reader, columns if columns is not None else reader.variable_labels())
+        for chunk in reader:
+            yield _with_labels(chunk, labels)
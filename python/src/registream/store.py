@@ -0,0 +1,114 @@
+import threading
+
+from .instrumentation import count
+
+# Locks of keys other than store entries (such as the download of a catalog file)
+_key_locks = {}
+_key_locks_guard = threading.Lock()
+
+
+def key_lock(key):
+    """Return the reentrant lock of a key, the same lock in every thread."""
+    lock = _key_locks.get(key)
+    if lock is None:
+        with _key_locks_guard:
+            lock = _key_locks.setdefault(key, threading.RLock())
+    return lock
+
+
+class LabelStore:
+    """
+    A cache of loaded labels that threads can share.
+
+    Reads take no lock: entries are kept in a dict that is never changed after
+    it is published, and every write publishes a new dict in one assignment.
+    Loading is single-flight: when several threads miss the same key, one of
+    them loads it and the others wait for its result instead of loading it
+    again. Keys have reentrant locks, so a loader can load other keys.
+
+    Parameters:
+    -----------
+    name : str
+        Prefix of the counters recorded for the store ('<name>.cache_hits',
+        '<name>.cache_misses' and '<name>.load_waits', the number of times a
+        thread waited for another thread's load)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._entries = {}
+        self._locks = {}
+        self._write_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Return the entry of a key without loading it."""
+        return self._entries.get(key, default)
+
+    def values(self):
+        """Return the stored entries."""
+        return list(self._entries.values())
+
+    def put(self, key, value):
+        """Store an entry, replacing any entry of the key."""
+        with self._write_lock:
+            entries = dict(self._entries)
+            entries[key] = value
+            self._entries = entries
+
+    def clear(self):
+        """Drop all entries. Loads in progress still store their result."""
+        with self._write_lock:
+            self._entries = {}
+
+    def _lock(self, key):
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._write_lock:
+                lock = self._locks.setdefault(key, threading.RLock())
+        return lock
+
+    def get_or_load(self, key, load, valid=None):
+        """
+        Return the entry of a key, loading it if it is missing or no longer valid.
+
+        Parameters:
+        -----------
+        key : hashable
+            The key of the entry
+        load : callable
+            Called without arguments to load the entry, by one thread at a time
+        valid : callable, optional
+            Called with a stored entry, returns False if it must be loaded again
+
+        Returns:
+        --------
+        object
+            The stored or newly loaded entry
+        """
+        entry = self._entries.get(key)
+        if entry is not None and (valid is None or valid(entry)):
+            count(f'{self.name}.cache_hits')
+            return entry
+
+        lock = self._lock(key)
+        if not lock.acquire(blocking=False):
+            count(f'{self.name}.load_waits')
+            lock.acquire()
+        try:
+            # Another thread may have loaded it while this one waited
+            entry = self._entries.get(key)
+            if entry is not None and (valid is None or valid(entry)):
+                count(f'{self.name}.cache_hits')
+                return entry
+            count(f'{self.name}.cache_misses')
+            entry = load()
+            self.put(key, entry)
+            return entry
+        finally:
+            lock.release()
@@ -0,0 +1,241 @@
+import atexit
+import collections
+import datetime
+import getpass
+import os
+import platform
+import reprlib
+import secrets
+import socket
+import string
+import threading
+import time
+
+# Local usage log in the format documented in docs/usage_tracking.md and
+# written by Stata's _rs_usage.ado (usage_stata.csv)
+USAGE_FILE = 'usage_python.csv'
+CONFIG_FILE = 'config_python.yaml'
+HEADER = 'timestamp;user_id;platform;version;command_string;os;platform_version'
+
+# Seconds between background writes, and queue length that triggers an early write
+FLUSH_INTERVAL = 2.0
+BATCH_SIZE = 256
+# Events beyond this are dropped rather than letting the queue grow without bound
+MAX_QUEUED = 10_000
+# Longer command strings (e.g. long variable lists) are cut
+MAX_COMMAND_LENGTH = 500
+
+# Arguments are shown up to a bounded number of items, so a list of thousands
+# of variables costs the caller no more than a short one
+_argument_repr = reprlib.Repr()
+_argument_repr.maxlist = _argument_repr.maxtuple = _argument_repr.maxset = _argument_repr.maxdict = 100
+_argument_repr.maxstring = _argument_repr.maxother = MAX_COMMAND_LENGTH
+
+# Callers only append (time, command) to this deque, which is thread-safe and
+# never blocks. Everything that touches the disk happens in the writer thread.
+_queue = collections.deque(maxlen=MAX_QUEUED)
+_wakeup = threading.Event()
+_write_lock = threading.Lock()
+_start_lock = threading.Lock()
+_writer = None
+_enabled = None    # None until the config has been read by the writer
+_user_id = None
+
+
+def registream_dir():
+    """Return the RegiStream base directory (the parent of autolabel_keys)."""
+    from .label_fetcher import LabelFetcher
+    return os.path.dirname(LabelFetcher.get_default_dir())
+
+
+def _read_config(directory, key):
+    """Return the value of `key` in config_python.yaml, or None."""
+    try:
+        with open(os.path.join(directory, CONFIG_FILE), encoding='utf-8') as f:
+            for line in f:
+                name, sep, value = line.partition(':')
+                if sep and name.strip() == key:
+                    return value.strip().strip('"\'')
+    except OSError:
+        pass
+    return None
+
+
+def _logging_enabled(directory):
+    """Local usage logging is on unless disabled by environment or config."""
+    value = os.environ.get('REGISTREAM_USAGE_LOGGING')
+    if value is None:
+        value = _read_config(directory, 'usage_logging')
+    return value is None or value.lower() in ('true', '1', 'yes')
+
+
+def _hex8(value):
+    return format(int(value) % 4294967296, '08x')
+
+
+def _compute_user_id(directory):
+    """
+    Anonymous user id: a hash of username, hostname and the per-installation salt.
+
+    Port of _rs_compute_secure_hash in stata/src/_rs_usage.ado, so Python and
+    Stata report the same id for the same user on the same machine.
+    """
+    salt_file = os.path.join(directory, '.salt')
+    if not os.path.exists(salt_file):
+        alphabet = string.ascii_letters + string.digits
+        os.makedirs(directory, exist_ok=True)
+        with open(salt_file, 'w') as f:
+            f.write(''.join(secrets.choice(alphabet) for _ in range(64)) + '\n')
+    with open(salt_file) as f:
+        salt = f.readline().rstrip('\r\n')
+
+    data = (getpass.getuser() + socket.gethostname() + salt).encode('utf-8')
+    k = [1116352408, 1899447441, 3049323471, 3921009573, 961987163, 1508970993,
+         2453635748, 2870763221, 3624381080, 310598401, 607225278, 1426881987,
+         1925078388, 2162078206, 2614888103, 3248222580]
+    for i, byte in enumerate(data, start=1):
+        k = [(kj + byte * 31 + i * 17) % 4294967296 for kj in k]
+
+    h0, h1, h2, h3, h4, h5, h6, h7 = (1779033703, 3144134277, 1013904242, 2773480762,
+                                      1359893119, 2600822924, 528734635, 1541459225)
+    a, b, c, d, e, f, g, h = h0, h1, h2, h3, h4, h5, h6, h7
+    for kj in k:
+        temp1 = (h + kj) % 4294967296
+        h, g, f, e, d, c, b = g, f, e, (d + temp1) % 4294967296, c, b, a
+        a = (temp1 + (b + c) % 4294967296) % 4294967296
+    return _hex8(h0 + a) + _hex8(h1 + b)
+
+
+def _os_name():
+    system = platform.system()
+    if system == 'Darwin':
+        return 'MacOSX'
+    if system == 'Windows':
+        return 'Windows'
+    return 'Unix'
+
+
+def argument_repr(value):
+    """Return the repr of a command argument, cut to MAX_COMMAND_LENGTH characters."""
+    return _argument_repr.repr(value)[:MAX_COMMAND_LENGTH]
+
+
+def _format_row(when, command, user_id, version):
+    # The log is ';'-delimited and line-based
+    command = ' '.join(str(command).replace(';', ',').split())[:MAX_COMMAND_LENGTH]
+    timestamp = datetime.datetime.fromtimestamp(when, datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return f"{timestamp};{user_id};python;{version};{command};{_os_name()};{platform.python_version()}\n"
+
+
+def flush():
+    """Write all queued usage events to the log file now."""
+    global _enabled, _user_id
+    with _write_lock:
+        if not _queue:
+            return
+        events = []
+        while _queue:
+            try:
+                events.append(_queue.popleft())
+            except IndexError:
+                break
+        try:
+            directory = registream_dir()
+            if _enabled is None:
+                _enabled = _logging_enabled(directory)
+            if not _enabled:
+                return
+            if _user_id is None:
+                _user_id = _compute_user_id(directory)
+            from . import __version__
+            path = os.path.join(directory, USAGE_FILE)
+            rows = ''.join(_format_row(when, command, _user_id, __version__) for when, command in events)
+            new_file = not os.path.exists(path)
+            # One append per batch; no fsync, like Stata's file write
+            with open(path, 'a', encoding='utf-8') as f:
+                if new_file:
+                    f.write(HEADER + '\n')
+                f.write(rows)
+        except Exception:
+            # Usage logging is silent and must never break the caller
+            pass
+
+
+def _writer_loop():
+    while True:
+        _wakeup.wait(FLUSH_INTERVAL)
+        _wakeup.clear()
+        flush()
+
+
+def _start_writer():
+    global _writer
+    with _start_lock:
+        # Another thread may have started it first
+        if _writer is not None and _writer.is_alive():
+            return
+        _writer = threading.Thread(target=_writer_loop, name='registream-usage', daemon=True)
+        _writer.start()
+
+
+def log_usage(command):
+    """
+    Queue a usage event for the local log. Never blocks and never raises.
+
+    Parameters:
+    -----------
+    command : str
+        The command as the user called it, e.g. "autolabel(label_type='values')"
+    """
+    if _enabled is False:
+        return
+    _queue.append((time.time(), command))
+    if _writer is None or not _writer.is_alive():
+        _start_writer()
+    if len(_queue) >= BATCH_SIZE:
+        _wakeup.set()
+
+
+def set_usage_logging(enabled):
+    """
+    Turn local usage logging on or off and save the choice in config_python.yaml.
+
+    The log stays on this machine (``~/.registream/usage_python.csv``). It can
+    also be turned off for one process with REGISTREAM_USAGE_LOGGING=false.
+
+    Parameters:
+    -----------
+    enabled : bool
+        Whether to log usage locally
+    """
+    global _enabled
+    directory = registream_dir()
+    path = os.path.join(directory, CONFIG_FILE)
+    lines = []
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            lines = [line for line in f if line.partition(':')[0].strip() != 'usage_logging']
+    lines.append(f"usage_logging: {'true' if enabled else 'false'}\n")
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+    with _write_lock:
+        _enabled = bool(enabled)
+        if not enabled:
+            _queue.clear()
+
+
+def _after_fork():
+    # The writer thread does not exist in a forked child; start a new one on demand
+    global _writer, _write_lock, _start_lock
+    _writer = None
+    _write_lock = threading.Lock()
+    _start_lock = threading.Lock()
+    _queue.clear()
+
+
+atexit.register(flush)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)